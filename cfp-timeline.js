@@ -29,6 +29,9 @@ const suggestions = document.querySelector('#suggestions');
 const form = document.querySelector('form');
 const filters = {};
 let data = [];
+// Sort orders and search index from the fetched data, if any, and the index in the fetched data of each row of data
+let cfpIndex = null;
+let rowIds = [];
 // H5 metrics mapping within Rank arrays
 let h5IndexPos = -1;
 let h5MedianPos = -1;
@@ -412,17 +415,43 @@ function delayedUpdateSearch(value)
 
 	hideSuggestions();
 
+	// Narrow down the rows with the index: for ascii terms, rows that match have a token containing the term
+	const candidates = cfpIndex && terms.length && terms.every(term => /^[\x00-\x7f]*$/.test(term))
+		? terms.map(term => indexLookup(term.toLowerCase())) : [];
+
 	// -> all(words) -> any(columns)
 	if (search.length)
 		data.forEach((row, idx) =>
 		{
-			if (search.every(r => r.test(row[confIdx]) || r.test(row[titleIdx])))
+			if (candidates.every(rows => rows.has(rowIds[idx]))
+				&& search.every(r => r.test(row[confIdx]) || r.test(row[titleIdx])))
 				suggestions.children[idx].style.display = 'block';
 		});
 
 	updateSearchTimeoutId = 0;
 }
 
+// Return the ids of the rows with a token (case-folded part of the acronym or title) that contains term
+function indexLookup(term)
+{
+	const tokens = cfpIndex['tokens'];
+
+	// Only tokens that contain all the trigrams of the term can contain the term
+	let candidates = null;
+	for (let pos = 0; pos + 3 <= term.length; pos++)
+	{
+		const ids = new Set(cfpIndex['trigrams'][term.substr(pos, 3)] || []);
+		candidates = candidates === null ? [...ids] : candidates.filter(id => ids.has(id));
+	}
+
+	const rows = new Set();
+	for (const id of candidates === null ? tokens.keys() : candidates)
+		if (tokens[id].includes(term))
+			cfpIndex['rows'][id].forEach(row => rows.add(row));
+
+	return rows;
+}
+
 function updateSearch()
 {
 	if (updateSearchTimeoutId)
@@ -614,6 +643,22 @@ function notNull(val, idx)
 
 function sortConferences(sortIdx = [subIdx, abstIdx, startIdx, endIdx], after = today)
 {
+	const isoToday = [
+		today.getFullYear(),
+		today.getMonth() + 1,
+		today.getDate(),
+	].map(num => String(num).padStart(2, '0')).join('-');
+
+	// Use the precomputed order when it is the one computed below: for the default sort, of the rows in their original
+	// order (as rows with the same sort info are ordered by their index), and with the index computed today.
+	// Otherwise, e.g. when the page is opened on another day than the data was generated, sort here.
+	if (cfpIndex && after === today && cfpIndex['as_of'] === isoToday
+		&& sortIdx.join() === [subIdx, abstIdx, startIdx, endIdx].join() && rowIds.every((id, idx) => id === idx))
+	{
+		applySort(cfpIndex['order']['submission']);
+		return;
+	}
+
 	// sort the data per upcoming deadline date
 	if (after) {
 		const refdate = [
@@ -636,8 +681,15 @@ function sortConferences(sortIdx = [subIdx, abstIdx, startIdx, endIdx], after =
 	// Now sort and keep original indexes
 	).map((info, idx) => [info, idx]).sort().map(([date, idx]) => idx);
 
+	applySort(sortdates);
+}
+
+// Reorder data and timeline rows, with sortdates the current index of each row in the new order
+function applySort(sortdates)
+{
 	// Apply sort to data array
 	data = sortdates.map(idx => data[idx]);
+	rowIds = sortdates.map(idx => rowIds[idx]);
 
 	// Apply sort to timeline rows
 	const rowList = [...timeline.children];
@@ -648,6 +700,8 @@ function populatePage(json)
 {
 	// First update global variables from fetched data
 	data = json['data'];
+	rowIds = data.map((row, idx) => idx);
+	cfpIndex = json['index'] || null;
 
 	confIdx    = json['columns'].indexOf('Acronym')
 	titleIdx   = json['columns'].indexOf('Title')
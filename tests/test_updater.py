@@ -0,0 +1,995 @@
+import calendar
+import collections
+import datetime
+import functools
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import os
+import pathlib
+import random
+import subprocess
+import sys
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+import updater
+
+
+@pytest.fixture(scope='module', autouse=True)
+def repo():
+	""" Run from the repository root, where the rankings are, and without the spell checking dictionary """
+	lazy_dict = vars(updater.ConfMetaData)['_dict']
+	updater.ConfMetaData._dict = None
+	with pytest.MonkeyPatch.context() as monkeypatch:
+		monkeypatch.chdir(pathlib.Path(updater.__file__).parent)
+		yield
+	updater.ConfMetaData._dict = lazy_dict
+
+
+@pytest.fixture(scope='module')
+def rankings():
+	""" A few conferences from the shipped core.csv and ggs.csv """
+	core = updater.CoreRanking.get_confs().to_list()
+	ggs = updater.GGSRanking.get_confs().to_list()
+	rng = random.Random(0)
+	return rng.sample(core, 80), rng.sample(ggs, 80)
+
+
+def test_lazy_imports():
+	# Neither importing the module nor the help of the command loads the heavy dependencies
+	script = ('import sys, updater\n'
+			  'updater.update.main(["--help"], standalone_mode=False)\n'
+			  'print(*(name for name in ("bs4", "enchant", "inflection", "numpy", "pandas", "requests")'
+			  ' if name in sys.modules))')
+	result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+							cwd=pathlib.Path(updater.__file__).parent)
+	assert 'Usage:' in result.stdout and result.stdout.splitlines()[-1] == ''
+
+
+def test_lazy_classattr(monkeypatch):
+	monkeypatch.setattr(updater.LazyModule, 'load_times', {})
+	calls = []
+
+	class Tables:
+		@updater.lazy_classattr
+		def table(cls) -> dict:
+			calls.append(cls)
+			return {'a': 1}
+
+	class Derived(Tables):
+		pass
+
+	# Computed once, on the defining class, and stored there
+	assert Derived.table == {'a': 1} and Tables.table is Derived.table
+	assert calls == [Tables] and vars(Tables)['table'] == {'a': 1}
+	assert list(updater.LazyModule.load_times) == ['Tables.table']
+
+	module = updater.LazyModule('textwrap')
+	assert 'not loaded' in repr(module)
+	assert module.dedent(' x') == 'x' and 'textwrap' in updater.LazyModule.load_times
+
+	out = io.StringIO()
+	updater.print_import_profile(out)
+	assert [line.split('|')[1].strip() for line in out.getvalue().splitlines()] == [
+		'lazily imported module or table', 'Tables.table', 'textwrap'
+	]
+
+
+def random_metadata(rng: random.Random, vocabulary: list[str]) -> updater.ConfMetaData:
+	meta = updater.ConfMetaData('', 'x')
+	meta.acronym_words = [rng.choice(vocabulary) for _ in range(rng.randint(1, 3))]
+	meta.topic_keywords = [rng.choice(vocabulary) for _ in range(rng.randint(0, 6))]
+	meta.qualifiers = [rng.choice(vocabulary) for _ in range(rng.randint(0, 3))]
+	meta.type_ = set(rng.sample(vocabulary, rng.randint(0, 2)))
+	meta.organisers = set(rng.sample(vocabulary, rng.randint(0, 2)))
+	meta.number = set(rng.sample(vocabulary, rng.randint(0, 2)))
+	meta._interned = None
+	return meta
+
+
+def check_batch_difference(left: list, right: list, ia: np.ndarray, ib: np.ndarray):
+	diff = updater.ConfMetaData.batch_difference(updater.InternedWordsBatch(left), updater.InternedWordsBatch(right),
+												 ia, ib)
+	score = updater.ConfMetaData.batch_score(diff)
+	for k, (i, j) in enumerate(zip(ia.tolist(), ib.tolist())):
+		ref = left[i]._difference(right[j])
+		assert tuple(diff[k]) == ref
+		assert score[k] == sum(ref)
+
+
+def test_batch_difference_random():
+	rng = random.Random(3)
+	vocabulary = ['a', 'b', 'c', 'd', 'e', 'f', 'acm', 'ieee', 'x']
+	left = [random_metadata(rng, vocabulary) for _ in range(60)]
+	right = [random_metadata(rng, vocabulary) for _ in range(40)]
+	ia, ib = np.random.default_rng(3).integers(0, [[len(left)], [len(right)]], size=(2, 3000))
+	check_batch_difference(left, right, ia, ib)
+
+
+def test_batch_difference_rankings(rankings):
+	core, ggs = rankings
+	ia, ib = (grid.ravel() for grid in np.meshgrid(np.arange(len(core)), np.arange(len(ggs)), indexing='ij'))
+	check_batch_difference(core, ggs, ia, ib)
+
+
+def test_blocking_index_lookup(rankings):
+	core, ggs = rankings
+	index = updater.BlockingIndex(core)
+	assert len(index) == len(core)
+
+	for conf in ggs:
+		keys = updater.BlockingIndex.keys(conf)
+		expected = [row for row, other in enumerate(core) if keys & updater.BlockingIndex.keys(other)]
+		assert index.lookup(conf).tolist() == expected
+
+	# A looked up conference can then be added, and is found by the next lookups
+	new_row = index.add(ggs[0])
+	assert new_row == len(core) and len(index) == len(core) + 1
+	assert new_row in index.lookup(ggs[0]).tolist()
+	assert index.find(['NOT AN ACRONYM']).tolist() == []
+
+
+def brute_force_chains(deadline: pd.DataFrame, conf_start: pd.Timestamp) -> list[list[int]] | None:
+	""" Longest subsets of rounds where each notification is before the next submission, as in the original search """
+	for n in range(len(deadline), 1, -1):
+		chains = [subset for subset in map(list, itertools.combinations(deadline.index, n)) if all(
+			deadline.loc[subset, 'notif'] <= deadline.loc[subset, 'submission'].shift(-1, fill_value=conf_start)
+		)]
+		if chains:
+			return chains
+	return None
+
+
+def test_max_compatible_chains():
+	rng = random.Random(0)
+	for _ in range(300):
+		m = rng.randint(1, 7)
+		submission = sorted(pd.Timestamp('2025-01-01') + pd.Timedelta(days=rng.randint(0, 200)) for _ in range(m))
+		notif = [date + pd.Timedelta(days=rng.randint(-5, 80)) for date in submission]
+		deadline = pd.DataFrame({'submission': submission, 'notif': notif}, index=rng.sample(range(100, 200), m))
+		conf_start = pd.Timestamp('2025-09-01') - pd.Timedelta(days=rng.randint(0, 150))
+		if rng.random() < .05:
+			conf_start = pd.NaT
+
+		chains = [deadline.index[chain].to_list() for chain in updater.CallForPapers._max_compatible_chains(
+			deadline['submission'].to_numpy(), deadline['notif'].to_numpy(), pd.Timestamp(conf_start).to_datetime64()
+		)]
+		assert brute_force_chains(deadline, conf_start) == (chains if chains and len(chains[0]) >= 2 else None)
+
+
+def reference_pick_chain(cfps: updater.CandidateTable, chains: list[list[int]]) -> list[int] | None:
+	""" The first chain with keywords confirming multiple deadlines, checking every chain as the original search """
+	submission = cfps.dates()[:, updater.DateStore.column['submission']]
+	for subset in chains:
+		topic = {row: cfps.cfp[row].topic_keywords for row in subset}
+		topic_words = {row: ['fall' if word == 'autumn' else word for word in words] or [None]
+					   for row, words in topic.items()}
+		word_count = collections.Counter(itertools.chain.from_iterable(topic_words.values()))
+		topic_diff = {row: [word for word in words if word_count[word] == 1] for row, words in topic_words.items()}
+		topic_diff = {row: words for row, words in topic_diff.items() if words}
+
+		if all(topic_diff.get(row, ()) and not {'fall', 'winter', 'spring', 'summer'}.isdisjoint(topic_diff[row])
+			   for row in subset):
+			return subset
+
+		if all(f'r{subset.index(row) + 1}' in words for row, words in topic_diff.items()):
+			return subset
+
+		ordinals = [*updater.CallForPapers._ordinal_list, *itertools.repeat(None, len(subset))]
+		match_num = [bool(cfps.cfp[row].number & {ordinals[n], str(n + 1), updater.inflection.ordinalize(n + 1)})
+					 for n, row in enumerate(subset)]
+		match_kw = [not {'round', 'deadline', 'submission'}.isdisjoint(topic[row]) for row in subset]
+		is_first_call = [submission[row] == submission[subset].min() for row in subset]
+
+		if match_num == match_kw and all(num or first for num, first in zip(match_num, is_first_call)):
+			return subset
+	return None
+
+
+def synthetic_calls(titles: list[str], submissions: list[datetime.date], notifications: list[datetime.date | None],
+					conf_start: datetime.date) -> updater.CandidateTable:
+	calls = []
+	for n, (title, submission, notification) in enumerate(zip(titles, submissions, notifications)):
+		cfp = updater.CallForPapers('X', conf_start.year, n, f'X {conf_start.year} {title}')
+		cfp.dates.update({'submission': submission, 'conf_start': conf_start,
+						  'conf_end': conf_start + datetime.timedelta(days=3)})
+		if notification is not None:
+			cfp.dates['notification'] = notification
+		calls.append(cfp)
+	return updater.CandidateTable(calls, [0.] * len(calls), [0] * len(calls))
+
+
+def test_detect_multiple_deadlines(cfp_cache):
+	rng = random.Random(0)
+	words = ['spring', 'summer', 'autumn', 'winter', 'r1', 'r2', 'r3', 'round', 'deadline', 'submission', 'first',
+			 'second', '1st', '2nd', '2', '3', 'systems', 'networks']
+	conf_start = datetime.date(2025, 9, 1)
+	for _ in range(200):
+		m = rng.randint(2, 7)
+		titles = [' '.join(rng.sample(words, rng.randint(0, 3))) for _ in range(m)]
+		submissions = [datetime.date(2025, 1, 1) + datetime.timedelta(days=day) for day in sorted(rng.sample(range(150), m))]
+		notifications = [date + datetime.timedelta(days=rng.randint(5, 60)) if rng.random() < .8 else None
+						 for date in submissions]
+		cfps = synthetic_calls(titles, submissions, notifications, conf_start)
+
+		# Submissions are distinct and early enough, so all calls are candidate rounds, already sorted
+		deadline = pd.DataFrame({'submission': submissions, 'notif': [
+			pd.Timestamp(notif if notif is not None else date + datetime.timedelta(days=42))
+			for date, notif in zip(submissions, notifications)
+		]})
+		chains = brute_force_chains(deadline, pd.Timestamp(conf_start)) or []
+		assert updater.CallForPapers.detect_multiple_deadlines(cfps) == reference_pick_chain(cfps, chains)
+
+
+@pytest.mark.parametrize('ordinals', [False, True])
+def test_detect_multiple_deadlines_duplicated_rounds(cfp_cache, ordinals):
+	rounds, first_submission = 20, datetime.date(2026, 1, 5)
+	titles, submissions, notifications = [], [], []
+	for n, extension in itertools.product(range(rounds), (0, 3)):
+		# Each posting has its own word, that confirms nothing, and only the extended postings are numbered
+		titles.append(f'posted in {"abcdefghijklmnopqrst"[n]}{"xz"[extension > 0]}ville'
+					  + (f' {updater.inflection.ordinalize(n + 1)} round' if ordinals and extension else ''))
+		submissions.append(first_submission + datetime.timedelta(days=20 * n + extension))
+		notifications.append(submissions[-1] + datetime.timedelta(days=18 - extension))
+
+	# There are 2²⁰ longest chains, the numbered one starts with the first posting, which needs no number, and is the
+	# last of those starting with it
+	conf_start = first_submission + datetime.timedelta(days=20 * rounds + 70)
+	cfps = synthetic_calls(titles, submissions, notifications, conf_start)
+	expected = [0, *range(3, 2 * rounds, 2)] if ordinals else None
+	assert updater.CallForPapers.detect_multiple_deadlines(cfps) == expected
+
+
+def build_cfps(spec: dict[tuple[str, int, int], tuple[dict[str, datetime.date], str | None, str | None]]) -> pd.Series:
+	cfps = {}
+	for n, ((acronym, year, round_), (dates, link, url_cfp)) in enumerate(spec.items()):
+		cfp = updater.CallForPapers(acronym, year, n, f'{acronym} conference', url_cfp, link)
+		for field, date in dates.items():
+			cfp.dates[field] = date
+			cfp.orig[field] = True
+		cfps[acronym, year, round_] = cfp
+	return pd.Series(cfps).rename_axis(['conf_id', 'year', 'round']).sort_index()
+
+
+def reference_extrapolate_missing(cfp: updater.CallForPapers, prev_cfp: updater.CallForPapers | None) -> updater.CallForPapers:
+	""" Extrapolate the missing dates of a cfp from the previous one, as the original per-cfp extrapolation """
+	if pd.isna(prev_cfp) or prev_cfp is None:
+		return cfp
+
+	year_shift = cfp.year - prev_cfp.year
+	assert year_shift > 0
+	if cfp.link == '(missing)':
+		cfp.link = prev_cfp.link
+	if cfp.url_cfp is None:
+		cfp.url_cfp = prev_cfp.url_cfp
+
+	for field in ('conf_start', 'submission'):
+		if field not in cfp.dates and field in prev_cfp.dates:
+			cfp.dates[field] = replace_year(prev_cfp.dates[field], prev_cfp.dates[field].year + year_shift)
+			cfp.orig[field] = False
+
+	for orig, fields in {'conf_start': {'conf_end', 'camera_ready'}, 'submission': {'abstract', 'notification'}}.items():
+		if orig in cfp.dates and orig in prev_cfp.dates:
+			for field in (fields - cfp.dates.keys()) & prev_cfp.dates.keys():
+				cfp.dates[field] = cfp.dates[orig] + (prev_cfp.dates[field] - prev_cfp.dates[orig])
+				cfp.orig[field] = False
+	return cfp
+
+
+def test_extrapolate_missing_batch(rankings):
+	rng = random.Random(0)
+	spec = {}
+	for conf in rankings[0][:30]:
+		for year in sorted(rng.sample(range(2019, 2027), rng.randint(1, 6))):
+			for round_ in range(rng.choice([1, 1, 2, 3])):
+				dates = {field: datetime.date(2024, 2, 29) if rng.random() < .1 else
+						 datetime.date(year - rng.choice([0, 0, 1]), rng.randint(1, 12), rng.randint(1, 28))
+						 for field in updater.Dates.fields if rng.random() < .5}
+				spec[conf.acronym, year, round_] = (dates, rng.choice([None, 'http://l']), rng.choice([None, 'http://u']))
+
+	expected = build_cfps(spec)
+	for n in (1, 2):
+		prev = expected.groupby(level=['conf_id', 'round']).shift(periods=n)
+		expected = expected.combine(prev, reference_extrapolate_missing)
+
+	cfps = build_cfps(spec)
+	rows = pd.Series(np.arange(len(cfps)), index=cfps.index)
+	for n in (1, 2):
+		prev_rows = rows.groupby(level=['conf_id', 'round']).shift(periods=n, fill_value=-1).to_numpy()
+		updater.CallForPapers.extrapolate_missing_batch(cfps.to_list(), prev_rows)
+
+	assert cfps.map(updater.CallForPapers.values).to_list() == expected.map(updater.CallForPapers.values).to_list()
+
+
+def replace_year(date: datetime.date, year: int) -> datetime.date:
+	""" Change the year as date.replace does, except 29 February becomes the 28th instead of raising ValueError """
+	return date.replace(year=year, day=28) if (date.month, date.day) == (2, 29) and not calendar.isleap(year) else \
+		   date.replace(year=year)
+
+
+def reference_flip_day_month(start: datetime.date, end: datetime.date) -> tuple[datetime.date, datetime.date]:
+	flip_start = start.replace(day=start.month, month=start.day)
+	flip_end = end.replace(day=end.month, month=end.day)
+	if flip_start > flip_end or flip_end >= flip_start + datetime.timedelta(days=10):
+		raise ValueError('Resulting dates not fitting for conference interval')
+	return flip_start, flip_end
+
+
+def reference_verify_conf_dates(year: int, dates: dict, orig: dict, diag: str) -> str | None:
+	""" The per-cfp conference dates check that validate_dates replaces """
+	if not {'conf_start', 'conf_end'} <= dates.keys():
+		return None
+
+	err, nfixes = [], 0
+	start, end = dates['conf_start'], dates['conf_end']
+	if start.year != year or end.year != year:
+		err.append('not in correct year')
+		start, end = replace_year(start, year), replace_year(end, year)
+		nfixes += 1
+
+	if end < start:
+		err.append('end before start')
+		try:
+			start, end = reference_flip_day_month(start, end)
+		except ValueError:
+			end, start = start, end
+		nfixes += 1
+
+	if end - start > datetime.timedelta(days=20):
+		err.append('too far apart')
+		try:
+			start, end = reference_flip_day_month(start, end)
+		except ValueError:
+			pass
+		else:
+			nfixes += 1
+
+	if not err:
+		return None
+
+	diag = f'{diag}: Conferences dates are {" and ".join(err)}'
+	if nfixes < len(err):
+		raise updater.CFPCheckError(diag)
+
+	dates.update({'conf_start': start, 'conf_end': end})
+	orig['conf_start'] = orig['conf_end'] = False
+	return f'{diag}: using {start} -- {end} instead'
+
+
+def reference_verify_submission_dates(dates: dict, orig: dict, diag: str) -> str | None:
+	""" The per-cfp submission dates check that validate_dates replaces """
+	typical_delays = updater.CallForPapers._typical_delays
+	if 'conf_start' not in dates or not typical_delays.keys() & dates.keys():
+		return None
+
+	err, uncorrected, corrected = [], set(), {}
+	start = dates['conf_start']
+	for name, deadline in ((name, date) for name, date in dates.items() if name in typical_delays):
+		delay = (start - deadline).days
+		if delay < 0:
+			err.append(f'{name} ({deadline}) after conference start')
+		elif delay > 440:
+			err.append(f'{name} ({deadline}) too long before conference')
+		else:
+			continue
+
+		shifted = replace_year(deadline, deadline.year + int(delay // 365.2425))
+		lo, hi = typical_delays[name]
+		if hi >= (start - shifted).days >= lo:
+			corrected[name] = shifted
+		else:
+			err.append(f'{err.pop()} (shifted: {(start - shifted).days}d)')
+			uncorrected.add(name)
+
+	if not err:
+		return None
+
+	diag = f'{diag}: Submission dates issues: {" and ".join(err)}'
+	if uncorrected - {'camera_ready'}:
+		raise updater.CFPCheckError(diag)
+
+	dates.update(corrected)
+	orig.update({name: False for name in corrected})
+	for name in uncorrected & {'camera_ready'}:
+		del dates[name]
+	fixes = [*(f'{name}={date}' for name, date in corrected.items()), *(f'no {name}' for name in uncorrected)]
+	return f'{diag}: using {", ".join(fixes)} instead'
+
+
+def random_date(rng: random.Random, year: int) -> datetime.date:
+	while True:
+		try:
+			return datetime.date(year, rng.randint(1, 12), rng.choice([rng.randint(1, 12), rng.randint(1, 31)]))
+		except ValueError:
+			pass
+
+
+def test_validate_dates(rankings, capsys, monkeypatch):
+	rng = random.Random(4)
+	monkeypatch.setattr(updater.CallForPapers, '_errors', [])
+	cfps, expected = [], []
+	for n, conf in enumerate(rankings[1] * 10):
+		year = rng.choice([2024, 2025])
+		conf_start = random_date(rng, year + rng.choice([0, 0, 0, 1, -1]))
+		dates = {}
+		if rng.random() < .95:
+			dates['conf_start'] = conf_start
+		if rng.random() < .95:
+			dates['conf_end'] = rng.choice([conf_start + datetime.timedelta(days=rng.randint(-5, 4)), random_date(rng, year),
+											conf_start + datetime.timedelta(days=rng.randint(15, 40))])
+		for field in updater.Dates.fields[:4]:
+			if rng.random() < .6:
+				delay = rng.choice([rng.randint(-100, 600), rng.randint(30, 200)])
+				dates[field] = conf_start - datetime.timedelta(days=delay)
+
+		cfp = updater.CallForPapers(conf.acronym, year, n, conf.title, 'http://u')
+		for field, date in dates.items():
+			cfp.dates[field] = date
+			cfp.orig[field] = True
+		cfps.append(cfp)
+
+		# Run the original checks on plain dicts, in the order of Dates.fields as in the date store
+		dates = {field: dates[field] for field in updater.Dates.fields if field in dates}
+		orig, messages, date_errors = dict.fromkeys(dates, True), [], False
+		diag = f'{conf.acronym} {year} ({dates.get("conf_start")} -- {dates.get("conf_end")})'
+		for verify in (functools.partial(reference_verify_conf_dates, year), reference_verify_submission_dates):
+			try:
+				if warn := verify(dates, orig, diag):
+					messages.append(f'{warn.replace(":", ";", 1)};http://u;corrected')
+			except updater.CFPCheckError as err:
+				messages.append(f'{str(err).replace(":", ";", 1)}: no satisfying correction heuristic;http://u;ignored')
+				date_errors = True
+			diag = f'{conf.acronym} {year} ({dates.get("conf_start")} -- {dates.get("conf_end")})'
+		expected.append((dates, orig, date_errors, messages))
+
+	store = updater.CallForPapers._date_store
+	rows = updater.CallForPapers.date_rows(cfps)
+	store.parsed[rows] = store.dates[rows]
+	for cfp in cfps:
+		cfp.date_errors = False
+	updater.CallForPapers.check_dates(cfps)
+
+	assert sum(bool(messages) for *_, messages in expected) > 100
+	assert [(dict(cfp.dates), dict(cfp.orig), cfp.date_errors) for cfp in cfps] == [exp[:3] for exp in expected]
+	assert updater.CallForPapers._errors == [message for *_, messages in expected for message in messages]
+	assert len(capsys.readouterr().out.splitlines()) == len(updater.CallForPapers._errors)
+
+
+def test_cluster_mutual_best_matching():
+	# Rows 0, 1, 2 are a1, a2, a3 from a first source, and rows 3, 4 are b1, b2 from a second one
+	rows_a, rows_b = np.array([2, 1, 1, 0]), np.array([4, 4, 3, 3])
+	scores = np.array([.5, 1., 2., 3.])
+	cluster, linked = updater.Ranking._cluster(rows_a, rows_b, scores, np.array([0, 0, 0, 1, 1]))
+
+	# a3 and a2 are best matched with b2, which keeps a3, and a1 is the best match of b1, so a2 is left alone
+	assert cluster.tolist() == [0, 1, 2, 0, 2]
+	assert linked.tolist() == [0, 3]
+
+
+def reference_matching(rows_a: np.ndarray, rows_b: np.ndarray, scores: np.ndarray, ranks: np.ndarray) -> list[int]:
+	""" The linked pairs of the original pairwise merge, with pairs listed by rank """
+	compared_pairs = pd.DataFrame({'id_a': rows_a, 'id_b': rows_b, 'score': scores}).iloc[np.argsort(ranks)]
+	merged = []
+	while compared_pairs.size:
+		best_matches = compared_pairs[~compared_pairs['score'].transform(np.isinf)]
+		best_matches = best_matches.loc[best_matches.groupby('id_a')['score'].idxmin()]
+		best_matches = best_matches.loc[best_matches.groupby('id_b')['score'].idxmin()]
+		if not best_matches.size:
+			break
+		compared_pairs = compared_pairs[~compared_pairs['id_a'].isin(best_matches['id_a']) &
+										~compared_pairs['id_b'].isin(best_matches['id_b'])]
+		merged.extend(best_matches.index)
+	return sorted(merged)
+
+
+def test_cluster_ties():
+	rng = np.random.default_rng(0)
+	for _ in range(100):
+		pairs = np.unique(rng.integers(0, 20, size=(80, 2)) + [0, 20], axis=0)
+		rows_a, rows_b = pairs[:, 0], pairs[:, 1]
+		scores = np.where(rng.random(len(pairs)) < .1, np.inf, rng.integers(0, 4, len(pairs)).astype(float))
+		ranks = rng.permutation(len(pairs))
+
+		_, linked = updater.Ranking._cluster(rows_a, rows_b, scores, np.repeat([0, 1], 20), ranks)
+		assert linked.tolist() == reference_matching(rows_a, rows_b, scores, ranks)
+
+
+def reference_pair_order(confs_a: pd.Series, confs_b: pd.Series) -> list[tuple[int, int]]:
+	""" The pairs of the original pairwise merge, in the order it listed them, as in `Ranking._pair_ranks` """
+	sep = updater.ConfMetaData._sep
+	indexes = []
+	for confs in (confs_a, confs_b):
+		idx = pd.Series(confs.index, index=confs.map(lambda conf: conf.acronym).str.upper(), name='id')
+		multi_word = idx.index[idx.index.str.contains(sep)].to_series().str.split(sep)
+		indexes.append(pd.concat([idx, idx.loc[multi_word.index].rename(index=multi_word.str.join('').to_dict()),
+								  idx.loc[multi_word.index].rename(index=multi_word.str[0].to_dict())]))
+	idx_a, idx_b = indexes
+
+	common = idx_a.index.drop_duplicates().intersection(idx_b.index.drop_duplicates())
+	compared_pairs = pd.concat(ignore_index=True, objs=[
+		pd.merge(idx_a[[acronym]], idx_b[[acronym]], how='cross', suffixes=('_a', '_b')) for acronym in common
+	])
+	return list(dict.fromkeys(zip(compared_pairs['id_a'].tolist(), compared_pairs['id_b'].tolist())))
+
+
+def test_pair_ranks():
+	rng = random.Random(0)
+	words, seps = ['EURO', 'PAR', 'ICS', 'SYS', 'NET'], ['', '', '-', '/', ' ']
+
+	def conferences(n: int) -> pd.Series:
+		acronyms = [rng.choice(seps).join(rng.sample(words, rng.randint(1, 2))) for _ in range(n)]
+		return pd.Series([updater.Conference(acronym, f'Conf {acronym}', 'A', 'CORE', 'AI') for acronym in acronyms])
+
+	for _ in range(20):
+		confs_a, confs_b = conferences(15), conferences(15)
+		expected = reference_pair_order(confs_a, confs_b)
+		assert expected != sorted(expected)
+
+		rows_a, rows_b = np.array(sorted(expected)).T
+		ranks = updater.Ranking._pair_ranks([*confs_a, *confs_b], rows_a, rows_b + len(confs_a), np.repeat([0, 1], 15))
+		assert [(a, b) for _, a, b in sorted(zip(ranks.tolist(), rows_a.tolist(), rows_b.tolist()))] == expected
+
+
+def test_cluster_sources():
+	# A cluster never holds 2 conferences from the same source, and infinite scores are never linked
+	rows_a, rows_b = np.array([0, 1, 0, 2]), np.array([1, 2, 2, 3])
+	scores = np.array([1., 1., 2., np.inf])
+	cluster, linked = updater.Ranking._cluster(rows_a, rows_b, scores, np.array([0, 1, 2, 0]))
+
+	assert cluster.tolist() == [0, 0, 0, 3]
+	assert linked.tolist() == [0, 1]
+
+
+def test_merge_sorted(rankings):
+	core, ggs = (pd.Series(confs) for confs in rankings)
+	merged = updater.Ranking.merge(core, ggs)
+	assert [conf.values(True) for conf in merged.confs.tolist()] == sorted(conf.values(True) for conf in merged.confs)
+	assert len(merged) < len(core) + len(ggs)
+
+
+def test_merged_confs_snapshot(tmp_path, monkeypatch):
+	monkeypatch.setattr(updater.Ranking, '_snapshot_dir', str(tmp_path / 'snapshots'))
+	monkeypatch.setattr(updater.RequestWrapper, 'use_cache', True)
+	(tmp_path / 'snapshots').mkdir()
+	sources = updater.CoreRanking, updater.GGSRanking
+
+	def merged_values() -> list[tuple]:
+		confs = updater.Ranking.get_merged_confs(*sources)
+		return [confs.values(row, metrics=True) for row in range(len(confs))]
+
+	merged = merged_values()
+	snapshots = list((tmp_path / 'snapshots').glob('registry-*.pickle'))
+	assert len(snapshots) == 1
+
+	# Later runs load the snapshot without merging
+	with monkeypatch.context() as patch:
+		patch.setattr(updater.Ranking, 'merge', None)
+		assert merged_values() == merged
+
+	# Changing a source gives a new snapshot, which replaces the previous one
+	core = tmp_path / 'core.csv'
+	core.write_text(pathlib.Path(updater.CoreRanking._file).read_text() + '\n')
+	monkeypatch.setattr(updater.CoreRanking, '_file', str(core))
+	assert merged_values() == merged
+	assert [path.name for path in (tmp_path / 'snapshots').glob('registry-*.pickle')] != [snapshots[0].name]
+	assert len(list((tmp_path / 'snapshots').glob('registry-*.pickle'))) == 1
+
+
+def test_join_metrics(tmp_path, monkeypatch):
+	core = tmp_path / 'core.csv'
+	core.write_text('acronym;title;ranksys;rank;field;h5_index;h5_median\n'
+					'ABC;Conf ABC;CORE2023;A;AI;10;20\n'
+					'abc;Other ABC;CORE2023;B;AI;30;40\n'
+					'DEF;Conf DEF;CORE2023;B;AI;;\n')
+	monkeypatch.setattr(updater.CoreRanking, '_file', str(core))
+
+	# Matched by upper-cased acronym, the first row of duplicate acronyms wins, and missing metrics are None
+	registry = updater.ConferenceRegistry(updater.Conference(acronym, f'Conf {acronym}', 'A', 'CORE2023', 'AI')
+										  for acronym in ('Abc', 'DEF', 'GHI'))
+	registry.join_metrics(updater.CoreRanking.load_metrics())
+	assert registry.h5_index.tolist() == [10, None, None] and registry.h5_median.tolist() == [20, None, None]
+	assert registry.values(0, metrics=True) == ('Abc', 'Conf Abc', ('A', 10, 20), ('CORE2023', 'H5Index2024', 'H5Median2024'),
+												'AI')
+	assert registry.values(0) == ('Abc', 'Conf Abc', ('A',), ('CORE2023',), 'AI')
+
+
+@pytest.fixture
+def cfp_cache(monkeypatch):
+	""" Empty the cache of built cfps for the duration of a test """
+	for attr, value in {'_cache': {}, '_tombstones': {}, '_accepted': set(), '_ratings': {}}.items():
+		monkeypatch.setattr(updater.CallForPapers, attr, value)
+
+
+def test_column_table_take(rankings, cfp_cache):
+	registry = updater.ConferenceRegistry(rankings[0][:4])
+	assert registry.take([2, 0]).acronym.tolist() == [rankings[0][2].acronym, rankings[0][0].acronym]
+	assert registry.take(np.array([True, False, False, True])).confs.tolist() == [rankings[0][0], rankings[0][3]]
+
+	cfps = [updater.CallForPapers.build('X', 2025, n, f'X conference {n}') for n in range(3)]
+	table = updater.CandidateTable(cfps, [1., 2., 3.], [0, 1, 2])
+	taken = table.take([False, True, True])
+	assert isinstance(taken, updater.CandidateTable) and [taken.row(n) for n in range(2)] == [(cfps[1], 2., 1),
+																							   (cfps[2], 3., 2)]
+	assert len(table.take([])) == 0 and len(table) == 3
+
+
+def test_select_candidates(rankings, cfp_cache):
+	conf = rankings[0][0]
+	ids = itertools.count()
+
+	def candidates(*specs: tuple[str, float, bool]) -> updater.CandidateTable:
+		cfps = []
+		for call, rating, date_errors in specs:
+			cfp = updater.CallForPapers.build('X', 2025, next(ids), f'X 2025 {call}')
+			cfp.dates.update({'submission': datetime.date(2025, 1, 1), 'conf_start': datetime.date(2025, 6, 1)})
+			cfp.date_errors = date_errors
+			cfps.append(cfp)
+		return updater.CandidateTable(cfps, [rating for _, rating, _ in specs], range(len(specs)))
+
+	# Candidates are filtered by rating, call type, closeness to the best rating and date errors, in that order
+	cfps = candidates(('call for papers', 3., False), ('call for posters', 1., False), ('', np.inf, False),
+					  ('call for workshop papers', 2., False), ('', 9., False), ('', 4., True), ('', 8., False))
+	selected = updater.CallForPapers._select_candidates(conf, 2025, cfps)
+	assert [(cfp.id, rating, missing) for cfp, rating, missing in selected] == [(0, 3., 0)]
+
+	for specs, error in [([('call for papers', np.inf, False)], 'acceptable rating'),
+						 ([('call for posters', 1., False)], 'full paper call'),
+						 ([('call for papers', 1., True)], 'valid dates')]:
+		with pytest.raises(updater.CFPNotFoundError, match=error):
+			updater.CallForPapers._select_candidates(conf, 2025, candidates(*specs))
+
+
+def test_discard_detaches_dates(cfp_cache):
+	cfp = updater.CallForPapers.build('X', 2025, 1, 'X conference 2025')
+	cfp.dates['submission'] = datetime.date(2025, 1, 1)
+	updater.CallForPapers.discard(cfp, 1.)
+
+	with pytest.raises(ReferenceError):
+		cfp.dates['submission']
+	with pytest.raises(ReferenceError):
+		cfp.values()
+
+	# The released row is reused, without dates, and not shared with the discarded cfp
+	other = updater.CallForPapers.build('Y', 2025, 2, 'Y conference 2025')
+	assert dict(other.dates) == {}
+	with pytest.raises(ReferenceError):
+		cfp.orig['submission'] = True
+
+	rebuilt = updater.CallForPapers.build('X', 2024, 1, 'X conference 2025')
+	assert rebuilt.year == 2025 and dict(rebuilt.dates) == {}
+
+
+def test_discard_max_tombstones(cfp_cache, monkeypatch):
+	monkeypatch.setattr(updater.CallForPapers, '_max_tombstones', 2)
+	cfps = [updater.CallForPapers.build('X', 2025, n, 'X conference 2025') for n in range(4)]
+	cfps[0].date_errors = True
+	for cfp in cfps:
+		updater.CallForPapers.discard(cfp, 1.)
+
+	# Fetched cfps with date errors are kept in full, and only the latest tombstones
+	assert sorted(updater.CallForPapers._cache) == [0, 2, 3]
+	assert updater.CallForPapers._cache[0] is cfps[0] and dict(cfps[0].dates) == {}
+	assert all(isinstance(updater.CallForPapers._cache[n], updater.CfpTombstone) for n in (2, 3))
+
+
+def test_validate_dates_rejected(cfp_cache, monkeypatch):
+	monkeypatch.setattr(updater.CallForPapers, '_errors', [])
+	cfp = updater.CallForPapers.build('X', 2025, 1, 'X conference 2025', 'http://u')
+	dates = {'submission': datetime.date(2025, 6, 5), 'conf_start': datetime.date(2025, 6, 1),
+			 'conf_end': datetime.date(2025, 6, 3)}
+	for field, date in dates.items():
+		cfp.dates[field] = date
+		cfp.orig[field] = True
+	store = updater.CallForPapers._date_store
+	store.parsed[cfp.dates.row] = store.dates[cfp.dates.row]
+	cfp.date_errors = False
+
+	updater.CallForPapers.check_dates([cfp])
+	assert cfp.date_errors
+	updater.CallForPapers.discard(cfp, 1.)
+
+	# The rejected cfp keeps its parsed dates, so the checks can be rerun with other delays
+	fetched = [cfp for cfp in updater.CallForPapers.all_built_cfps().values() if cfp.date_errors is not None]
+	assert fetched == [cfp]
+	delays = {**updater.CallForPapers._typical_delays, 'submission': (40, 400)}
+	report = updater.CallForPapers.validate_dates(fetched, typical_delays=delays)
+	assert report['status'].tolist() == ['corrected']
+	assert report['fixes'].tolist() == [{'submission': datetime.date(2024, 6, 5)}]
+
+
+def test_memoized_ratings_max(rankings, cfp_cache, monkeypatch):
+	monkeypatch.setattr(updater.CallForPapers, '_max_ratings', 3)
+	conf = rankings[0][0]
+	cfps = [updater.CallForPapers.build(conf.acronym, 2025, n, f'{conf.title} 2025') for n in range(5)]
+
+	ratings = updater.CallForPapers.memoized_ratings(conf, cfps)
+	assert ratings == list(map(tuple, updater.CallForPapers.batch_rating(conf, cfps).tolist()))
+	assert list(updater.CallForPapers._ratings) == [((conf.acronym, conf.title), n) for n in range(2, 5)]
+	assert updater.CallForPapers.memoized_ratings(conf, cfps) == ratings
+
+
+def test_oldest_fetch(monkeypatch):
+	monkeypatch.setattr(updater.RequestWrapper, 'fetch_times', {
+		'http://www.wikicfp.com/cfp/servlet/event.showcfp?eventid=1': 200.,
+		'http://www.wikicfp.com/cfp/servlet/event.showcfp?eventid=2': 300.,
+		'http://www.wikicfp.com/cfp/servlet/tool.search?q=X&year=a': 100.,
+	})
+
+	# Only the given pages count, not the search pages fetched before them
+	entries = [f'http://www.wikicfp.com/cfp/servlet/event.showcfp?eventid={n}' for n in range(3)]
+	assert updater.RequestWrapper.oldest_fetch(entries) == datetime.datetime.fromtimestamp(200.)
+	assert updater.RequestWrapper.oldest_fetch(entries[:1]) >= datetime.datetime.fromtimestamp(300.)
+
+
+def cfp_values(link: str | None = 'http://l', orig: Mapping[str, bool | None] = {}, **dates) -> list:
+	""" The values of a cfp in an output row, with the dates given by field, original unless set otherwise in orig """
+	orig = {**dict.fromkeys(dates, True), **orig}
+	return [*map(dates.get, updater.DateStore.fields), *map(orig.get, updater.DateStore.fields), link, None]
+
+
+def conf_row(acronym: str, field: str, *cfps: list, rank: str | None = None) -> list:
+	""" An output row of a conference ranked in CORE, followed by the values of its cfps """
+	return [acronym, f'Conf {acronym}', [rank or acronym], ['CORE'], field, *cfps]
+
+
+NO_CFP = cfp_values(link=None)
+SAMPLE_CFP = cfp_values(abstract='20250101', conf_start='20250601', conf_end='20250603')
+
+
+def test_split_cfps_shards(tmp_path):
+	rows = [conf_row('A', 'Computer Vision', SAMPLE_CFP, NO_CFP),
+			conf_row('B', 'Computer-Vision', NO_CFP, SAMPLE_CFP),
+			conf_row('C', 'Computer Vision', NO_CFP, NO_CFP)]
+	encoded = [(row, updater.CfpsJsonWriter.encode(row)) for row in rows]
+
+	passed = list(updater.split_cfps_shards(iter(encoded), str(tmp_path), [2025, 2026], datetime.date(2025, 1, 1)))
+	assert passed == encoded
+
+	# Fields with the same slug get distinct files
+	manifest = json.loads((tmp_path / 'manifest.json').read_text())
+	assert [(shard['file'], shard.get('field', shard.get('year')), shard['rows']) for shard in manifest['shards']] == [
+		('year-2025.json', 2025, 1), ('year-2026.json', 2026, 1),
+		('field-computer-vision.json', 'Computer Vision', 2), ('field-computer-vision-2.json', 'Computer-Vision', 1),
+	]
+	assert json.loads((tmp_path / 'field-computer-vision-2.json').read_text())['data'] == [json.loads(encoded[1][1])]
+	assert json.loads((tmp_path / 'year-2026.json').read_text())['data'] == [[*rows[1][:5], SAMPLE_CFP]]
+
+
+def test_atomic_open(tmp_path):
+	path = tmp_path / 'cfp.json'
+	path.write_text('old')
+
+	# A failed write leaves the file as it was, and no temporary file
+	with pytest.raises(RuntimeError):
+		with updater.atomic_open(str(path)) as out:
+			out.write('half')
+			raise RuntimeError
+	assert path.read_text() == 'old' and [file.name for file in tmp_path.iterdir()] == ['cfp.json']
+
+	with updater.atomic_open(str(path)) as out:
+		out.write('new')
+		assert path.read_text() == 'old'
+	assert path.read_text() == 'new' and [file.name for file in tmp_path.iterdir()] == ['cfp.json']
+
+
+def test_publish_artifact(tmp_path):
+	path = tmp_path / 'cfp.json'
+	path.write_text('{"data": []}\n' * 100)
+	digest = updater.publish_artifact(str(path))
+	compressed = (tmp_path / 'cfp.json.gz').read_bytes()
+
+	assert gzip.decompress(compressed) == path.read_bytes() and len(compressed) < path.stat().st_size
+	assert (tmp_path / 'cfp.json.sha256').read_text().splitlines() == [
+		f'{digest}  cfp.json', f'{hashlib.sha256(compressed).hexdigest()}  cfp.json.gz'
+	]
+	assert digest == hashlib.sha256(path.read_bytes()).hexdigest()
+
+	# Without timestamp, the same content gives the same compressed file
+	updater.publish_artifact(str(path))
+	assert (tmp_path / 'cfp.json.gz').read_bytes() == compressed
+
+
+def write_cfps(path: pathlib.Path, rows: list[list], years: list[int], date: datetime.date, previous: bool = True,
+			   index: updater.CfpsIndex | None = None):
+	""" Write rows as the cfps command does, returning the written data and the delta from the previous file """
+	delta = updater.CfpsDelta.load(str(path), years) if previous else updater.CfpsDelta(years)
+	with open(path, 'w') as out:
+		updater.write_cfps_json(out, years, (encoded for _, encoded in delta.track(
+			(row, updater.CfpsJsonWriter.encode(row)) for row in rows
+		)), date, index)
+	out = io.StringIO()
+	if delta.previous is not None:
+		delta.write(out, date, index)
+	return json.loads(path.read_text()), json.loads(out.getvalue() or 'null')
+
+
+def test_cfps_delta(tmp_path):
+	rows = [conf_row('A', 'AI', SAMPLE_CFP, NO_CFP),
+			conf_row('B', 'AI', NO_CFP, SAMPLE_CFP)]
+	path = tmp_path / 'cfp.json'
+
+	first, delta = write_cfps(path, rows, [2025, 2026], datetime.date(2025, 1, 1), previous=False)
+	assert delta is None
+
+	# Unchanged data still gets the new date, with an empty delta
+	second, delta = write_cfps(path, rows, [2025, 2026], datetime.date(2025, 1, 2))
+	assert second == {**first, 'date': '2025-01-02'}
+	assert (delta['changes'], delta['added'], delta['removed'], delta['changed']) == (0, [], [], [])
+	assert updater.apply_cfps_delta(first, delta) == second
+
+	changed = [conf_row('A', 'AI', NO_CFP, [*SAMPLE_CFP[:-2], 'http://m', None], rank='A*'),
+			   conf_row('C', 'AI', SAMPLE_CFP, NO_CFP)]
+	third, delta = write_cfps(path, changed, [2025, 2026], datetime.date(2025, 1, 3))
+	assert delta['removed'] == ['B'] and [key for key, _ in delta['added']] == ['C']
+	assert updater.apply_cfps_delta(second, delta) == third
+
+
+def test_cfps_delta_index(tmp_path, rankings):
+	# Rows in output order, by acronym
+	confs = sorted(rankings[0][:3], key=lambda conf: conf.acronym)
+	path = tmp_path / 'cfp.json'
+
+	def indexed(submissions: list[datetime.date], as_of: datetime.date) -> tuple[list[list], updater.CfpsIndex]:
+		rows, index = [], updater.CfpsIndex(as_of)
+		for conf, submission in zip(confs, submissions):
+			rows.append([*conf.values(), cfp_values(submission=submission, orig={'submission': None})])
+			index.add(conf, rows[-1])
+		return rows, index
+
+	dates = [datetime.date(2025, 3, 1), datetime.date(2025, 2, 1), datetime.date(2024, 12, 1)]
+	rows, index = indexed(dates, datetime.date(2025, 1, 1))
+	first, _ = write_cfps(path, rows, [2025], datetime.date(2025, 1, 1), previous=False, index=index)
+	assert 'index' in first
+
+	# Same data and index: the delta leaves the index as it is
+	rows, index = indexed(dates, datetime.date(2025, 1, 1))
+	second, delta = write_cfps(path, rows, [2025], datetime.date(2025, 1, 2), index=index)
+	assert 'index' not in delta and updater.apply_cfps_delta(first, delta) == second
+
+	# Upcoming deadlines change the index, without changing the data
+	rows, index = indexed(dates, datetime.date(2025, 2, 15))
+	third, delta = write_cfps(path, rows, [2025], datetime.date(2025, 2, 15), index=index)
+	assert delta['changes'] == 0 and delta['index'] == third['index'] != second['index']
+	assert updater.apply_cfps_delta(second, delta) == third
+
+	# Changed data, then no index at all
+	rows, index = indexed([dates[0], dates[2], dates[1]], datetime.date(2025, 2, 15))
+	fourth, delta = write_cfps(path, rows, [2025], datetime.date(2025, 2, 16), index=index)
+	assert updater.apply_cfps_delta(third, delta) == fourth
+	fifth, delta = write_cfps(path, rows, [2025], datetime.date(2025, 2, 17))
+	assert delta['index'] is None and 'index' not in fifth
+	assert updater.apply_cfps_delta(fourth, delta) == fifth
+
+
+def test_cfps_index_page_order(rankings):
+	def cfp(submission: datetime.date | None) -> list:
+		return cfp_values(link=None, submission=submission, orig={'submission': None})
+
+	index = updater.CfpsIndex(datetime.date(2025, 1, 1))
+	for n, conf in enumerate(rankings[0][:12]):
+		submission = {5: datetime.date(2024, 12, 1), 11: None}.get(n, datetime.date(2025, 3, 1))
+		index.add(conf, [*conf.values(), cfp(submission), *([cfp(None)] if n == 3 else [])])
+
+	# As the page sorts: conferences with a cfp without dates first, then by the earliest upcoming date, then by past
+	# dates, with ties by row index as a string
+	assert index.to_json()['order']['submission'] == [11, 3, 0, 1, 10, 2, 4, 6, 7, 8, 9, 5]
+
+
+def test_cfps_index_tokens(rankings):
+	conf = rankings[0][0]
+	index = updater.CfpsIndex(datetime.date(2025, 1, 1))
+	index.add(updater.Conference('ACM-SIGX', 'Straße of Systems: Theory, Practice', 'A', 'CORE', conf.field), [])
+
+	assert index.to_json()['tokens'] == ['acm-sigx', 'of', 'practice', 'strasse', 'systems', 'theory']
+
+
+def test_deadlines_empty(tmp_path):
+	path = tmp_path / 'cfp.json'
+	runner = CliRunner()
+
+	# Dates outside the queried range, and no cfp data at all
+	for rows in [[conf_row('A', 'AI', SAMPLE_CFP, NO_CFP)],
+				 [conf_row('B', 'AI', NO_CFP, NO_CFP)]]:
+		write_cfps(path, rows, [2025, 2026], datetime.date(2025, 1, 1), previous=False)
+		index = updater.DeadlineIndex.load(str(path))
+		assert index.deadlines('submission', datetime.date(2030, 1, 1), datetime.date(2030, 2, 1)).empty
+		assert index.overlapping(datetime.date(2030, 1, 1), datetime.date(2030, 2, 1)).empty
+
+		result = runner.invoke(updater.deadlines, ['--data', str(path), '--from', '2030-01-01'])
+		assert result.exit_code == 0, result.output
+		assert result.output == 'No matching calls for papers\n'
+		result = runner.invoke(updater.deadlines, ['--data', str(path), '--overlapping', '2030-01-01', '2030-02-01'])
+		assert result.exit_code == 0, result.output
+		assert result.output == 'No matching calls for papers\n'
+
+
+def test_deadlines(tmp_path):
+	def cfp(submission: str, conf_start: str, conf_end: str | None = None) -> list:
+		return cfp_values(submission=submission, conf_start=conf_start, orig={'conf_start': False},
+						  **({'conf_end': conf_end} if conf_end else {}))
+
+	rows = [conf_row('A', 'AI', cfp('20250110', '20250601', '20250603'), NO_CFP, rank='A*'),
+			conf_row('B', 'Vision', cfp('20250120', '20250602'), cfp('20260115', '20260601')),
+			conf_row('C', 'Vision', NO_CFP, cfp('20250105', '20250620', '20250625'), rank='A*')]
+	path = tmp_path / 'cfp.json'
+	write_cfps(path, rows, [2025, 2026], datetime.date(2025, 1, 1), previous=False)
+
+	# Tables older than the json are from a previous run, and ignored
+	tables = tmp_path / 'cfp-tables'
+	tables.mkdir()
+	for name in ('conferences', 'cfps'):
+		(tables / f'{name}.arrow').write_bytes(b'')
+		os.utime(tables / f'{name}.arrow', ns=(0, 0))
+	index = updater.DeadlineIndex.load(str(path))
+
+	def query(*args, **kwargs) -> list[tuple]:
+		return [(row['acronym'], row['year']) for _, row in index.deadlines('submission', *args, **kwargs).iterrows()]
+
+	january = datetime.date(2025, 1, 1), datetime.date(2025, 1, 31)
+	assert query(*january) == [('C', 2026), ('A', 2025), ('B', 2025)]
+	assert query(*january, ranks=['A*']) == [('C', 2026), ('A', 2025)]
+	assert query(*january, fields=['Vision']) == [('C', 2026), ('B', 2025)]
+	assert query(*january, ranks=['A*'], fields=['Vision']) == [('C', 2026)]
+	assert query() == [('C', 2026), ('A', 2025), ('B', 2025), ('B', 2026)]
+
+	result = index.deadlines('submission', *january, ranks=['B'])
+	assert result.loc[0, 'submission'] == np.datetime64('2025-01-20') and result.loc[0, 'orig_submission'] is True
+	assert result.loc[0, ['title', 'rank', 'field', 'round', 'link']].tolist() == ['Conf B', 'B', 'Vision', 0, 'http://l']
+
+	# Conferences without end date last a single day
+	overlapping = index.overlapping(datetime.date(2025, 6, 3), datetime.date(2025, 6, 10))
+	assert overlapping['acronym'].tolist() == ['A']
+	overlapping = index.overlapping(datetime.date(2025, 6, 2), datetime.date(2025, 6, 30), fields=['Vision'])
+	assert overlapping['acronym'].tolist() == ['B', 'C']
+	assert overlapping['orig_conf_end'].tolist() == [None, True]
+
+	result = CliRunner().invoke(updater.deadlines, ['--data', str(path), '--from', '2025-01-01', '--rank', 'A*'])
+	assert result.exit_code == 0, result.output
+	assert [line.split()[0] for line in result.output.splitlines()[1:]] == ['C', 'A']
+
+
+def test_cfps_tables_round_trip(tmp_path, rankings, cfp_cache, monkeypatch):
+	pytest.importorskip('pyarrow')
+
+	# Registry rows in output order, by acronym, so that conf ids match the json rows
+	confs = updater.ConferenceRegistry(sorted(rankings[0][:4], key=lambda conf: conf.acronym))
+	years = [2025, 2026]
+	cfps = []
+	for conf_id, acronym in enumerate(confs.acronym.tolist()):
+		for year in years:
+			cfp = updater.CallForPapers(acronym, year, len(cfps), f'{acronym} {year}', link=f'http://{acronym}/{year}')
+			cfp.dates['submission'] = datetime.date(year - 1, 11, 1 + conf_id)
+			cfp.orig['submission'] = conf_id % 2 == 0
+			if conf_id != 1:
+				cfp.dates['conf_start'] = datetime.date(year, 6, 1 + 2 * conf_id)
+				cfp.dates['conf_end'] = datetime.date(year, 6, 3 + 2 * conf_id)
+				cfp.orig['conf_start'] = True
+			cfps.append(cfp)
+
+	conf_ids = np.repeat(np.arange(len(confs)), len(years))
+	rows = [[*confs.values(conf_id, metrics=True), *updater.CallForPapers.batch_values(cfps[2 * conf_id:2 * conf_id + 2])]
+			for conf_id in range(len(confs))]
+	path = tmp_path / 'cfp.json'
+	write_cfps(path, rows, years, datetime.date(2025, 1, 1), previous=False)
+
+	conf_table, cfp_table = updater.cfps_tables(confs, conf_ids, np.tile(years, len(confs)), np.zeros(len(cfps)), cfps)
+	updater.write_cfps_tables(str(tmp_path / 'cfp-tables'), ['arrow'], {'conferences': conf_table, 'cfps': cfp_table})
+
+	from_json = updater.DeadlineIndex.from_json(str(path))
+	with monkeypatch.context() as patch:
+		patch.setattr(updater.DeadlineIndex, 'from_json', None)
+		from_tables = updater.DeadlineIndex.load(str(path))
+
+	np.testing.assert_array_equal(from_tables.dates, from_json.dates)
+	np.testing.assert_array_equal(from_tables.orig, from_json.orig)
+	pd.testing.assert_frame_equal(from_tables.conferences.reset_index(drop=True), from_json.conferences)
+	pd.testing.assert_frame_equal(from_tables.cfps, from_json.cfps, check_dtype=False)
+	for field in updater.DateStore.fields:
+		pd.testing.assert_frame_equal(from_tables.deadlines(field), from_json.deadlines(field), check_dtype=False)
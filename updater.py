@@ -7,26 +7,99 @@ import os
 import sys
 import csv
 import copy as copy_
+import gzip
 import json
 import glob
+import pickle
+import hashlib
 import time
 import click
 import shutil
-import enchant
-import itertools
-import inflection
-import requests
 import datetime
 import operator
+import collections
+import contextlib
+import importlib
 import functools
-import numpy as np
-import pandas as pd
+import itertools
 from urllib import parse
-import bs4
 import warnings
 
 from typing import cast, ClassVar, Generic, Match, Mapping, overload, TextIO, TypeVar
-from collections.abc import ItemsView, Iterable, Iterator, Generator, MutableMapping
+from collections.abc import (
+	Callable, ItemsView, Iterable, Iterator, Generator, MutableMapping, Sequence, Set as AbstractSet
+)
+
+T = TypeVar('T')
+ColumnTableT = TypeVar('ColumnTableT', bound='ColumnTable')
+
+
+
+class LazyModule:
+	""" Stand-in for a module that is only imported on first attribute access.
+
+	Heavy dependencies are only needed by some subcommands, so importing them eagerly makes every invocation (including
+	`--help`) pay for all of them.
+
+	Attributes:
+		load_times: cumulative import time in seconds of each module loaded through a LazyModule, in load order
+	"""
+	load_times: ClassVar[dict[str, float]] = {}
+
+	__slots__ = ('_name', '_module')
+
+	def __init__(self, name: str):
+		self._name = name
+		self._module = None
+
+
+	def _load(self):
+		if self._module is None:
+			start = time.perf_counter()
+			self._module = importlib.import_module(self._name)
+			LazyModule.load_times.setdefault(self._name, time.perf_counter() - start)
+		return self._module
+
+
+	def __getattr__(self, attr: str):
+		return getattr(self._load(), attr)
+
+
+	def __repr__(self) -> str:
+		return f'<{type(self).__name__} {self._name} ({"loaded" if self._module is not None else "not loaded"})>'
+
+
+class lazy_classattr(Generic[T]):
+	""" Class attribute computed on first access, then stored on the class that defines it.
+
+	Used for tables that are expensive to build, e.g. because they need to load a dependency.
+	The initialization time is recorded in :attr:`LazyModule.load_times`.
+	"""
+	def __init__(self, func: Callable[[type], T]):
+		self.func = func
+		functools.update_wrapper(self, func)
+
+
+	def __set_name__(self, owner: type, name: str):
+		self.owner, self.name = owner, name
+
+
+	def __get__(self, obj: object, cls: type | None = None) -> T:
+		start = time.perf_counter()
+		value = self.func(self.owner)
+		LazyModule.load_times.setdefault(f'{self.owner.__name__}.{self.name}', time.perf_counter() - start)
+		setattr(self.owner, self.name, value)
+		return value
+
+
+bs4 = LazyModule('bs4')
+enchant = LazyModule('enchant')
+inflection = LazyModule('inflection')
+np = LazyModule('numpy')
+pa = LazyModule('pyarrow')
+pq = LazyModule('pyarrow.parquet')
+pd = LazyModule('pandas')
+requests = LazyModule('requests')
 
 _term_columns = shutil.get_terminal_size().columns
 
@@ -52,8 +125,6 @@ def clean_print(*args, **kwargs):
 	print(*args, **kwargs)
 
 
-T = TypeVar('T')
-
 class PeekIter(Generic[T]):
 	""" Iterator that allows
 
@@ -116,10 +187,23 @@ class PeekIter(Generic[T]):
 
 
 class RequestWrapper:
-	""" Static wrapper of request.get() to implement caching and waiting between requests """
+	""" Static wrapper of request.get() to implement caching and waiting between requests
+
+	Attributes:
+		run_start: timestamp at which the run started, see `start_run`
+		request_counts: number of requests sent to each domain during this run
+		cache_hits: number of pages read from the cache during this run
+		fetch_times: timestamp at which each page used during this run was fetched, by url
+		known_fetch_times: timestamp at which pages were fetched, by url, from the manifest of a previous run
+	"""
 	last_req_times: dict[str, float] = {}
 	use_cache: bool = True
 	delay: float = 0
+	run_start: float | None = None
+	request_counts: collections.Counter[str] = collections.Counter()
+	cache_hits: int = 0
+	fetch_times: dict[str, float] = {}
+	known_fetch_times: dict[str, float] = {}
 
 	@classmethod
 	def set_delay(cls, delay: float):
@@ -129,6 +213,10 @@ class RequestWrapper:
 	def set_use_cache(cls, use_cache: bool):
 		cls.use_cache = use_cache
 
+	@classmethod
+	def start_run(cls):
+		cls.run_start = time.time()
+
 	@classmethod
 	def wait(cls, url: str):
 		""" Wait until at least :attr:`~delay` seconds for the next same-domain request """
@@ -149,15 +237,24 @@ class RequestWrapper:
 		If filename exists, return its contents instead.
 		kwargs are forwarded to :func:`requests.get`
 		"""
+		entry = f'{url}?{parse.urlencode(kwargs["params"])}' if kwargs.get('params') else url
 		if cls.use_cache:
 			try:
 				with open(filename, 'r', encoding='utf-8') as fh:
-					return bs4.BeautifulSoup(fh.read(), 'lxml')
+					text = fh.read()
 			except FileNotFoundError:
 				pass
+			else:
+				cls.cache_hits += 1
+				if entry not in cls.fetch_times:
+					# Only stat files fetched before the runs recorded in manifests
+					cls.fetch_times[entry] = cls.known_fetch_times.get(entry) or os.path.getctime(filename)
+				return bs4.BeautifulSoup(text, 'lxml')
 
 		cls.wait(url)
 		r = requests.get(url, **kwargs)
+		cls.request_counts[parse.urlsplit(url).netloc] += 1
+		cls.fetch_times[entry] = time.time()
 
 		if cls.use_cache:
 			with open(filename, 'w', encoding='utf-8') as fh:
@@ -166,6 +263,49 @@ class RequestWrapper:
 		return bs4.BeautifulSoup(r.text, 'lxml')
 
 
+	@classmethod
+	def oldest_fetch(cls, entries: Iterable[str]) -> datetime.datetime:
+		""" Return when the oldest of the pages at entries used during this run was fetched, or now if none was used """
+		return datetime.datetime.fromtimestamp(min((cls.fetch_times[entry] for entry in entries
+													if entry in cls.fetch_times), default=time.time()))
+
+
+	@classmethod
+	def load_manifest(cls, path: str):
+		""" Load the fetch times of pages from the manifest of a previous run, see `write_manifest` """
+		try:
+			with open(path) as fh:
+				entries = json.load(fh)['entries']
+		except (FileNotFoundError, ValueError, KeyError):
+			return
+
+		cls.known_fetch_times.update((entry, datetime.datetime.fromisoformat(fetched).timestamp())
+									 for entry, fetched in entries.items())
+
+
+	@classmethod
+	def write_manifest(cls, out: TextIO):
+		""" Write the manifest of this run as json
+
+		The manifest holds the start and end of the run, whether the cache was used, the number of requests sent to each
+		domain, the number of pages read from the cache, and the entries: the url of each page used during the run,
+		with the time at which it was fetched. Times are in ISO 8601 format, in UTC. The manifest is a local record, that
+		the next run with the cache reads to date the cached pages, it is not published with the outputs.
+		"""
+		def iso(timestamp: float) -> str:
+			return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isoformat(timespec='seconds')
+
+		manifest = {
+			'start': iso(cls.run_start if cls.run_start is not None else time.time()),
+			'end': iso(time.time()),
+			'cache': cls.use_cache,
+			'requests': dict(sorted(cls.request_counts.items())),
+			'cache_hits': cls.cache_hits,
+			'entries': {entry: iso(fetched) for entry, fetched in sorted(cls.fetch_times.items())},
+		}
+		json.dump(manifest, out, indent=1)
+
+
 def normalize(string: str) -> str:
 	""" Singularize and lower casing of a word """
 	# Asia -> Asium and Meta -> Metum, really?
@@ -248,11 +388,13 @@ class ConfMetaData:
 	}
 
 	# NB simple acronym management, only works while first word -> acronym mapping is unique
-	_acronyms = {''.join(word[0] for word in acr.split()): [normalize(word) for word in acr.split()] for acr in [
-		'call for papers', 'geographic information system', 'high performance computing', 'message passing interface',
-		'object oriented', 'operating system', 'parallel virtual machine', 'public key infrastructure',
-		'special interest group',
-	]}
+	@lazy_classattr
+	def _acronyms(cls) -> dict[str, list[str]]:
+		return {''.join(word[0] for word in acr.split()): [normalize(word) for word in acr.split()] for acr in [
+			'call for papers', 'geographic information system', 'high performance computing',
+			'message passing interface', 'object oriented', 'operating system', 'parallel virtual machine',
+			'public key infrastructure', 'special interest group',
+		]}
 	# Computer Performance Evaluation ? Online Analytical Processing: OLAP? aspect-oriented programming ?
 
 	_tens = {'twenty', 'thirty', 'fourty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety'}
@@ -261,13 +403,27 @@ class ConfMetaData:
 						  .format(tens = '|'.join(_tens)))
 	_ordinal_list = ('first', 'second', 'third', 'fourth', 'fifth', 'sixth')
 
-	_sigcmp = {normalize(f'SIG{group}'): group for group in _sig}
-	_orgcmp = {normalize(entity): entity for entity in _org}
+	# Tables below need inflection or enchant, only build them once we start classifying words
+	@lazy_classattr
+	def _sigcmp(cls) -> dict[str, str]:
+		return {normalize(f'SIG{group}'): group for group in cls._sig}
+
+	@lazy_classattr
+	def _orgcmp(cls) -> dict[str, str]:
+		return {normalize(entity): entity for entity in cls._org}
+
+	@lazy_classattr
+	def _acronym_start(cls) -> dict[str, str]:
+		return {words[0]: acr for acr, words in cls._acronyms.items()}
+
+	@lazy_classattr
+	def _sig_start(cls) -> dict[str, str]:
+		return {normalize(desc.split()[0]): group for group, desc in cls._sig.items() if group != 'ART'}
 
-	_acronym_start = {words[0]: acr for acr, words in _acronyms.items()}
-	_sig_start = {normalize(desc.split()[0]): group for group, desc in _sig.items() if group != 'ART'}
+	@lazy_classattr
+	def _dict(cls) -> enchant.Dict:
+		return enchant.DictWithPWL('EN_US', 'dict.txt')
 
-	_dict = enchant.DictWithPWL('EN_US', 'dict.txt')
 	_misspelled: dict[str, list[tuple[str, ...]]] = {}
 
 	acronym_words: list[str]
@@ -278,7 +434,10 @@ class ConfMetaData:
 	qualifiers: list[str]
 	call_type: str | None
 
-	__slots__ = ('acronym_words', 'topic_keywords', 'organisers', 'number', 'type_', 'qualifiers', 'call_type')
+	_interned: InternedWords | None
+
+	__slots__ = ('acronym_words', 'topic_keywords', 'organisers', 'number', 'type_', 'qualifiers', 'call_type',
+				 '_interned')
 
 	def __init__(self, title: str, conf_acronym: str, year: str | int = ''):
 		super().__init__()
@@ -289,6 +448,7 @@ class ConfMetaData:
 		self.number = set()
 		self.type_ = set()
 		self.qualifiers = []
+		self._interned = None
 
 		self.classify_words(title, normalize(conf_acronym), str(year))
 
@@ -482,13 +642,13 @@ class ConfMetaData:
 
 
 	@classmethod
-	def _set_diff(cls, left: set[str], right: set[str], require_common: bool = True) -> float:
+	def _set_diff(cls, left: AbstractSet[T], right: AbstractSet[T], require_common: bool = True) -> float:
 		""" Return an int quantifying the difference between the sets. Lower is better.
 
 		Penalize a bit for difference on a single side, more for differences on both sides, under the assumption that
 		partial information on one side is better than dissymetric information
 		"""
-		n_common = len(set(left) & set(right))
+		n_common = len(left & right)
 		l = len(left) - n_common
 		r = len(right) - n_common
 
@@ -498,33 +658,56 @@ class ConfMetaData:
 			return  l + r + 10 * l * r - 2 * n_common
 
 
+	@staticmethod
+	def _common_positions(words: Sequence[T], common: AbstractSet[T]) -> dict[T, int]:
+		""" Return the index of each common word in the list of words, ignoring words not in common. """
+		pos: dict[T, int] = {}
+		n = 0
+		for w in words:
+			if w in common:
+				pos.setdefault(w, n)
+				n += 1
+		return pos
+
+
 	@classmethod
-	def _list_diff(cls, left: list[str], right: list[str], require_common: bool = True) -> float:
+	def _list_diff(cls, left: Sequence[T], right: Sequence[T], require_common: bool = True,
+				   left_set: AbstractSet[T] | None = None, right_set: AbstractSet[T] | None = None) -> float:
 		""" Return a float quantifying the difference between the lists of words.
 
 		Uset the same as `~set_diff` and add penalties for dfferences in word order.
+		The sets of words of each list may be passed if they are already known.
 		"""
 		# for 4 diffs => 4 + 0 -> 5, 3 + 1 -> 8, 2 + 2 -> 9
-		common = set(left) & set(right)
+		common = (frozenset(left) if left_set is None else left_set) & \
+				 (frozenset(right) if right_set is None else right_set)
 		n_common = len(common)
-		n_l, n_r = len(left) - n_common, len(right) - n_common
-		l = [w for w in left if w in common]
-		r = [w for w in right if w in common]
-		try:
-			mid = round(sum(l.index(c) - r.index(c) for c in common) / len(common))
-			sort_diff = sum(abs(l.index(c) - r.index(c) - mid) for c in common) / n_common
-		except ZeroDivisionError:
-			sort_diff = 0
 
 		# disqualify if there is nothing in common
 		if require_common and left and right and not common:
 			return np.inf
+
+		n_l, n_r = len(left) - n_common, len(right) - n_common
+		if n_common:
+			l, r = cls._common_positions(left, common), cls._common_positions(right, common)
+			shifts = [l[c] - r[c] for c in common]
+			mid = round(sum(shifts) / n_common)
+			sort_diff = sum(abs(shift - mid) for shift in shifts) / n_common
 		else:
-			return n_l + n_r + 10 * n_l * n_r - 4 * n_common + sort_diff
+			sort_diff = 0
+
+		return n_l + n_r + 10 * n_l * n_r - 4 * n_common + sort_diff
+
+
+	@staticmethod
+	@functools.cache
+	def _acronym_prefixes(words: tuple[str, ...]) -> dict[str, int]:
+		""" Map the concatenation of the n + 1 first words to n, for each n """
+		return {''.join(words[:n + 1]): n for n in range(len(words))}
 
 
 	@classmethod
-	def _acronym_diff(cls, left: list[str], right: list[str]) -> float:
+	def _acronym_diff(cls, left: Sequence[str], right: Sequence[str]) -> float:
 		""" Return a float quantifying the difference between lists of words in acronyms.
 
 		More specific than _list_diff as we always want the first word to be an exact match,
@@ -545,8 +728,8 @@ class ConfMetaData:
 		elif left_org or right_org and left[0] != right[0]:
 			return cls._acronym_diff(left[int(left_org):], right[int(right_org):]) + 1
 
-		left_prefixes = {''.join(left[:n + 1]): n for n in range(len(left))}
-		right_prefixes = {''.join(right[:n + 1]): n for n in range(len(right))}
+		left_prefixes = cls._acronym_prefixes(tuple(left))
+		right_prefixes = cls._acronym_prefixes(tuple(right))
 
 		common = left_prefixes.keys() & right_prefixes.keys()
 		if not common:
@@ -561,18 +744,134 @@ class ConfMetaData:
 																		  [prefix, *right[nsep_right_prefix + 1:]])
 
 
+	def interned(self) -> InternedWords:
+		""" Return the comparison-ready version of the words describing this conference, computed once.  """
+		if self._interned is None:
+			self._interned = InternedWords(self)
+		return self._interned
+
+
 	def _difference(self, other: ConfMetaData) -> tuple[float, float, float, float, float, float]:
 		""" Compare the two ConfMetaData instances and rate how similar they are.  """
+		words, other_words = self.interned(), other.interned()
 		return (
-			self._acronym_diff(self.acronym_words, other.acronym_words),
-			self._set_diff(self.type_, other.type_),
-			self._set_diff(self.organisers, other.organisers),
-			self._list_diff(self.topic_keywords, other.topic_keywords),
-			self._list_diff(self.qualifiers, other.qualifiers, require_common=False) / 2,
-			self._set_diff(self.number, other.number)
+			self._acronym_diff(words.acronym, other_words.acronym),
+			self._set_diff(words.type_, other_words.type_),
+			self._set_diff(words.organisers, other_words.organisers),
+			self._list_diff(words.topic, other_words.topic,
+							left_set=words.topic_set, right_set=other_words.topic_set),
+			self._list_diff(words.qualifiers, other_words.qualifiers, require_common=False,
+							left_set=words.qualifiers_set, right_set=other_words.qualifiers_set) / 2,
+			self._set_diff(words.number, other_words.number)
 		)
 
 
+	@staticmethod
+	def _batch_common(left: WordIncidence, right: WordIncidence, idx_left: np.ndarray, idx_right: np.ndarray):
+		""" Find the words common to the left and right rows of each pair
+
+		Returns:
+			For each side, the row lengths, the pair owning each entry, and whether the entry's word is in both rows
+		"""
+		len_l, pair_l, ent_l = left.expand(idx_left)
+		len_r, pair_r, ent_r = right.expand(idx_right)
+
+		nwords = max(len(InternedWords._ids), 1)
+		key_l = pair_l * nwords + left.words[ent_l]
+		key_r = pair_r * nwords + right.words[ent_r]
+
+		return (len_l, pair_l, ent_l, np.isin(key_l, key_r), key_l), (len_r, pair_r, ent_r, np.isin(key_r, key_l), key_r)
+
+
+	@classmethod
+	def _batch_set_diff(cls, left: WordIncidence, right: WordIncidence, idx_left: np.ndarray, idx_right: np.ndarray,
+						require_common: bool = True) -> np.ndarray:
+		""" Vectorized `~_set_diff` for all pairs of rows (idx_left[n], idx_right[n]) """
+		(len_l, pair_l, _, common_l, _), (len_r, *_) = cls._batch_common(left, right, idx_left, idx_right)
+
+		n_common = np.bincount(pair_l[common_l], minlength=len(idx_left))
+		l = len_l - n_common
+		r = len_r - n_common
+
+		diff = (l + r + 10 * l * r - 2 * n_common).astype(float)
+		if require_common:
+			diff[(l > 0) & (r > 0) & (n_common == 0)] = np.inf
+		return diff
+
+
+	@classmethod
+	def _batch_list_diff(cls, left: WordIncidence, right: WordIncidence, idx_left: np.ndarray, idx_right: np.ndarray,
+						 require_common: bool = True) -> np.ndarray:
+		""" Vectorized `~_list_diff` for all pairs of rows (idx_left[n], idx_right[n]) """
+		npairs = len(idx_left)
+		sides = cls._batch_common(left, right, idx_left, idx_right)
+
+		# For each side, the position of the first occurrence of each common word, among the common words of its row
+		first_common = []
+		for (lengths, pair, ent, common, key), words in zip(sides, (left, right)):
+			ncommon_before = np.concatenate([[0], np.cumsum(common)])
+			pos = ncommon_before[:-1] - np.repeat(ncommon_before[np.cumsum(lengths) - lengths], lengths)
+
+			select = common & words.first[ent]
+			order = np.argsort(key[select], kind='stable')
+			first_common.append((pair[select][order], pos[select][order]))
+
+		# Both sides have exactly one first occurrence per common word, so sorting by (pair, word) aligns them
+		(pair, pos_l), (_, pos_r) = first_common
+		shift = pos_l - pos_r
+
+		n_common = np.bincount(pair, minlength=npairs)
+		has_common = n_common > 0
+		mid = np.round(np.divide(np.bincount(pair, weights=shift, minlength=npairs), n_common,
+								 out=np.zeros(npairs), where=has_common))
+		sort_diff = np.divide(np.bincount(pair, weights=np.abs(shift - mid[pair]), minlength=npairs), n_common,
+							  out=np.zeros(npairs), where=has_common)
+
+		len_l, len_r = sides[0][0], sides[1][0]
+		n_l, n_r = len_l - n_common, len_r - n_common
+
+		diff = (n_l + n_r + 10 * n_l * n_r - 4 * n_common) + sort_diff
+		if require_common:
+			diff[(len_l > 0) & (len_r > 0) & ~has_common] = np.inf
+		return diff
+
+
+	@classmethod
+	def batch_difference(cls, left: InternedWordsBatch, right: InternedWordsBatch,
+						 idx_left: np.ndarray, idx_right: np.ndarray) -> np.ndarray:
+		""" Compute `~_difference` for all pairs (left[idx_left[n]], right[idx_right[n]])
+
+		Returns:
+			An array with one row per pair and one column per value returned by `~_difference`
+		"""
+		idx_left, idx_right = np.asarray(idx_left, dtype=np.int64), np.asarray(idx_right, dtype=np.int64)
+
+		# Acronyms are repeated a lot across compared pairs, so only compare each distinct pair of acronyms once
+		acronym_ids: dict[tuple[str, ...], int] = {}
+		acr_l = np.array([acronym_ids.setdefault(acr, len(acronym_ids)) for acr in left.acronym], dtype=np.int64)
+		acr_r = np.array([acronym_ids.setdefault(acr, len(acronym_ids)) for acr in right.acronym], dtype=np.int64)
+		acronyms = list(acronym_ids)
+
+		acr_pairs, acr_pair_idx = np.unique(acr_l[idx_left] * len(acronyms) + acr_r[idx_right], return_inverse=True)
+		acr_diff = np.array([cls._acronym_diff(acronyms[pair // len(acronyms)], acronyms[pair % len(acronyms)])
+							 for pair in acr_pairs.tolist()], dtype=float)
+
+		return np.column_stack([
+			acr_diff[acr_pair_idx.reshape(-1)],
+			cls._batch_set_diff(left.type_, right.type_, idx_left, idx_right),
+			cls._batch_set_diff(left.organisers, right.organisers, idx_left, idx_right),
+			cls._batch_list_diff(left.topic, right.topic, idx_left, idx_right),
+			cls._batch_list_diff(left.qualifiers, right.qualifiers, idx_left, idx_right, require_common=False) / 2,
+			cls._batch_set_diff(left.number, right.number, idx_left, idx_right),
+		]).reshape(len(idx_left), 6)
+
+
+	@staticmethod
+	def batch_score(differences: np.ndarray) -> np.ndarray:
+		""" Sum the rows of `~batch_difference` in the same order as `sum(~_difference(...))` """
+		return functools.reduce(np.add, differences.T, np.zeros(len(differences)))
+
+
 	def str_info(self) -> list[str]:
 		vals = []
 		if self.topic_keywords:
@@ -592,6 +891,105 @@ class ConfMetaData:
 		return f'{type(self).__name__}({", ".join(self.str_info())})'
 
 
+class InternedWords:
+	""" Snapshot of the words of a ConfMetaData, in the form used to compare conferences.
+
+	Words are replaced by integer ids from a global intern table, word lists are stored as tuples next to their
+	frozensets, so that comparisons do not need to rebuild sets or look up words.
+	Acronym words are kept as strings, as they are concatenated to compare acronym prefixes.
+	"""
+	_ids: ClassVar[dict[str, int]] = {}
+
+	acronym: tuple[str, ...]
+	type_: frozenset[int]
+	organisers: frozenset[int]
+	number: frozenset[int]
+	topic: tuple[int, ...]
+	topic_set: frozenset[int]
+	qualifiers: tuple[int, ...]
+	qualifiers_set: frozenset[int]
+
+	__slots__ = ('acronym', 'type_', 'organisers', 'number', 'topic', 'topic_set', 'qualifiers', 'qualifiers_set')
+
+	def __init__(self, meta: ConfMetaData):
+		self.acronym = tuple(meta.acronym_words)
+		self.type_ = frozenset(self.intern(meta.type_))
+		self.organisers = frozenset(self.intern(meta.organisers))
+		self.number = frozenset(self.intern(meta.number))
+		self.topic = self.intern(meta.topic_keywords)
+		self.topic_set = frozenset(self.topic)
+		self.qualifiers = self.intern(meta.qualifiers)
+		self.qualifiers_set = frozenset(self.qualifiers)
+
+
+	@classmethod
+	def intern(cls, words: Iterable[str]) -> tuple[int, ...]:
+		""" Return the ids of the words, assigning new ids to words not seen before """
+		ids = cls._ids
+		return tuple(ids.setdefault(word, len(ids)) for word in words)
+
+
+class WordIncidence:
+	""" Sparse incidence matrix of interned words for a list of word lists or sets, in compressed row format.
+
+	Attributes:
+		indptr: the words of row n are `words[indptr[n]:indptr[n + 1]]`
+		words: word ids of all rows, in order
+		first: whether each entry of `words` is the first occurrence of that word in its row
+	"""
+	indptr: np.ndarray
+	words: np.ndarray
+	first: np.ndarray
+
+	__slots__ = ('indptr', 'words', 'first')
+
+	def __init__(self, rows: Sequence[Iterable[int]]):
+		rows = [tuple(row) for row in rows]
+		self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+		np.cumsum([len(row) for row in rows], out=self.indptr[1:])
+		self.words = np.fromiter(itertools.chain.from_iterable(rows), dtype=np.int64, count=self.indptr[-1])
+		self.first = np.fromiter(itertools.chain.from_iterable(
+			(word not in row[:pos] for pos, word in enumerate(row)) for row in rows
+		), dtype=bool, count=self.indptr[-1])
+
+
+	def expand(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+		""" Gather the entries of the given rows
+
+		Returns:
+			The length of each requested row, the position of each gathered entry in `rows`, and the gathered entries
+		"""
+		lengths = (self.indptr[1:] - self.indptr[:-1])[rows]
+		owner = np.repeat(np.arange(len(rows)), lengths)
+		offsets = np.arange(len(owner)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+		return lengths, owner, np.repeat(self.indptr[:-1][rows], lengths) + offsets
+
+
+class InternedWordsBatch:
+	""" The InternedWords of a list of ConfMetaData, as one WordIncidence per compared field.  """
+	acronym: list[tuple[str, ...]]
+	type_: WordIncidence
+	organisers: WordIncidence
+	number: WordIncidence
+	topic: WordIncidence
+	qualifiers: WordIncidence
+
+	__slots__ = ('acronym', 'type_', 'organisers', 'number', 'topic', 'qualifiers')
+
+	def __init__(self, metas: Iterable[ConfMetaData]):
+		words = [meta.interned() for meta in metas]
+		self.acronym = [w.acronym for w in words]
+		self.type_ = WordIncidence([w.type_ for w in words])
+		self.organisers = WordIncidence([w.organisers for w in words])
+		self.number = WordIncidence([w.number for w in words])
+		self.topic = WordIncidence([w.topic for w in words])
+		self.qualifiers = WordIncidence([w.qualifiers for w in words])
+
+
+	def __len__(self) -> int:
+		return len(self.acronym)
+
+
 @functools.total_ordering
 class Conference(ConfMetaData):
 	__slots__ = ('acronym', 'title', 'rank', 'ranksys', 'field')
@@ -638,13 +1036,19 @@ class Conference(ConfMetaData):
 
 
 	@classmethod
-	def merge(cls, left: Conference, right: Conference) -> Conference:
-		new = copy_.copy(left)
-		# In case we have matched different acronyms, keep the version with most separations/words
-		if len(left.acronym_words) < len(right.acronym_words):
-			new.acronym, new.acronym_words = right.acronym, right.acronym_words
-		new.rank = left.rank + right.rank
-		new.ranksys = left.ranksys + right.ranksys
+	def merge(cls, first: Conference, *others: Conference) -> Conference:
+		""" Merge matching conferences from different sources, with ranks in the order of the given conferences """
+		if not others:
+			return first
+
+		new = copy_.copy(first)
+		for other in others:
+			# In case we have matched different acronyms, keep the version with most separations/words
+			if len(new.acronym_words) < len(other.acronym_words):
+				new.acronym, new.acronym_words = other.acronym, other.acronym_words
+				new._interned = None
+			new.rank = new.rank + other.rank
+			new.ranksys = new.ranksys + other.ranksys
 		return new
 
 
@@ -664,35 +1068,370 @@ class Conference(ConfMetaData):
 		return vals
 
 
+class ColumnTable:
+	""" Base of the columnar storages, whose slots are all arrays with a value per row """
+	__slots__ = ()
+
+	def take(self: ColumnTableT, rows: np.ndarray | Sequence[int] | Sequence[bool]) -> ColumnTableT:
+		""" Return a table with the given rows, in the given order. Rows may also be a boolean mask. """
+		# An empty list would be an array of floats, which can not index
+		rows = np.asarray(rows) if len(rows) else np.empty(0, dtype=np.int64)
+		new = object.__new__(type(self))
+		for column in self.__slots__:
+			setattr(new, column, getattr(self, column)[rows])
+		return new
+
+
+class ConferenceRegistry(ColumnTable):
+	""" Columnar storage of conferences, with a row per conference.
+
+	Columns hold the displayed values of the conferences and precomputed sort keys, so that sorting and filtering do
+	not need to call methods on each Conference. The Conference objects are kept for the code that needs them.
+
+	Attributes:
+		confs: the Conference object of each row
+		acronym, acronym_upper, title, field: string columns
+		rank, ranksys: tuples of ranks and rank systems of each row, in source order
+		ranksort: best unified rank of each row (see `~Conference.ranksort`), lower is better
+		h5_index, h5_median: H5 metrics of each row, or None, see `join_metrics`
+	"""
+	h5_columns: ClassVar[dict[str, str]] = {'h5_index': 'H5Index2024', 'h5_median': 'H5Median2024'}
+
+	confs: np.ndarray
+	acronym: np.ndarray
+	acronym_upper: np.ndarray
+	title: np.ndarray
+	rank: np.ndarray
+	ranksys: np.ndarray
+	field: np.ndarray
+	ranksort: np.ndarray
+	h5_index: np.ndarray
+	h5_median: np.ndarray
+
+	__slots__ = ('confs', 'acronym', 'acronym_upper', 'title', 'rank', 'ranksys', 'field', 'ranksort',
+				 'h5_index', 'h5_median')
+
+	def __init__(self, confs: Iterable[Conference]):
+		self.confs = self._object_array(confs)
+		self.acronym = self._object_array(conf.acronym for conf in self.confs)
+		self.acronym_upper = self._object_array(acronym.upper() for acronym in self.acronym)
+		self.title = self._object_array(conf.title for conf in self.confs)
+		self.rank = self._object_array(conf.rank for conf in self.confs)
+		self.ranksys = self._object_array(conf.ranksys for conf in self.confs)
+		self.field = self._object_array(conf.field for conf in self.confs)
+		self.ranksort = np.fromiter((conf.ranksort() for conf in self.confs), dtype=np.int64, count=len(self.confs))
+		self.h5_index = np.full(len(self.confs), None, dtype=object)
+		self.h5_median = np.full(len(self.confs), None, dtype=object)
+
+
+	@staticmethod
+	def _object_array(values: Iterable[object]) -> np.ndarray:
+		""" Build a 1-dimensional object array, even from tuples """
+		values = list(values)
+		array = np.empty(len(values), dtype=object)
+		array[:] = values
+		return array
+
+
+	@staticmethod
+	def _sort_codes(values: np.ndarray, key: Callable | None = None) -> np.ndarray:
+		""" Replace values by their position in the sorted unique values """
+		codes = {value: code for code, value in enumerate(sorted(set(values.tolist()), key=key))}
+		return np.fromiter((codes[value] for value in values.tolist()), dtype=np.int64, count=len(values))
+
+
+	def __len__(self) -> int:
+		return len(self.confs)
+
+
+	def __iter__(self) -> Iterator[Conference]:
+		return iter(self.confs)
+
+
+	def __getitem__(self, row: int) -> Conference:
+		return self.confs[row]
+
+
+	def sort(self) -> ConferenceRegistry:
+		""" Return the registry sorted in the same order as sorting Conference objects """
+		# np.lexsort uses the last key as primary key
+		# Missing rank systems are None, sort them first rather than failing to compare them
+		missing_first = lambda systems: [(system is not None, system or '') for system in systems]
+		keys = [self._sort_codes(self.field), self._sort_codes(self.ranksys, key=missing_first)]
+		keys.extend([self.ranksort, self._sort_codes(self.title), self._sort_codes(self.acronym)])
+		return self.take(np.lexsort(keys))
+
+
+	def match_acronyms(self, pattern: str) -> np.ndarray:
+		""" Return the mask of rows whose upper-cased acronym matches the regex pattern """
+		regex = re.compile(pattern)
+		return np.fromiter((regex.match(acronym) is not None for acronym in self.acronym_upper.tolist()),
+						   dtype=bool, count=len(self))
+
+
+	def join_metrics(self, metrics: pd.DataFrame):
+		""" Set the H5 columns from metrics indexed by upper-cased acronym, with unique index. Missing metrics are None. """
+		rows = metrics.index.get_indexer(self.acronym_upper)
+		for column in self.h5_columns:
+			# Append a None value, selected by the -1 rows without metrics
+			values = self._object_array([*(None if pd.isna(x) else int(x) for x in metrics[column].tolist()), None])
+			setattr(self, column, values[rows])
+
+
+	def values(self, row: int, metrics: bool = False) -> tuple[str, str, tuple[str | int | None, ...],
+																 tuple[str | None, ...], str]:
+		""" Return the values of a row, as `~Conference.values`, optionally with the H5 metrics as extra ranks """
+		if not metrics:
+			return (self.acronym[row], self.title[row], self.rank[row], self.ranksys[row], self.field[row])
+		return (self.acronym[row], self.title[row],
+				(*self.rank[row], *(getattr(self, column)[row] for column in self.h5_columns)),
+				(*self.ranksys[row], *self.h5_columns.values()), self.field[row])
+
+
+	def to_frame(self) -> pd.DataFrame:
+		""" Return the columns as a DataFrame, indexed by row """
+		return pd.DataFrame({column: getattr(self, column) for column in self.__slots__})
+
+
+class DateStore:
+	""" Columnar storage of the dates of all calls for papers, with a row per cfp and a column per date field.
+
+	Attributes:
+		dates: the date of each field, NaT where missing
+		orig: 1 if the date of a field was read from the cfp, 0 if it was guessed, -1 where missing
+		parsed: the dates as parsed from the cfp page, before any correction, to be able to check them again
+		size: number of rows allocated, arrays are over-allocated to add rows in amortized constant time
+		free: released rows, to reuse before allocating new ones
+	"""
+	fields: ClassVar[tuple[str, ...]] = ('abstract', 'submission', 'notification', 'camera_ready', 'conf_start', 'conf_end')
+	column: ClassVar[dict[str, int]] = {field: n for n, field in enumerate(fields)}
+
+	dates: np.ndarray
+	orig: np.ndarray
+	parsed: np.ndarray
+	size: int
+	free: list[int]
+
+	__slots__ = ('dates', 'orig', 'parsed', 'size', 'free')
+
+	def __init__(self, capacity: int = 1024):
+		self.dates = np.full((capacity, len(self.fields)), np.datetime64('NaT'), dtype='datetime64[D]')
+		self.orig = np.full((capacity, len(self.fields)), -1, dtype=np.int8)
+		self.parsed = self.dates.copy()
+		self.size = 0
+		self.free = []
+
+
+	def add_row(self) -> int:
+		""" Return the index of a new row, with all dates missing """
+		if self.free:
+			return self.free.pop()
+
+		if self.size == len(self.dates):
+			grow = max(len(self.dates), 16)
+			self.dates = np.concatenate([self.dates, np.full((grow, len(self.fields)), np.datetime64('NaT'),
+															 dtype=self.dates.dtype)])
+			self.orig = np.concatenate([self.orig, np.full((grow, len(self.fields)), -1, dtype=self.orig.dtype)])
+			self.parsed = np.concatenate([self.parsed, np.full((grow, len(self.fields)), np.datetime64('NaT'),
+															   dtype=self.parsed.dtype)])
+		self.size += 1
+		return self.size - 1
+
+
+	def release(self, row: int):
+		""" Clear a row that is no longer used, so that it can be reused. Views of the row must be detached first. """
+		self.dates[row] = self.parsed[row] = np.datetime64('NaT')
+		self.orig[row] = -1
+		self.free.append(row)
+
+
+	def values(self, rows: np.ndarray | Sequence[int]) -> list[list[datetime.date | bool | None]]:
+		""" Return the dates then the orig flags of each row, as python objects with None where missing """
+		# datetime64[D] values convert to datetime.date objects, and NaT to None
+		dates = self.dates[rows].astype(object)
+		# Missing flags are -1, which picks the last item
+		orig = np.array([False, True, None], dtype=object)[self.orig[rows]]
+		return np.concatenate([dates, orig], axis=1).tolist()
+
+
 class Dates(MutableMapping[str, T]):
-	__slots__ = ('abstract', 'submission', 'notification', 'camera_ready', 'conf_start', 'conf_end')
+	""" View of one row of a `DateStore`, as a mapping from the fields that are set to their values
+
+	Subclasses pick the array of the store they view, and how values are stored in it.
+	"""
+	fields: ClassVar[tuple[str, ...]] = DateStore.fields
+	_array: ClassVar[str]
+
+	store: DateStore
+	row: int
+
+	__slots__ = ('store', 'row')
+
+	def __init__(self, store: DateStore, row: int):
+		self.store = store
+		self.row = row
+
+	def detach(self):
+		""" Stop viewing the row, e.g. before it is released and reused for other dates """
+		self.row = -1
+
+	def _values(self) -> np.ndarray:
+		if self.row < 0:
+			raise ReferenceError('Dates of a discarded cfp')
+		return getattr(self.store, self._array)[self.row]
+
+	@staticmethod
+	def _missing(values: np.ndarray) -> np.ndarray:
+		raise NotImplementedError
+
+	@staticmethod
+	def _missing_value() -> object:
+		raise NotImplementedError
+
+	@staticmethod
+	def _decode(value: object) -> T:
+		raise NotImplementedError
+
+	@staticmethod
+	def _encode(value: T) -> object:
+		raise NotImplementedError
 
 	def __getitem__(self, key: str) -> T:
-		try:
-			return getattr(self, key)
-		except AttributeError:
-			raise KeyError(key) from None
+		value = self._values()[DateStore.column[key]]
+		if self._missing(value):
+			raise KeyError(key)
+		return self._decode(value)
 
 	def __setitem__(self, key: str, value: T):
-		setattr(self, key, value)
+		self._values()[DateStore.column[key]] = self._encode(value)
 
 	def __delitem__(self, key: str):
-		delattr(self, key)
+		if key not in self:
+			raise KeyError(key)
+		self._values()[DateStore.column[key]] = self._missing_value()
+
+	def __contains__(self, key: object) -> bool:
+		return key in DateStore.column and not self._missing(self._values()[DateStore.column[key]])
 
 	def __len__(self) -> int:
-		return sum(hasattr(self, attr) for attr in self.__slots__)
+		return int(np.count_nonzero(~self._missing(self._values())))
 
 	def __iter__(self) -> Iterator[str]:
-		return iter(attr for attr in self.__slots__ if hasattr(self, attr))
+		return iter([field for field, missing in zip(self.fields, self._missing(self._values()).tolist()) if not missing])
 
 	def items(self) -> ItemsView[str, T]:
-		for attr in self.__slots__:
-			try:
-				val = getattr(self, attr)
-			except AttributeError:
-				pass
-			else:
-				yield attr, val
+		values = self._values()
+		for field, value, missing in zip(self.fields, values, self._missing(values).tolist()):
+			if not missing:
+				yield field, self._decode(value)
+
+
+class DateValues(Dates[datetime.date]):
+	""" View of the dates of a cfp """
+	_array = 'dates'
+
+	__slots__ = ()
+
+	@staticmethod
+	def _missing(values: np.ndarray) -> np.ndarray:
+		return np.isnat(values)
+
+	@staticmethod
+	def _missing_value() -> np.datetime64:
+		return np.datetime64('NaT')
+
+	@staticmethod
+	def _decode(value: np.datetime64) -> datetime.date:
+		return value.item()
+
+	@staticmethod
+	def _encode(value: datetime.date) -> np.datetime64:
+		return np.datetime64(value, 'D')
+
+
+class DateFlags(Dates[bool]):
+	""" View of the orig flags of a cfp’s dates, i.e. whether they were read from the cfp rather than guessed """
+	_array = 'orig'
+
+	__slots__ = ()
+
+	@staticmethod
+	def _missing(values: np.ndarray) -> np.ndarray:
+		return values < 0
+
+	@staticmethod
+	def _missing_value() -> int:
+		return -1
+
+	@staticmethod
+	def _decode(value: np.int8) -> bool:
+		return bool(value)
+
+	@staticmethod
+	def _encode(value: bool) -> int:
+		return int(bool(value))
+
+
+class CandidateTable(ColumnTable):
+	""" Columnar storage of the candidate calls for papers found when searching for a conference, with a row per call.
+
+	There are only a handful of candidates per search, so this avoids building DataFrames for each of them.
+
+	Attributes:
+		cfp: the CallForPapers object of each row
+		rating: total rating of each row, lower is better
+		missing: number of fields missing from the search results of each row
+	"""
+	cfp: np.ndarray
+	rating: np.ndarray
+	missing: np.ndarray
+
+	__slots__ = ('cfp', 'rating', 'missing')
+
+	def __init__(self, cfps: Sequence[CallForPapers], rating: Sequence[float], missing: Sequence[int]):
+		self.cfp = np.empty(len(cfps), dtype=object)
+		self.cfp[:] = cfps
+		self.rating = np.asarray(rating, dtype=np.float64)
+		self.missing = np.asarray(missing, dtype=np.int64)
+
+
+	def __len__(self) -> int:
+		return len(self.cfp)
+
+
+	def best(self) -> int:
+		""" Return the first row with the best (lowest) rating """
+		return int(self.rating.argmin())
+
+
+	def dates(self) -> np.ndarray:
+		""" Return the dates of each row, as a matrix with a column per field of `~Dates`, NaT where missing """
+		return CallForPapers._date_store.dates[CallForPapers.date_rows(self.cfp)]
+
+
+	def row(self, row: int) -> tuple[CallForPapers, float, int]:
+		""" Return the call for papers, rating and missing fields count of a row """
+		return self.cfp[row], float(self.rating[row]), int(self.missing[row])
+
+
+class CfpTombstone:
+	""" What the cache keeps of a rejected candidate cfp that was never fetched
+
+	Attributes:
+		id: the cfp’s id
+		year: the cfp’s year, which is that of the first search that found it
+		rating: best total rating of the cfp in the searches that rejected it
+	"""
+	id: int
+	year: int
+	rating: float
+
+	__slots__ = ('id', 'year', 'rating')
+
+	def __init__(self, id_: int, year: int, rating: float):
+		self.id = id_
+		self.year = year
+		self.rating = rating
 
 
 class CallForPapers(ConfMetaData):
@@ -711,17 +1450,30 @@ class CallForPapers(ConfMetaData):
 
 	_url_cfpsearch: ClassVar[str]
 	_fill_id: ClassVar[int] = sys.maxsize
-	_cache: ClassVar[dict[int, CallForPapers]] = {}
+	_cache: ClassVar[dict[int, CallForPapers | CfpTombstone]] = {}
+	_accepted: ClassVar[set[int]] = set()
 	_errors: ClassVar[list] = []
+	_tombstones: ClassVar[dict[int, None]] = {}
+	_max_tombstones: ClassVar[int] = 100_000
+	_ratings: ClassVar[dict[tuple[tuple[str, str], int], tuple[float, ...]]] = {}
+	_max_ratings: ClassVar[int] = 200_000
+	_rating_lookups: ClassVar[dict[str, int]] = {'hits': 0, 'misses': 0}
+	_max_keyword_chains: ClassVar[int] = 1_000
+
+	@lazy_classattr
+	def empty_series(cls) -> pd.Series:
+		return pd.Series(None, index=cls.__slots__)
 
-	empty_series: ClassVar[pd.Series] = pd.Series(None, index=__slots__)
+	@lazy_classattr
+	def _date_store(cls) -> DateStore:
+		return DateStore()
 
 	acronym: str
 	id: int
 	desc: str
 	year: int
-	dates: Dates[datetime.datetime]
-	orig: Dates[bool]
+	dates: DateValues
+	orig: DateFlags
 	link: str
 	url_cfp: str | None
 	date_errors: bool | None
@@ -740,8 +1492,9 @@ class CallForPapers(ConfMetaData):
 		self.id = id_
 		self.desc = desc
 		self.year = int(year)
-		self.dates = Dates()
-		self.orig = Dates()
+		row = CallForPapers._date_store.add_row()
+		self.dates = DateValues(CallForPapers._date_store, row)
+		self.orig = DateFlags(CallForPapers._date_store, row)
 		self.link = link or '(missing)'
 		self.url_cfp = url_cfp
 		self.date_errors = None
@@ -751,10 +1504,14 @@ class CallForPapers(ConfMetaData):
 	def build(cls, acronym: str, year: int | str, id_: int | None = None, desc: str = '',
 			   url_cfp: str | None = None, link: str | None = None):
 		cfp_id = CallForPapers._fill_id if id_ is None else id_
-		try:
-			return CallForPapers._cache[cfp_id]
-		except KeyError:
-			pass
+		cached = CallForPapers._cache.get(cfp_id)
+		if isinstance(cached, CallForPapers):
+			return cached
+
+		if cached is not None:
+			# Rebuild from a tombstone as the cfp was first built
+			year = cached.year
+			CallForPapers._tombstones.pop(cfp_id, None)
 
 		cfp = cls(acronym, year, cfp_id, desc, url_cfp, link)
 		CallForPapers._cache.update({cfp_id: cfp})
@@ -767,49 +1524,132 @@ class CallForPapers(ConfMetaData):
 
 	@classmethod
 	def all_built_cfps(cls) -> Mapping[int, CallForPapers]:
-		return cls._cache
+		return {cfp_id: cfp for cfp_id, cfp in cls._cache.items() if isinstance(cfp, CallForPapers)}
 
 
-	def extrapolate_missing(self, prev_cfp: CallForPapers | None):
-		if pd.isna(prev_cfp) or prev_cfp is None:
-			return self
+	@classmethod
+	def discard(cls, cfp: CallForPapers, rating: float):
+		""" Shrink a rejected candidate to a tombstone in the cache, unless it is accepted or fetched
+
+		Accepted cfps are needed for the output. Fetched cfps are kept too, with or without date errors: getting their
+		dates back means parsing their page again, their parsed dates can be checked again with `~validate_dates`, and
+		those with date errors should not be fetched and reported again. Other cfps are cheap to rebuild from the search
+		results, so only the latest `~_max_tombstones` tombstones are kept. The discarded cfp object can not access its
+		dates anymore, as their row in `~_date_store` is reused.
+		"""
+		cached = CallForPapers._cache.get(cfp.id)
+		if cached is not cfp or cfp.id in CallForPapers._accepted or cfp.date_errors is not None:
+			if isinstance(cached, CfpTombstone):
+				cached.rating = min(cached.rating, rating)
+			return
 
-		# NB: it isn't always year = this.year, e.g. the submission can be the year before the conference dates
-		year_shift = self.year - prev_cfp.year
-		assert year_shift > 0, 'Should only extrapolate from past conferences'
+		CallForPapers._cache[cfp.id] = CfpTombstone(cfp.id, cfp.year, rating)
+		row = cfp.dates.row
+		cfp.dates.detach()
+		cfp.orig.detach()
+		CallForPapers._date_store.release(row)
 
-		if self.link == '(missing)':
-			self.link = prev_cfp.link
+		CallForPapers._tombstones[cfp.id] = None
+		if len(CallForPapers._tombstones) > CallForPapers._max_tombstones:
+			oldest = next(iter(CallForPapers._tombstones))
+			del CallForPapers._tombstones[oldest], CallForPapers._cache[oldest]
 
-		if self.url_cfp is None:
-			self.url_cfp = prev_cfp.url_cfp
 
-		# direct extrapolations to previous cfp + year_shift
-		for field in ('conf_start', 'submission'):
-			if field in self.dates or field not in prev_cfp.dates:
-				continue
-			n = Dates.__slots__.index(field)
-			try:
-				self.dates[field] = prev_cfp.dates[field].replace(year=prev_cfp.dates[field].year + year_shift)
-			except ValueError:
-				assert prev_cfp.dates[field].month == 2 and prev_cfp.dates[field].day == 29
-				self.dates[field] = prev_cfp.dates[field].replace(year=prev_cfp.dates[field].year + year_shift, day=28)
+	@classmethod
+	def cache_summary(cls) -> str:
+		""" Describe the contents of the cache """
+		tombstones = sum(isinstance(cfp, CfpTombstone) for cfp in cls._cache.values())
+		return (f'Cached {len(cls._cache) - tombstones} cfps in full ({len(cls._accepted)} accepted) '
+				f'and {tombstones} rejected candidates as tombstones')
 
-			self.orig[field] = False
 
-		# extrapolate by keeping offset with other date
-		extrapolate_from = {
-			'conf_start': {'conf_end', 'camera_ready'},
-			'submission': {'abstract', 'notification'},
-		}
-		for orig, fields in extrapolate_from.items():
-			if orig not in self.dates or orig not in prev_cfp.dates:
-				continue
-			for field in (fields - self.dates.keys()) & prev_cfp.dates.keys():
-				self.dates[field] = self.dates[orig] + (prev_cfp.dates[field] - prev_cfp.dates[orig])
-				self.orig[field] = False
+	@staticmethod
+	def date_rows(cfps: Iterable[CallForPapers]) -> np.ndarray:
+		""" Return the rows of the cfps’ dates in `~_date_store` """
+		rows = np.fromiter((cfp.dates.row for cfp in cfps), dtype=np.int64)
+		if (rows < 0).any():
+			raise ReferenceError('Dates of a discarded cfp')
+		return rows
 
-		return self
+
+	@staticmethod
+	def _add_years(dates: np.ndarray, years: np.ndarray) -> np.ndarray:
+		""" Add years to datetime64[D] dates, as `datetime.date.replace` would, with 29 February becoming the 28th """
+		month = dates.astype('datetime64[M]')
+		shifted_month = month + 12 * years
+		# Only February has a varying length: clamp to the last day of the shifted month
+		return np.minimum(shifted_month.astype('datetime64[D]') + (dates - month.astype('datetime64[D]')),
+						  (shifted_month + 1).astype('datetime64[D]') - 1)
+
+
+	@classmethod
+	def extrapolate_missing_batch(cls, cfps: Sequence[CallForPapers], prev: np.ndarray):
+		""" Fill in the missing dates of each cfps[i] from those of cfps[prev[i]], on date columns for all cfps at once
+
+		The conference start and submission are the previous ones shifted by the difference in years, then the other
+		dates keep their offset to those: conference end and camera ready to the start, abstract and notification to the
+		submission. Filled in dates are marked as not original. A missing link or cfp url is the previous one.
+
+		prev holds -1 where there is no previous cfp, and otherwise always points to an earlier position. A cfp is only
+		extrapolated once its previous cfp is, so extrapolations carry over.
+		"""
+		column = DateStore.column
+		store_rows = cls.date_rows(cfps)
+		dates = CallForPapers._date_store.dates[store_rows]
+		filled = np.zeros(dates.shape, dtype=bool)
+		year = np.fromiter((cfp.year for cfp in cfps), dtype=np.int64, count=len(cfps))
+		link = np.array([cfp.link for cfp in cfps], dtype=object)
+		url_cfp = np.array([cfp.url_cfp for cfp in cfps], dtype=object)
+
+		# Number of previous cfps to extrapolate from before each cfp, which gives the order of extrapolation
+		depth = np.zeros(len(cfps), dtype=np.int64)
+		has_prev = prev >= 0
+		for _ in range(len(cfps)):
+			new_depth = np.where(has_prev, depth[prev] + 1, 0)
+			if np.array_equal(new_depth, depth):
+				break
+			depth = new_depth
+
+		for step in range(1, depth.max(initial=0) + 1):
+			rows = np.flatnonzero(depth == step)
+			cur, old = dates[rows], dates[prev[rows]]
+
+			# NB: it isn't always year = this.year, e.g. the submission can be the year before the conference dates
+			year_shift = year[rows] - year[prev[rows]]
+			assert (year_shift > 0).all(), 'Should only extrapolate from past conferences'
+
+			link[rows] = np.where(link[rows] == '(missing)', link[prev[rows]], link[rows])
+			no_url = np.fromiter((url is None for url in url_cfp[rows]), dtype=bool, count=len(rows))
+			url_cfp[rows] = np.where(no_url, url_cfp[prev[rows]], url_cfp[rows])
+
+			# direct extrapolations to previous cfp + year_shift
+			for field in (column['conf_start'], column['submission']):
+				fill = np.isnat(cur[:, field]) & ~np.isnat(old[:, field])
+				cur[fill, field] = cls._add_years(old[fill, field], year_shift[fill])
+				filled[rows[fill], field] = True
+
+			# extrapolate by keeping offset with other date
+			extrapolate_from = {
+				'conf_start': {'conf_end', 'camera_ready'},
+				'submission': {'abstract', 'notification'},
+			}
+			for orig, fields in extrapolate_from.items():
+				known = ~np.isnat(cur[:, column[orig]]) & ~np.isnat(old[:, column[orig]])
+				for field in map(column.__getitem__, fields):
+					fill = known & np.isnat(cur[:, field]) & ~np.isnat(old[:, field])
+					cur[fill, field] = cur[fill, column[orig]] + (old[fill, field] - old[fill, column[orig]])
+					filled[rows[fill], field] = True
+
+			dates[rows] = cur
+
+		# Write back filled-in values to the cfps
+		for row in np.flatnonzero(has_prev).tolist():
+			cfps[row].link, cfps[row].url_cfp = link[row], url_cfp[row]
+
+		orig = CallForPapers._date_store.orig[store_rows]
+		orig[filled] = 0
+		CallForPapers._date_store.dates[store_rows] = dates
+		CallForPapers._date_store.orig[store_rows] = orig
 
 
 	@classmethod
@@ -839,163 +1679,192 @@ class CallForPapers(ConfMetaData):
 		f = f'cache/cfp_{self.acronym.replace("/", "_")}-{self.year}-{self.id}.html'
 		self._parse_cfp(RequestWrapper.get_soup(self.url_cfp, f))
 
-		try:
-			if warn := self.verify_conf_dates():
-				clean_print(warn)
-				CallForPapers._errors.append(f'{warn.replace(":", ";", 1)};{self.url_cfp};corrected')
-
-		except CFPCheckError as err:
-			clean_print(f'> {err}' if debug else err)
-			CallForPapers._errors.append(
-				f'{str(err).replace(":", ";", 1)}: no satisfying correction heuristic;{self.url_cfp};ignored'
-			)
-			self.date_errors = True
-
-		try:
-			if warn := self.verify_submission_dates():
-				clean_print(warn)
-				CallForPapers._errors.append(f'{warn.replace(":", ";", 1)};{self.url_cfp};corrected')
-
-		except CFPCheckError as err:
-			clean_print(f'> {err}' if debug else err)
-			CallForPapers._errors.append(
-				f'{str(err).replace(":", ";", 1)}: no satisfying correction heuristic;{self.url_cfp};ignored'
-			)
-			self.date_errors = True
+		CallForPapers._date_store.parsed[self.dates.row] = CallForPapers._date_store.dates[self.dates.row]
+		self.check_dates([self], debug=debug)
 
 		return self
 
 
 	@classmethod
-	def _flip_day_month(cls, start: datetime.date, end: datetime.date):
-		""" Fix a classic error of writing mm-dd-yyyy instead of dd-mm-yyyy by flipping day and month
+	def check_dates(cls, cfps: Sequence[CallForPapers], debug: bool = False):
+		""" Validate the dates of the cfps, apply the fixes, and report the issues """
+		report = cls.validate_dates(cfps, apply=True)
+		for cfp, status, message in zip(report['cfp'], report['status'], report['message']):
+			if status == 'corrected':
+				clean_print(message)
+				CallForPapers._errors.append(f'{message.replace(":", ";", 1)};{cfp.url_cfp};corrected')
+			else:
+				clean_print(f'> {message}' if debug else message)
+				CallForPapers._errors.append(
+					f'{message.replace(":", ";", 1)}: no satisfying correction heuristic;{cfp.url_cfp};ignored'
+				)
 
-		raises:
-			ValueError: Invalid dates (typically a day was over 12), or resulting dates don’t make sense
-		"""
-		flip_start = start.replace(day=start.month, month=start.day)
-		flip_end = end.replace(day=end.month, month=end.day)
 
-		if flip_start > flip_end or flip_end >= flip_start + datetime.timedelta(days=10):
-			raise ValueError('Resulting dates not fitting for conference interval')
+	@staticmethod
+	def _split_dates(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+		""" Return the year, month and day of datetime64[D] dates, as integer arrays """
+		month = dates.astype('datetime64[M]')
+		return (dates.astype('datetime64[Y]').astype(np.int64) + 1970, month.astype(np.int64) % 12 + 1,
+				(dates - month.astype('datetime64[D]')).astype(np.int64) + 1)
 
-		return flip_start, flip_end
 
+	@staticmethod
+	def _make_dates(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+		""" Return datetime64[D] dates from their year, month and day, and the mask of valid dates """
+		valid = (month >= 1) & (month <= 12) & (day >= 1)
+		month_start = ((year - 1970) * 12 + np.clip(month, 1, 12) - 1).astype('datetime64[M]')
+		month_days = ((month_start + 1).astype('datetime64[D]') - month_start.astype('datetime64[D]')).astype(np.int64)
+		dates = month_start.astype('datetime64[D]') + (np.clip(day, 1, None) - 1)
+		return dates, valid & (day <= month_days)
 
-	def verify_conf_dates(self) -> str | None:
-		""" Check coherence of conference start and end dates
 
-		returns:
-			A message describing fixed issues, if any
+	@classmethod
+	def _flip_day_month(cls, start: np.ndarray, end: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+		""" Fix a classic error of writing mm-dd-yyyy instead of dd-mm-yyyy by flipping day and month
 
-		raises:
-			CPFCheckError: An error with no satisfying correction heuristic was encountered
+		returns:
+			The flipped start and end dates, and the mask of the flips that are valid dates (typically a day was over
+			12 otherwise) and make sense as conference intervals
 		"""
-		if not {'conf_start', 'conf_end'} <= self.dates.keys():
-			return None
+		start_year, start_month, start_day = cls._split_dates(start)
+		end_year, end_month, end_day = cls._split_dates(end)
+		flip_start, valid_start = cls._make_dates(start_year, start_day, start_month)
+		flip_end, valid_end = cls._make_dates(end_year, end_day, end_month)
 
-		err = []
-		nfixes = 0
-		start, end = self.dates['conf_start'], self.dates['conf_end']
+		fits = (flip_start <= flip_end) & (flip_end < flip_start + np.timedelta64(10, 'D'))
+		return flip_start, flip_end, valid_start & valid_end & fits
 
-		# Assuming no conference over new year's eve, so year should match with both dates
-		if start.year != self.year or end.year != self.year:
-			err.append('not in correct year')
-			start, end = start.replace(year=self.year), end.replace(year=self.year)
-			nfixes += 1
 
-		if end < start:
-			err.append('end before start')
-			try:
-				start, end = self._flip_day_month(start, end)
-			except ValueError:
-				# if that'start no good, just swap start and end
-				end, start = start, end
-			nfixes += 1
-
-		if end - start > datetime.timedelta(days=20):
-			err.append('too far apart')
-			try:
-				start, end = self._flip_day_month(start, end)
-			except ValueError:
-				pass  # Don’t increment nfixes
-			else:
-				nfixes += 1
-
-		if not err:
-			return None
-
-		diag = (f'{self.acronym} {self.year} ({self.dates["conf_start"]} -- {self.dates["conf_end"]}): '
-				f'Conferences dates are {" and ".join(err)}')
-
-		if nfixes < len(err):
-			raise CFPCheckError(diag)
+	@classmethod
+	def validate_dates(cls, cfps: Sequence[CallForPapers], typical_delays: Mapping[str, tuple[int, int]] | None = None,
+					   delete_on_err: AbstractSet[str] = frozenset({'camera_ready'}), apply: bool = False) -> pd.DataFrame:
+		""" Check the coherence of the dates parsed from the cfps’ pages, for all cfps at once
 
-		# Use corrected dates, taking care to mark as guesses
-		self.dates.update({'conf_start': start, 'conf_end': end})
-		self.orig['conf_start'] = self.orig['conf_end'] = False
-		return f'{diag}: using {start} -- {end} instead'
+		Conference start and end dates are checked first: they should be in the cfp’s year, in order, and close to each
+		other. Then the delay from each deadline to the conference start should be at most 1 year and 2.5 months. Each
+		rule has a correction heuristic: using the cfp’s year, flipping days and months, and shifting deadlines by
+		years into their typical delays (by default `~_typical_delays`). Uncorrectable dates in delete_on_err are
+		removed instead. Checks without a satisfying correction for all their errors are ignored.
 
+		This only uses the parsed dates in `~_date_store`, so it can be rerun on all the fetched cfps of the cache,
+		rejected ones included (see `~discard`), e.g. with other delays.
 
-	def verify_submission_dates(self, delete_on_err: set[str] = {'camera_ready'}) -> str | None:
-		""" Check coherence of submission dates, in terms of delay from a deadline to conference start
+		args:
+			apply: Write the fixes to the cfps’ dates, and mark cfps with ignored checks as having date errors
 
 		returns:
-			A message describing fixed issues, if any
-
-		raises:
-			CPFCheckError: An error with no satisfying correction heuristic was encountered
+			A table with a row per cfp and check that found errors, in the order of cfps, with the cfp, the check
+			(conf or submission), its list of errors, fixes as a dict of dates (None to remove a date), status
+			(corrected or ignored) and a diagnostic message.
 		"""
-		if 'conf_start' not in self.dates or not self._typical_delays.keys() & self.dates.keys():
-			return None
+		typical_delays = cls._typical_delays if typical_delays is None else typical_delays
+		column = DateStore.column
+		dates = CallForPapers._date_store.parsed[cls.date_rows(cfps)]
+		year = np.fromiter((cfp.year for cfp in cfps), dtype=np.int64, count=len(cfps))
+		issues: dict[int, list[tuple[str, list[str], dict[str, datetime.date | None], str, str]]] = {}
 
-		err = []
-		uncorrected = set()
-		corrected = dict()
+		def describe(n: int) -> str:
+			conf_start, conf_end = (date.item() for date in dates[n, [column['conf_start'], column['conf_end']]])
+			return f'{cfps[n].acronym} {cfps[n].year} ({conf_start} -- {conf_end})'
 
-		start = self.dates['conf_start']
+		# Conference dates
+		start, end = dates[:, column['conf_start']], dates[:, column['conf_end']]
+		checked = ~np.isnat(start) & ~np.isnat(end)
 
-		for name, deadline in ((name, date) for name, date in self.dates.items() if name in self._typical_delays):
-			# Only check that deadlines happen in the year before the conference start
-			delay = (start - deadline).days
-			if delay < 0:
-				err.append(f'{name} ({deadline}) after conference start')
-			elif delay > 440:  # Accept deadlines up to 1 year and 2.5 months before conference
-				err.append(f'{name} ({deadline}) too long before conference')
-			else:
+		# Assuming no conference over new year's eve, so year should match with both dates
+		start_year, end_year = cls._split_dates(start)[0], cls._split_dates(end)[0]
+		wrong_year = checked & ((start_year != year) | (end_year != year))
+		fix_start = np.where(wrong_year, cls._add_years(start, np.where(wrong_year, year - start_year, 0)), start)
+		fix_end = np.where(wrong_year, cls._add_years(end, np.where(wrong_year, year - end_year, 0)), end)
+		nfixes = wrong_year.astype(np.int64)
+
+		# If flipping is no good, just swap start and end
+		end_before_start = checked & (fix_end < fix_start)
+		flip_start, flip_end, flipped = cls._flip_day_month(fix_start, fix_end)
+		fix_start, fix_end = (np.where(end_before_start, np.where(flipped, flip_start, fix_end), fix_start),
+							  np.where(end_before_start, np.where(flipped, flip_end, fix_start), fix_end))
+		nfixes += end_before_start
+
+		too_far_apart = checked & (fix_end - fix_start > np.timedelta64(20, 'D'))
+		flip_start, flip_end, flipped = cls._flip_day_month(fix_start, fix_end)
+		fix_start = np.where(too_far_apart & flipped, flip_start, fix_start)
+		fix_end = np.where(too_far_apart & flipped, flip_end, fix_end)
+		nfixes += too_far_apart & flipped
+
+		errors = np.stack([wrong_year, end_before_start, too_far_apart], axis=1)
+		for n in np.flatnonzero(errors.any(axis=1)).tolist():
+			err = [msg for msg, has_err in zip(('not in correct year', 'end before start', 'too far apart'), errors[n])
+				   if has_err]
+			diag = f'{describe(n)}: Conferences dates are {" and ".join(err)}'
+
+			if nfixes[n] < len(err):
+				issues.setdefault(n, []).append(('conf', err, {}, 'ignored', diag))
 				continue
 
-			# If shifting the year gets us into the “typical” delay, use that date and mark as a guess
-			# Typical mistake for a conf in the first half of year Y, all dates are reported as year Y
-			# even if they should be previous year.
-			shifted = deadline.replace(year=deadline.year + int(delay // 365.2425))
-			shifted_delay = start - shifted
-
-			lo, hi = self._typical_delays[name]
-			if hi >= shifted_delay.days >= lo:
-				corrected[name] = shifted
-			else:
-				err.append(f'{err.pop()} (shifted: {shifted_delay.days}d)')
-				uncorrected.add(name)
-
-		if not err:
-			return None
+			fixes = {'conf_start': fix_start[n].item(), 'conf_end': fix_end[n].item()}
+			issues.setdefault(n, []).append(('conf', err, fixes, 'corrected',
+											 f'{diag}: using {fixes["conf_start"]} -- {fixes["conf_end"]} instead'))
+			dates[n, column['conf_start']], dates[n, column['conf_end']] = fix_start[n], fix_end[n]
+
+		# Submission dates, only checking that deadlines happen in the year before the conference start
+		start = dates[:, column['conf_start']]
+		deadline_fields = [field for field in Dates.fields if field in typical_delays]
+		deadlines = dates[:, [column[field] for field in deadline_fields]]
+		checked = ~np.isnat(start)[:, np.newaxis] & ~np.isnat(deadlines)
+		delay = np.where(checked, (start[:, np.newaxis] - deadlines).astype(np.int64), 0)
+
+		# Accept deadlines up to 1 year and 2.5 months before conference
+		after_start = checked & (delay < 0)
+		too_long_before = checked & (delay > 440)
+
+		# If shifting the year gets us into the “typical” delay, use that date and mark as a guess
+		# Typical mistake for a conf in the first half of year Y, all dates are reported as year Y
+		# even if they should be previous year.
+		shifted = cls._add_years(deadlines, np.floor_divide(delay, 365.2425).astype(np.int64))
+		shifted_delay = (start[:, np.newaxis] - shifted).astype(np.int64)
+		lo, hi = (np.array([typical_delays[field][bound] for field in deadline_fields]) for bound in (0, 1))
+		correctable = (lo <= shifted_delay) & (shifted_delay <= hi)
+
+		for n in np.flatnonzero((after_start | too_long_before).any(axis=1)).tolist():
+			err, fixes, uncorrected = [], {}, set()
+			for k, field in enumerate(deadline_fields):
+				if not after_start[n, k] and not too_long_before[n, k]:
+					continue
+				when = 'after conference start' if after_start[n, k] else 'too long before conference'
+				err.append(f'{field} ({deadlines[n, k].item()}) {when}')
+				if correctable[n, k]:
+					fixes[field] = shifted[n, k].item()
+				else:
+					err.append(f'{err.pop()} (shifted: {shifted_delay[n, k]}d)')
+					uncorrected.add(field)
 
-		diag = (f'{self.acronym} {self.year} ({self.dates["conf_start"]} -- {self.dates["conf_end"]}): '
-			    f'Submission dates issues: {" and ".join(err)}')
+			diag = f'{describe(n)}: Submission dates issues: {" and ".join(err)}'
 
-		if uncorrected - delete_on_err:
-			raise CFPCheckError(diag)
+			if uncorrected - delete_on_err:
+				issues.setdefault(n, []).append(('submission', err, fixes, 'ignored', diag))
+				continue
 
-		# update with shifted dates and delete uncorrectable camera ready dates to avoid raising an error
-		self.dates.update(corrected)
-		self.orig.update({name: False for name in corrected})
-		delete_keys = uncorrected & delete_on_err
-		for key in delete_keys:
-			del self.dates[key]
+			# update with shifted dates and delete uncorrectable camera ready dates to avoid raising an error
+			fixes.update({field: None for field in uncorrected & delete_on_err})
+			using = [f'{field}={date}' if date is not None else f'no {field}' for field, date in fixes.items()]
+			issues.setdefault(n, []).append(('submission', err, fixes, 'corrected',
+											 f'{diag}: using {", ".join(using)} instead'))
+
+		if apply:
+			for n, cfp_issues in issues.items():
+				for check, _, fixes, status, _ in cfp_issues:
+					if status == 'ignored':
+						cfps[n].date_errors = True
+						continue
+					for field, date in fixes.items():
+						if date is None:
+							del cfps[n].dates[field]
+						else:
+							cfps[n].dates[field] = date
+							cfps[n].orig[field] = False
 
-		fixes = [*(f'{name}={date}' for name, date in corrected.items()), *(f'no {name}' for name in delete_keys)]
-		return f'{diag}: using {", ".join(fixes)} instead'
+		return pd.DataFrame([(cfps[n], *issue) for n, cfp_issues in sorted(issues.items()) for issue in cfp_issues],
+							columns=['cfp', 'check', 'errors', 'fixes', 'status', 'message'])
 
 
 	@classmethod
@@ -1011,35 +1880,52 @@ class CallForPapers(ConfMetaData):
 		search_f = f'cache/search_cfp_{conf.acronym.replace("/", "_")}-{year}.html'
 		soup = RequestWrapper.get_soup(cls._url_cfpsearch, search_f, params = {'q': conf.acronym, 'year': year})
 
-		cfp_list = []
+		candidates = [(cls.build(acronym, year, id_, desc, url), missing)
+					  for acronym, desc, id_, url, missing in cls._parse_search(conf, year, soup)]
+		ratings = cls.memoized_ratings(conf, [candidate for candidate, _ in candidates])
 
-		for acronym, desc, id_, url, missing in cls._parse_search(conf, year, soup):
-			candidate = cls.build(acronym, year, id_, desc, url)
-			rating = candidate.rating(conf)
-			if debug:
+		if debug:
+			for (candidate, _), rating in zip(candidates, ratings):
 				print(f'[{rating}] {candidate}')
-			total_rating = sum(rating)
-			if np.isfinite(total_rating):
-				cfp_list.append([total_rating, *rating, missing, candidate])
 
-		if not cfp_list:
-			raise CFPNotFoundError(f'No link with acceptable rating for {conf.acronym} {year}')
+		cfps = CandidateTable([candidate for candidate, _ in candidates], [sum(rating) for rating in ratings],
+							  [missing for _, missing in candidates])
+
+		accepted: list[tuple[CallForPapers, float, int]] = []
+		try:
+			accepted = cls._select_candidates(conf, year, cfps, debug=debug)
+		finally:
+			CallForPapers._accepted.update(cfp.id for cfp, _, _ in accepted)
+			for cfp, rating in zip(cfps.cfp, cfps.rating.tolist()):
+				cls.discard(cfp, rating)
+
+		yield from accepted
+
+
+	@classmethod
+	def _select_candidates(cls, conf: Conference, year: int | str, cfps: CandidateTable,
+						   debug: bool = False) -> list[tuple[CallForPapers, float, int]]:
+		""" Pick the cfp, or cfps of a multiple-deadline call, that best match the conference among the candidates
+
+		raises:
+			CFPNotFoundError: No satisfying candidate
+		"""
+		cfps = cfps.take(np.isfinite(cfps.rating))
 
-		cfps = pd.DataFrame(cfp_list, columns=['rating', 'acronym', 'type', 'org', 'topic', 'qualif', 'missing', 'cfp'])
-		cfps = cfps.set_index(cfps['cfp'].map(operator.attrgetter('id')))
+		if not len(cfps):
+			raise CFPNotFoundError(f'No link with acceptable rating for {conf.acronym} {year}')
 
-		cfp_call_types = cfps['cfp'].map(operator.attrgetter('call_type'))
-		cfps = cfps[cfp_call_types.isna() | cfp_call_types.eq('paper')]
+		cfps = cfps.take([cfp.call_type is None or cfp.call_type == 'paper' for cfp in cfps.cfp])
 
 		if not len(cfps):
 			raise CFPNotFoundError(f'No full paper call for {conf.acronym} {year}')
 
 		# We expect multiple-deadline conferences to have all their calls score (a) best and (b) close to each other
 		delta = 5
-		cfps = cfps[cfps['rating'].le(cfps['rating'].min() + delta)]
+		cfps = cfps.take(cfps.rating <= cfps.rating.min() + delta)
 		# Fetch detailed call infos for comparison, remove cfps with uncorrectable date errors
-		cfps['cfp'] = cfps['cfp'].map(functools.partial(cls.fetch_cfp_data, debug=debug))
-		cfps = cfps[cfps['cfp'].map(operator.attrgetter('date_errors')).eq(False)]
+		cfps.cfp[:] = [cfp.fetch_cfp_data(debug=debug) for cfp in cfps.cfp]
+		cfps = cfps.take([cfp.date_errors is False for cfp in cfps.cfp])
 
 		if len(cfps) < 1:
 			raise CFPNotFoundError(f'No link with valid dates for {conf.acronym} {year}')
@@ -1047,23 +1933,98 @@ class CallForPapers(ConfMetaData):
 		if len(cfps) > 1:
 			matched_deadlines = cls.detect_multiple_deadlines(cfps)
 			if matched_deadlines is None:
-				matched_deadlines = [cfps['rating'].idxmin()]
+				matched_deadlines = [cfps.best()]
 		else:
-			matched_deadlines = cfps.index
+			matched_deadlines = range(len(cfps))
 
-		for idx in matched_deadlines:
-			yield cast(tuple[CallForPapers, float, int], tuple(cfps.loc[idx, ['cfp', 'rating', 'missing']]))
+		return [cfps.row(row) for row in matched_deadlines]
 
 
 	@classmethod
-	def detect_multiple_deadlines(cls, cfps: pd.DataFrame):
+	def _chain_lengths(cls, submission: np.ndarray, notif: np.ndarray,
+					   conf_start: np.datetime64) -> tuple[np.ndarray, np.ndarray]:
+		""" Return which calls can follow each other in a chain, and the length of the longest chain starting at each call
+
+		Calls must be sorted by submission. In a chain, each call's notification comes no later than the next call's
+		submission, and the last call's notification no later than the conference start. Missing dates are
+		incompatible with everything. Lengths are computed backwards, in O(n²), and are 0 for calls that start no chain.
+		"""
+		n = len(submission)
+		compatible = np.triu(notif[:, np.newaxis] <= submission[np.newaxis, :], k=1)
+		ends = notif <= conf_start
+
+		longest = np.zeros(n, dtype=np.int64)
+		for i in range(n - 1, -1, -1):
+			following = longest[compatible[i]]
+			longest[i] = max(1 + following.max(initial=0) if following.any() else 0, int(ends[i]))
+
+		return compatible, longest
+
+
+	@classmethod
+	def _max_compatible_chains(cls, submission: np.ndarray, notif: np.ndarray,
+							   conf_start: np.datetime64) -> Iterator[list[int]]:
+		""" Generate all longest chains of compatible calls, as lists of positions in lexicographic order.
+
+		See `_chain_lengths` for the compatibility of calls. Chains are enumerated by only following calls that start a
+		chain of exactly the remaining length, so each step leads to a chain.
+		"""
+		compatible, longest = cls._chain_lengths(submission, notif, conf_start)
+
+		def chains_from(i: int, length: int) -> Iterator[list[int]]:
+			if length == 1:
+				yield [i]
+				return
+			for j in np.flatnonzero(compatible[i] & (longest == length - 1)).tolist():
+				for chain in chains_from(j, length - 1):
+					yield [i, *chain]
+
+		max_length = longest.max(initial=0)
+		for start in np.flatnonzero(longest == max_length).tolist() if max_length else []:
+			yield from chains_from(start, max_length)
+
+
+	@classmethod
+	def _first_allowed_chain(cls, submission: np.ndarray, notif: np.ndarray, conf_start: np.datetime64,
+							 allowed: Callable[[int], np.ndarray]) -> list[int] | None:
+		""" Return the first of the `_max_compatible_chains` whose calls are all allowed at their position, if any
+
+		allowed(start) is an array of whether each call may be at each position of a chain starting at position start,
+		with a column per position. Rather than enumerating chains, which are exponentially many when calls are
+		duplicated, the calls that can complete an allowed chain are found backwards from the last position, in
+		O(n² × length) for each start.
+		"""
+		compatible, longest = cls._chain_lengths(submission, notif, conf_start)
+		max_length = longest.max(initial=0)
+
+		for start in np.flatnonzero(longest == max_length).tolist() if max_length else []:
+			# Call i can be at position k of a longest chain only if it starts a chain of the remaining length
+			completes = allowed(start)[:, :max_length] & (longest[:, np.newaxis] == max_length - np.arange(max_length))
+			for k in range(max_length - 2, -1, -1):
+				completes[:, k] &= (compatible & completes[np.newaxis, :, k + 1]).any(axis=1)
+
+			if completes[start, 0]:
+				chain = [start]
+				for k in range(1, max_length):
+					chain.append(int(np.flatnonzero(compatible[chain[-1]] & completes[:, k])[0]))
+				return chain
+
+		return None
+
+
+	@classmethod
+	def detect_multiple_deadlines(cls, cfps: CandidateTable) -> list[int] | None:
+		""" Return the rows of the candidate calls that are successive rounds of a multiple-deadline call, if any """
+		column = DateStore.column
+		dates = cfps.dates()
+		submission, notification = dates[:, column['submission']], dates[:, column['notification']]
+
 		# Disqualify (as legit full paper deadline) if submission ≤ 2 months to conf start.
 		# Likely to be another type of submission.
-		dates = cfps['cfp'].apply(lambda cfp: pd.Series(cfp.dates, index=Dates.__slots__, dtype='datetime64[ns]'))
 
 		# NB. There seem to be 2 entirely synonymous yet different ICDM (Industrial Conference on Data Mining).
 		# TODO: compare links
-		# links = cfps['cfp'].apply(operator.attrgetter('link'))
+		# links = [cfp.link for cfp in cfps.cfp]
 
 		# Issues comparing links
 		# - case ( http://www.ITNG.info vs https://itng.info/ )
@@ -1076,96 +2037,106 @@ class CallForPapers(ConfMetaData):
 		#    -> ignore values
 
 
-		delay = pd.Timedelta(days=61)
-		compat_deadlines = (dates['submission'].notna() & dates['conf_start'].notna() &
-							dates['conf_start'].sub(dates['submission']).gt(delay))
+		delay = np.timedelta64(61, 'D')
+		# NaT comparisons are always false, so missing dates are never compatible
+		compat_deadlines = dates[:, column['conf_start']] - submission > delay
 
 		if compat_deadlines.sum() <= 1:
 			return None
 
 		# Remove entries with all info (dates etc.) redundant with another call
-		for a, b in zip(*(cfps.index[compat_deadlines][idx] for idx in np.triu_indices(compat_deadlines.sum(), k=1))):
+		missing = np.isnat(dates)
+		for a, b in zip(*(np.flatnonzero(compat_deadlines)[idx] for idx in np.triu_indices(compat_deadlines.sum(), k=1))):
 			if not compat_deadlines[a] or not compat_deadlines[b]:
 				continue
-			same_dates, na_a, na_b = dates.loc[a].eq(dates.loc[b]), dates.loc[a].isna(), dates.loc[b].isna()
-			if all(same_dates | na_a | na_b):
-				compat_deadlines[b if na_a.sum() < na_b.sum() else b] = False
+			if all((dates[a] == dates[b]) | missing[a] | missing[b]):
+				compat_deadlines[b] = False
 
 		if compat_deadlines.sum() <= 1:
 			return None
 
-		deadline = dates['submission'][compat_deadlines].sort_values().to_frame()
-		conf_start = dates.loc[cfps['rating'].idxmin(), 'conf_start']
+		deadline = np.flatnonzero(compat_deadlines)
+		deadline = deadline[np.argsort(submission[deadline], kind='stable')]
+		conf_start = dates[cfps.best(), column['conf_start']]
 
 		# Use our best guess for end of call if not provided. Typical duration is 4 weeks to 3 months.
-		deadline['notif'] = dates['notification'].fillna(dates['submission'] + pd.Timedelta(days=42))
+		notif = np.where(missing[:, column['notification']], submission + np.timedelta64(42, 'D'), notification)
 
 		# Split into deadline-compatible groups. E.g., 2 cfp (A, B) + 1 student competition call (C), with B and C overlapping:
 		# We need to be able to pick between [A, B] and [A, C]
 		# TODO: is this still a thing now we only look at papers?
 		# –> generate all inter-compatible sub-sequences (of max length, with length > 2) & keep valid ones
 		# NB. This step removes most (all?) duplicate postings of the same call with extended/updated dates.
-		for n in range(len(deadline), 1, -1):
-			maxlen_candidates = []
-			for subset in map(list, itertools.combinations(deadline.index, n)):
-				if all(deadline.loc[subset, 'notif'] <= deadline.loc[subset, 'submission'].shift(-1, fill_value=conf_start)):
-					maxlen_candidates.append(subset)
+		chains = cls._max_compatible_chains(submission[deadline], notif[deadline], conf_start)
+		maxlen_candidates = PeekIter(deadline[chain].tolist() for chain in chains)
+		try:
+			first_candidate = maxlen_candidates.peek()
+		except IndexError:
+			first_candidate = []
 
-			if maxlen_candidates:
-				break
-		else:
+		if len(first_candidate) < 2:
 			# No length > subset 1 with all-compatible deadlines
 			return None
-		assert maxlen_candidates
 
-		# Now we need to pick one of maxlen_candidates
-		for subset in maxlen_candidates:
-			sorted_dates = dates.loc[subset, 'submission'].sort_values()
+		# Expected ordinals
+		ordinals = [*cls._ordinal_list, *itertools.repeat(None, len(first_candidate))]
 
-			topic = cfps.loc[subset, 'cfp'].map(operator.attrgetter('topic_keywords')).explode()
+		# Whether each call has the number of each position in a chain, and keywords of a multiple-deadline call
+		match_num = np.array([[bool(cfps.cfp[row].number & {ordinals[n], str(n + 1), inflection.ordinalize(n + 1)})
+							   for n in range(len(first_candidate))] for row in deadline.tolist()])
+		match_kw = np.array([not {'round', 'deadline', 'submission'}.isdisjoint(cfps.cfp[row].topic_keywords)
+							 for row in deadline.tolist()])
 
-			# Get words that appear uniquely in each cfp, and check if there is a season in each
-			topic_diff = topic.replace({'autumn': 'fall'}).drop_duplicates(keep=False).rename('topic_unique')
-			topic_season = topic_diff.isin({'fall', 'winter', 'spring', 'summer'}).groupby(level=0).any()
-			if all(topic_season.reindex(subset, fill_value=False)):
-				return sorted_dates.index
-
-			# Expected ordinals
-			ordinals = pd.DataFrame({
-				'ordinal': cls._ordinal_list[:len(subset)],
-				'number': map(str, range(1, len(subset) + 1)),
-				'both': map(inflection.ordinalize, range(1, len(subset) + 1)),
-			}, index=sorted_dates.index)
+		def numbered(start: int) -> np.ndarray:
+			""" Whether each call is at a position matching its number and keywords, or is as early as the first call """
+			is_first_call = submission[deadline] == submission[deadline[start]]
+			return (match_num == match_kw[:, np.newaxis]) & (match_num | is_first_call[:, np.newaxis])
 
-			# Some write “r1”, “r2”, etc.
-			short_round = ordinals['number'].radd('r')
-			short_round_match = topic_diff == topic_diff.index.to_series().map(short_round.to_dict())
-			if short_round_match.groupby(level=0).any().all():
-				return sorted_dates.index
+		# Chains with the numbers of their rounds are found without enumerating all chains, as duplicated calls make
+		# them exponentially many. Only the first `_max_keyword_chains` are enumerated to check the other keywords.
+		numbered_chain = cls._first_allowed_chain(submission[deadline], notif[deadline], conf_start, numbered)
+		numbered_subset = deadline[numbered_chain].tolist() if numbered_chain is not None else None
 
-			is_first_call = sorted_dates.eq(sorted_dates.min())
+		# Now we need to pick one of maxlen_candidates, whose rows are already sorted by submission date
+		for subset in itertools.islice(maxlen_candidates, cls._max_keyword_chains):
+			if subset == numbered_subset:
+				return subset
 
-			exp = ordinals.agg(set, axis='columns')
-			num = cfps.loc[subset, 'cfp'].map(operator.attrgetter('number')).rename('number')
-			match_num = num.combine(exp, set.intersection).str.len().gt(0)
-			match_kw = topic.isin({'round', 'deadline', 'submission'}).groupby(level=0).any().reindex(sorted_dates.index, fill_value=False)
+			topic = {row: cfps.cfp[row].topic_keywords for row in subset}
 
-			if all(match_num == match_kw) and all(match_num | is_first_call):
-				return sorted_dates.index
+			# Get words that appear uniquely in each cfp, and check if there is a season in each
+			# A cfp without any keywords counts as having a single placeholder word, that never matches.
+			topic_words = {row: ['fall' if word == 'autumn' else word for word in words] or [None]
+						   for row, words in topic.items()}
+			word_count = collections.Counter(itertools.chain.from_iterable(topic_words.values()))
+			topic_diff = {row: [word for word in words if word_count[word] == 1] for row, words in topic_words.items()}
+			topic_diff = {row: words for row, words in topic_diff.items() if words}
 
-		cfp = cfps.loc[maxlen_candidates[0][0], 'cfp']
-		if (cfp.acronym, cfp.year, len(dates)) in cls._hardcoded_exceptions:
-			return dates.index
+			if all(topic_diff.get(row, ()) and not {'fall', 'winter', 'spring', 'summer'}.isdisjoint(topic_diff[row])
+				   for row in subset):
+				return subset
+
+			# Some write “r1”, “r2”, etc.
+			if all(f'r{subset.index(row) + 1}' in words for row, words in topic_diff.items()):
+				return subset
+
+		if numbered_subset is not None:
+			return numbered_subset
+
+		cfp = cfps.cfp[first_candidate[0]]
+		if (cfp.acronym, cfp.year, len(cfps)) in cls._hardcoded_exceptions:
+			return list(range(len(cfps)))
 
 		# Otherwise, warn
-		start, end = dates.loc[maxlen_candidates[0][0], ['conf_start', 'conf_end']]
+		start, end = map(pd.Timestamp, dates[first_candidate[0], [column['conf_start'], column['conf_end']]])
 		err = (
-			f'{cfp.acronym} {cfp.year} ({start} -- {end})', f'{len(maxlen_candidates[0])} compatible deadlines '
+			f'{cfp.acronym} {cfp.year} ({start} -- {end})', f'{len(first_candidate)} compatible deadlines '
 			f'without keywords confirming multiple-deadline calls;{cfp.url_cfp};ignored'
 		)
 
 		clean_print(': '.join(err))
 		CallForPapers._errors.append('; '.join(err))
+		return None
 
 
 	@classmethod
@@ -1183,24 +2154,60 @@ class CallForPapers(ConfMetaData):
 	@classmethod
 	def columns(cls) -> list[str]:
 		""" Return column titles for cfp data.  """
-		return list(cls._date_names) + ['orig_' + d for d in Dates.__slots__] + ['Link', 'CFP url']
+		return list(cls._date_names) + ['orig_' + d for d in Dates.fields] + ['Link', 'CFP url']
 
 
 	def values(self) -> list[datetime.datetime | bool | str | None]:
 		""" Return values of cfp data, in column order.  """
-		return [*(self.dates.get(f, None) for f in Dates.__slots__),
-				*(self.orig.get(f, None) for f in Dates.__slots__), self.link, self.url_cfp]
+		return [*CallForPapers._date_store.values(self.date_rows([self]))[0], self.link, self.url_cfp]
+
+
+	@classmethod
+	def batch_values(cls, cfps: Sequence[CallForPapers]) -> list[list[datetime.datetime | bool | str | None]]:
+		""" Return `~values` of each cfp, reading the dates of all cfps at once """
+		dates = CallForPapers._date_store.values(cls.date_rows(cfps))
+		return [[*cfp_dates, cfp.link, cfp.url_cfp] for cfp_dates, cfp in zip(dates, cfps)]
+
+
+	def max_date(self) -> datetime.datetime:
+		""" Get the max date in the cfp """
+		return max(self.dates.values())
+
+
+	@classmethod
+	def memoized_ratings(cls, conf: Conference, cfps: Sequence[CallForPapers]) -> list[tuple[float, ...]]:
+		""" Return `~batch_rating` of each cfp with the given conference, only computing ratings not seen before
+
+		The same cfps show up in the searches of several years, and of conferences with similar acronyms. Those are
+		close together, so the oldest ratings are forgotten past `~_max_ratings`.
+		"""
+		conf_key = (conf.acronym, conf.title)
+		ratings = [cls._ratings.get((conf_key, cfp.id)) for cfp in cfps]
+		missing = [n for n, rating in enumerate(ratings) if rating is None]
+
+		cls._rating_lookups['hits'] += len(cfps) - len(missing)
+		cls._rating_lookups['misses'] += len(missing)
+
+		if missing:
+			new_ratings = cls.batch_rating(conf, [cfps[n] for n in missing])
+			for n, rating in zip(missing, map(tuple, new_ratings.tolist())):
+				ratings[n] = cls._ratings[conf_key, cfps[n].id] = rating
+
+			for key in list(itertools.islice(cls._ratings, max(len(cls._ratings) - cls._max_ratings, 0))):
+				del cls._ratings[key]
 
+		return cast(list[tuple[float, ...]], ratings)
 
-	def max_date(self) -> datetime.datetime:
-		""" Get the max date in the cfp """
-		return max(self.dates.values())
 
+	@classmethod
+	def batch_rating(cls, conf: Conference, cfps: Sequence[CallForPapers]) -> np.ndarray:
+		""" Rate the (in)adequacy of each cfp with the given conference, as rows of an array: lower is better
 
-	def rating(self, conf: Conference) -> tuple[float, float, float, float, float]:
-		""" Rate the (in)adequacy of the cfp with the given conference: lower is better. """
-		# Just drop number (e.g. 34th intl conf...) comparison.
-		return self._difference(conf)[:-1]
+		The rating of a cfp is its `~ConfMetaData._difference` with the conference, without the number (e.g. 34th intl
+		conf...) comparison.
+		"""
+		return cls.batch_difference(InternedWordsBatch(cfps), InternedWordsBatch([conf]),
+									np.arange(len(cfps)), np.zeros(len(cfps), dtype=np.int64))[:, :-1]
 
 
 	def str_info(self) -> list[str]:
@@ -1208,7 +2215,7 @@ class CallForPapers(ConfMetaData):
 			    if attr not in {'dates', 'orig'} and (getattr(self, attr, None) or '(missing)') != '(missing)']
 		if self.dates:
 			vals.append('dates={' + ', '.join(f"{field}:{self.dates[field]}{'*' if not self.orig[field] else ''}"
-											  for field in Dates.__slots__ if field in self.dates) + '}')
+											  for field in Dates.fields if field in self.dates) + '}')
 		return vals
 
 
@@ -1520,7 +2527,7 @@ class WikicfpCFP(CallForPapers):
 				print('Error: unexpected RDF or DC data: {}'.format(xt_data))
 
 		# First pass: populate from structured metadata
-		for f, name in zip(Dates.__slots__, self._date_names):
+		for f, name in zip(Dates.fields, self._date_names):
 			try:
 				value = metadata[name]
 				if not self._is_placeholder(value):
@@ -1537,10 +2544,66 @@ class WikicfpCFP(CallForPapers):
 			self.link = metadata['source'].strip()
 
 
+class BlockingIndex:
+	""" Inverted index from blocking keys to conferences, to only compare conferences that have a chance of matching.
+
+	The keys of a conference are its upper-cased acronym and the concatenations of the first n words of its acronym,
+	so for Euro-Par we check EURO-PAR, EUROPAR and EURO. Pairs with no acronym prefix in common are disqualified by
+	`ConfMetaData._acronym_diff` anyway, so title words are not used as keys.
+
+	Conferences are identified by their row, i.e. their insertion order in the index.
+	"""
+	_postings: dict[str, list[int]]
+
+	__slots__ = ('_postings', '_size')
+
+	def __init__(self, confs: Iterable[Conference] = ()):
+		self._postings = {}
+		self._size = 0
+
+		for conf in confs:
+			self.add(conf)
+
+
+	def __len__(self) -> int:
+		return self._size
+
+
+	@classmethod
+	def keys(cls, conf: Conference) -> set[str]:
+		""" Return the acronym keys of a conference """
+		acronym = conf.acronym.upper()
+		words = ConfMetaData._sep.split(acronym)
+		return {acronym, *(''.join(words[:n + 1]) for n in range(len(words)))} - {''}
+
+
+	def add(self, conf: Conference) -> int:
+		""" Add a conference to the index and return its row """
+		row = self._size
+		self._size += 1
+
+		for key in self.keys(conf):
+			self._postings.setdefault(key, []).append(row)
+
+		return row
+
+
+	def find(self, keys: Iterable[str]) -> np.ndarray:
+		""" Return the sorted rows of conferences with any of the given acronym keys """
+		return np.unique(np.fromiter(itertools.chain.from_iterable(self._postings.get(key, ()) for key in keys),
+									 dtype=np.int64))
+
+
+	def lookup(self, conf: Conference) -> np.ndarray:
+		""" Return the sorted rows of the conferences of this index that are candidate matches for conf """
+		return self.find(self.keys(conf))
+
+
 class Ranking:
 	_historical = re.compile(r'\b(previous(ly)?|was|(from|pre|in) [0-9]{4}|merge[dr])\b', re.IGNORECASE)
 	_col_order: ClassVar[list[str]]
 	_file: ClassVar[str]
+	_snapshot_dir: ClassVar[str] = 'cache'
 
 	@classmethod
 	def get_confs(cls) -> pd.Series[Conference]:
@@ -1573,12 +2636,24 @@ class Ranking:
 
 
 	@classmethod
-	def _load_confs(cls) -> pd.DataFrame:
-		""" Load unparsed conference info from a local cache/csv file """
+	def _check_file(cls):
+		""" Raise FileNotFoundError if the local cache/csv file is missing or should be fetched again """
 		f_age = datetime.datetime.fromtimestamp(os.stat(cls._file).st_mtime)
 		if datetime.datetime.today() - f_age > datetime.timedelta(days=365):
 			raise FileNotFoundError('Cached file too old')
 
+
+	@classmethod
+	def load_metrics(cls) -> pd.DataFrame:
+		""" Load the H5 metrics of the conferences listed in a source, indexed by upper-cased acronym """
+		return pd.DataFrame(columns=list(ConferenceRegistry.h5_columns))
+
+
+	@classmethod
+	def _load_confs(cls) -> pd.DataFrame:
+		""" Load unparsed conference info from a local cache/csv file """
+		cls._check_file()
+
 		confs = pd.read_csv(cls._file, sep=';')
 		assert confs.columns.symmetric_difference(cls._col_order).empty
 		return confs
@@ -1594,10 +2669,131 @@ class Ranking:
 
 
 	@classmethod
-	def merge(cls, *confs: pd.Series[Conference], debug: list[str] | bool = False) -> pd.Series[Conference]:
-		merged_confs, *confs_to_merge = confs
-		for conf in confs_to_merge:
-			merged_confs = cls._merge(merged_confs, conf, debug=debug)
+	def _snapshot_file(cls, *sources: type[Ranking]) -> str:
+		""" Return the snapshot file name of the merged sources, from a hash of their files and of the code
+
+		raises:
+			FileNotFoundError: The file of a source is missing or should be fetched again
+		"""
+		for source in sources:
+			source._check_file()
+
+		digest = hashlib.sha256(f'{pd.__version__};{np.__version__}'.encode())
+		for file in (__file__, 'dict.txt', *(source._file for source in sources)):
+			with open(file, 'rb') as fh:
+				digest.update(hashlib.sha256(fh.read()).digest())
+
+		return os.path.join(cls._snapshot_dir, f'registry-{digest.hexdigest()[:16]}.pickle')
+
+
+	@classmethod
+	def get_merged_confs(cls, *sources: type[Ranking], debug: list[str] | bool = False) -> ConferenceRegistry:
+		""" Return the merged conferences of all sources, using a snapshot of the merge while inputs are unchanged
+
+		The snapshot is saved in the cache directory (if caching is enabled), and contains the merged Conference
+		objects with their classified words, and the global state those depend on.
+		"""
+		use_snapshot = RequestWrapper.use_cache and not debug
+		try:
+			snapshot_file = cls._snapshot_file(*sources) if use_snapshot else None
+		except FileNotFoundError:
+			snapshot_file = None
+
+		if snapshot_file is not None:
+			try:
+				with open(snapshot_file, 'rb') as fh:
+					snapshot = pickle.load(fh)
+			except FileNotFoundError:
+				pass
+			except Exception as err:
+				clean_print(f'Ignoring invalid snapshot {snapshot_file}: {err!r}')
+			else:
+				cls._restore_snapshot(snapshot)
+				print(f'Loaded {len(snapshot["confs"])} merged conferences from {snapshot_file}')
+				return snapshot['confs']
+
+		confs = cls.merge(*(source.get_confs() for source in sources), debug=debug)
+
+		# Metrics of the first source win for duplicate acronyms
+		metrics = pd.concat([source.load_metrics() for source in sources])
+		confs.join_metrics(metrics[~metrics.index.duplicated()])
+
+		if use_snapshot:
+			# Files may have been fetched again during get_confs()
+			snapshot_file = cls._snapshot_file(*sources)
+			snapshot = {'confs': confs, 'words': InternedWords._ids, 'misspelled': ConfMetaData._misspelled}
+
+			with atomic_open(snapshot_file, 'wb') as fh:
+				pickle.dump(snapshot, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+			for old_snapshot in glob.glob(os.path.join(cls._snapshot_dir, 'registry-*.pickle')):
+				if old_snapshot != snapshot_file:
+					os.remove(old_snapshot)
+
+		return confs
+
+
+	@classmethod
+	def _restore_snapshot(cls, snapshot: dict):
+		""" Restore global state needed by the conferences of a snapshot """
+		for word, conf_info in snapshot['misspelled'].items():
+			ConfMetaData._misspelled.setdefault(word, []).extend(conf_info)
+
+		# Interned words of the snapshot are only valid with the intern table they were built with
+		if not InternedWords._ids:
+			InternedWords._ids.update(snapshot['words'])
+		else:
+			for conf in snapshot['confs']:
+				conf._interned = None
+
+
+	@classmethod
+	def merge(cls, *confs: pd.Series[Conference], debug: list[str] | bool = False) -> ConferenceRegistry:
+		""" Merge sources of conferences into a single one, merging duplicate conferences and keeping unique ones.
+
+		All sources are blocked, scored and matched at once, so adding a source does not require re-comparing
+		previously merged conferences, and the order of sources only matters to break ties.
+		"""
+		all_confs = pd.concat(confs, ignore_index=True)
+		sources = np.repeat(np.arange(len(confs)), [len(series) for series in confs])
+
+		# Build all the pairs of elements we want to compare, i.e. from different sources: each source is looked up
+		# against the index of the previous sources before being added to it
+		index = BlockingIndex()
+		found_a, found_b = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+		for series in confs:
+			for row, conf in enumerate(series, start=len(index)):
+				found = index.lookup(conf)
+				found_a.append(found)
+				found_b.append(np.full(len(found), row, dtype=np.int64))
+
+			for conf in series:
+				index.add(conf)
+
+		rows_a, rows_b = np.concatenate(found_a), np.concatenate(found_b)
+		order = np.lexsort((rows_b, rows_a))
+		rows_a, rows_b = rows_a[order], rows_b[order]
+
+		# Compute the scores
+		batch = InternedWordsBatch(all_confs)
+		pair_differences = pd.DataFrame(ConfMetaData.batch_difference(batch, batch, rows_a, rows_b),
+										columns=['acronym', 'type', 'org', 'topic', 'qualif', 'num'])
+		compared_pairs = pd.DataFrame({'id_a': rows_a, 'id_b': rows_b,
+									   'score': ConfMetaData.batch_score(pair_differences.to_numpy())})
+
+		ranks = cls._pair_ranks(all_confs.to_list(), rows_a, rows_b, sources)
+		clusters, linked = cls._cluster(rows_a, rows_b, compared_pairs['score'].to_numpy(), sources, ranks)
+
+		members: dict[int, list[int]] = {}
+		for row, cluster in enumerate(clusters.tolist()):
+			members.setdefault(cluster, []).append(row)
+		conf_list = all_confs.to_list()
+		# Clusters are in order of their first row, so the stable sort keeps the source order for equal conferences
+		merged_confs = ConferenceRegistry(Conference.merge(*(conf_list[row] for row in rows))
+										  for rows in members.values()).sort()
+
+		if len(confs) > 1:
+			cls._print_merges(all_confs, index, compared_pairs, pair_differences, linked, debug=debug)
 
 		print(f'Merged conferences {" + ".join(str(len(series)) for series in confs)} = {len(merged_confs)} total'
 			  f' + {sum(map(len, confs)) - len(merged_confs)} in common')
@@ -1605,128 +2801,159 @@ class Ranking:
 
 
 	@classmethod
-	def _merge(cls, confs_a: pd.Series[Conference], confs_b: pd.Series[Conference],
-			   debug: list[str] | bool = False) -> pd.Series[Conference]:
-		""" Merge 2 sources of conferences into a single one, merging duplicate conferences and keeping unique ones. """
-		# Mapping match-acronym to conference-id
-		idx_a = pd.Series(confs_a.index, index=confs_a.map(operator.attrgetter('acronym')).str.upper(), name='id')
-		idx_b = pd.Series(confs_b.index, index=confs_b.map(operator.attrgetter('acronym')).str.upper(), name='id')
-
-		# Add for several words (possibly dash or slash-separated) the first-word variant and joined variants
-		# So for Euro-Par we’ll check EuroPar and Euro
-		multi_word_a = idx_a.index[idx_a.index.str.contains(ConfMetaData._sep)].to_series().str.split(ConfMetaData._sep)
-		idx_a = pd.concat([
-			idx_a,
-			idx_a.loc[multi_word_a.index].rename(index=multi_word_a.str.join('').to_dict()),
-			idx_a.loc[multi_word_a.index].rename(index=multi_word_a.str[0].to_dict()),
-		])
-		multi_word_b = idx_b.index[idx_b.index.str.contains(ConfMetaData._sep)].to_series().str.split(ConfMetaData._sep)
-		idx_b = pd.concat([
-			idx_b,
-			idx_b.loc[multi_word_b.index].rename(index=multi_word_b.str.join('')),
-			idx_b.loc[multi_word_b.index].rename(index=multi_word_b.str[0]),
-		])
-
-		common = idx_a.index.drop_duplicates().intersection(idx_b.index.drop_duplicates())
-		if not len(common):
-			return pd.concat([confs_a, confs_b], ignore_index=True)
-
-		# Build all the pairs of elements we want to compare
-		compared_pairs = pd.concat(ignore_index=True, objs=[
-			pd.merge(idx_a[[acronym]], idx_b[[acronym]], how='cross', suffixes=('_a', '_b')) for acronym in common
-		])
-		# Compute the scores
-		compared_pairs['score'] = compared_pairs.agg(
-			lambda row: sum(ConfMetaData._difference(confs_a[row['id_a']], confs_b[row['id_b']])),
-			axis='columns'
-		)
+	def _pair_ranks(cls, confs: Sequence[Conference], rows_a: np.ndarray, rows_b: np.ndarray,
+					sources: np.ndarray) -> np.ndarray:
+		""" Rank the candidate pairs to break ties between equal scores in `_cluster`
+
+		Pairs are listed by acronym key, in the order the keys first appear in the source of a: all the full acronyms,
+		then the words of multi-word acronyms joined, then their first words, and other acronym prefixes last. For
+		each key, the pairs are in the order of a then b in that same listing. A pair sharing several keys is ranked by
+		its first listing.
+		"""
+		def key_blocks(conf: Conference) -> dict[str, int]:
+			acronym = conf.acronym.upper()
+			words = ConfMetaData._sep.split(acronym)
+			blocks = dict.fromkeys(BlockingIndex.keys(conf), 3)
+			if len(words) > 1:
+				blocks[words[0]] = 2
+				blocks[''.join(words)] = 1
+			blocks[acronym] = 0
+			return blocks
+
+		blocks = [key_blocks(conf) for conf in confs]
+
+		# Position of each key in the listing of each source, by first appearance
+		first_listed: dict[tuple[int, str], tuple[int, int]] = {}
+		for row, (source, conf_blocks) in enumerate(zip(sources.tolist(), blocks)):
+			for key, block in conf_blocks.items():
+				listed = first_listed.setdefault((source, key), (block, row))
+				if (block, row) < listed:
+					first_listed[source, key] = (block, row)
+
+		listings = [min((first_listed[source, key], (blocks[a][key], a), (blocks[b][key], b))
+						for key in blocks[a].keys() & blocks[b].keys())
+					for a, b, source in zip(rows_a.tolist(), rows_b.tolist(), sources[rows_a].tolist())]
+
+		ranks = np.empty(len(listings), dtype=np.int64)
+		ranks[sorted(range(len(listings)), key=listings.__getitem__)] = np.arange(len(listings))
+		return ranks
+
+
+	@classmethod
+	def _cluster(cls, rows_a: np.ndarray, rows_b: np.ndarray, scores: np.ndarray, sources: np.ndarray,
+				 ranks: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+		""" Group conferences into clusters of matching conferences, with at most one conference from each source.
+
+		Pairs are linked in rounds of mutual best matches: in each round, the best pair of each a is selected, then
+		the best of those for each b, and the selected pairs are linked. Pairs that would join 2 conferences of a same
+		source are then dropped, and the remaining pairs compete in the next round. Infinite scores are never linked.
 
-		merged_id_dfs = []
-		unmerged_a, unmerged_b, all_compared_pairs = confs_a, confs_b, compared_pairs
-		while compared_pairs.size:
-			# Drop scores marked as invalid
-			best_matches = compared_pairs[~compared_pairs['score'].transform(np.isinf)]
-			# Best (a, b) pairs for each a
-			best_matches = best_matches.loc[best_matches.groupby('id_a')['score'].idxmin()]
-			# Refine by best (a, b) pairs for each b; we don’t want to merge one b with several a
-			best_matches = best_matches.loc[best_matches.groupby('id_b')['score'].idxmin()]
-
-			if not best_matches.size:
+		Ties are broken by rank for the best pair of each a, and by lowest row of a for the best pair of each b.
+
+		Args:
+			rows_a, rows_b: the rows of the conferences of each candidate pair, with a < b
+			scores: the score of each pair, lower is better
+			sources: the source of each row, in increasing order
+			ranks: the rank of each pair to break ties, see `_pair_ranks`, by default the order of the pairs
+
+		Returns:
+			The cluster of each row, identified by the lowest row in the cluster, and the sorted indexes of linked pairs
+		"""
+		parent = list(range(len(sources)))
+		cluster = np.arange(len(sources))
+		cluster_sources = np.left_shift(1, sources.astype(np.int64))
+
+		def find(row: int) -> int:
+			while parent[row] != row:
+				parent[row] = parent[parent[row]]
+				row = parent[row]
+			return row
+
+		# Remaining pairs, in order of rank
+		pending = np.flatnonzero(np.isfinite(scores))
+		if ranks is not None:
+			pending = pending[np.argsort(ranks[pending], kind='stable')]
+
+		linked = []
+		while True:
+			root_a, root_b = cluster[rows_a[pending]], cluster[rows_b[pending]]
+			pending = pending[(root_a != root_b) & (cluster_sources[root_a] & cluster_sources[root_b] == 0)]
+			if not len(pending):
 				break
 
-			# Drop the merged ids from conf lists and future comparisons
-			compared_pairs = compared_pairs[~compared_pairs['id_a'].isin(best_matches['id_a']) &
-											~compared_pairs['id_b'].isin(best_matches['id_b'])]
-			unmerged_a = unmerged_a.drop(index=best_matches['id_a'])
-			unmerged_b = unmerged_b.drop(index=best_matches['id_b'])
+			# Best pair of each a, ties by rank, then the best of those for each b, ties by a
+			by_score = pending[np.argsort(scores[pending], kind='stable')]
+			best_a = by_score[np.sort(np.unique(rows_a[by_score], return_index=True)[1])]
+			by_score = best_a[np.lexsort((rows_a[best_a], scores[best_a]))]
+			selected = set(by_score[np.unique(rows_b[by_score], return_index=True)[1]].tolist())
+
+			# With more than 2 sources, a pair may no longer be valid after the previous links of the round
+			for pair in (pair for pair in pending.tolist() if pair in selected):
+				root_a, root_b = find(rows_a[pair]), find(rows_b[pair])
+				if root_a == root_b or cluster_sources[root_a] & cluster_sources[root_b]:
+					continue
+				root, child = min(root_a, root_b), max(root_a, root_b)
+				parent[child] = root
+				cluster_sources[root] |= cluster_sources[child]
+				linked.append(pair)
+
+			cluster = np.array([find(row) for row in range(len(parent))], dtype=np.int64)
 
-			merged_id_dfs.append(best_matches.drop(columns=['score']))
+		return cluster, np.array(sorted(linked), dtype=np.int64)
 
-		if not len(merged_id_dfs):
-			return pd.concat([confs_a, confs_b], ignore_index=True)
 
-		merged_ids = pd.concat(merged_id_dfs)
-		merged = pd.concat(ignore_index=True, objs=[unmerged_a, unmerged_b, merged_ids.agg(
-			lambda row: Conference.merge(confs_a[row['id_a']], confs_b[row['id_b']]),
-			axis='columns'
-		)])
+	@classmethod
+	def _print_merges(cls, confs: pd.Series[Conference], index: BlockingIndex, compared_pairs: pd.DataFrame,
+					  pair_differences: pd.DataFrame, linked: np.ndarray, debug: list[str] | bool = False):
+		""" Print info on the merged pairs with different acronyms, or on all candidates of the selected acronyms """
+		acronyms = confs.map(operator.attrgetter('acronym')).str.upper()
+		merged_ids = compared_pairs.iloc[linked][['id_a', 'id_b']]
 
 		diff_acronyms = merged_ids.transform({
-			'id_a': lambda col: col.map(confs_a).map(operator.attrgetter('acronym')).str.upper(),
-			'id_b': lambda col: col.map(confs_b).map(operator.attrgetter('acronym')).str.upper(),
+			'id_a': lambda col: col.map(acronyms),
+			'id_b': lambda col: col.map(acronyms),
 		}).query('id_a != id_b')
 
 		print('Merges with differing acronyms:')
 		if debug:
 			# Print pair info and conf info for all candidates in merges with different acronyms
 			if debug is True:
-				debug_confs_a = merged_ids.loc[[*diff_acronyms.index], 'id_a'].to_list()
-				debug_confs_b = merged_ids.loc[[*diff_acronyms.index], 'id_b'].to_list()
+				debug_confs = sorted({*merged_ids.loc[diff_acronyms.index, 'id_a'],
+									  *merged_ids.loc[diff_acronyms.index, 'id_b']})
 			else:
-				debug_confs_a = idx_a.loc[idx_a.index.intersection(debug)].to_list()
-				debug_confs_b = idx_b.loc[idx_b.index.intersection(debug)].to_list()
-
-			relevant_pairs = all_compared_pairs.query(f"id_a in {debug_confs_a} or id_b in {debug_confs_b}")
-			detailed_scores = relevant_pairs.apply(
-				lambda row: pd.Series(ConfMetaData._difference(confs_a[row['id_a']], confs_b[row['id_b']])),
-				axis='columns'
-			).rename(columns=dict(enumerate(['acronym', 'type', 'org', 'topic', 'qualif', 'num'])))
-			acronyms = relevant_pairs[['id_a', 'id_b']].transform({
-				'id_a': lambda col: col.map(confs_a).map(operator.attrgetter('acronym')).str.upper(),
-				'id_b': lambda col: col.map(confs_b).map(operator.attrgetter('acronym')).str.upper(),
-			}).rename(columns=lambda name: f'acronym_{name[-1]}').sort_values(['acronym_a', 'acronym_b'])
-			selected = relevant_pairs.index.to_series(name='merged').isin(merged_ids.index).map({True: '*', False: ''})
+				debug_confs = index.find(debug).tolist()
 
-			if not len(debug_confs_a) and not len(debug_confs_b):
+			if not len(debug_confs):
 				print('None\n')
-				return merged
+				return
+
+			relevant_pairs = compared_pairs[compared_pairs['id_a'].isin(debug_confs) |
+											compared_pairs['id_b'].isin(debug_confs)]
+			detailed_scores = pair_differences.loc[relevant_pairs.index]
+			pair_acronyms = relevant_pairs[['id_a', 'id_b']].transform({
+				'id_a': lambda col: col.map(acronyms),
+				'id_b': lambda col: col.map(acronyms),
+			}).rename(columns=lambda name: f'acronym_{name[-1]}').sort_values(['acronym_a', 'acronym_b'])
+			selected = relevant_pairs.index.to_series(name='merged').isin(merged_ids.index).map({True: '*', False: ''})
 
 			print()
-			print(acronyms.join([relevant_pairs, selected, detailed_scores]))
+			print(pair_acronyms.join([relevant_pairs, selected, detailed_scores]))
 			print()
-			print('\nconfs_a:')
-			print(('- ' + confs_a[debug_confs_a].map(str)).str.cat(sep='\n'))
-			print('\nconfs_b:')
-			print(('- ' + confs_b[debug_confs_b].map(str)).str.cat(sep='\n'))
+			print('\nconfs:')
+			print(('- ' + confs[debug_confs].map(str)).str.cat(sep='\n'))
 			print()
 		else:
 			# Print pair info for all merged conferences with different acronyms
-			full_scores = merged_ids.loc[diff_acronyms.index].apply(
-				lambda row: pd.Series(ConfMetaData._difference(confs_a[row['id_a']], confs_b[row['id_b']])),
-				axis='columns'
-			).rename(columns=dict(enumerate(['acronym', 'type', 'org', 'topic', 'qualif', 'num'])))
+			full_scores = pair_differences.loc[diff_acronyms.index]
 
 			if not diff_acronyms.size:
 				print('None\n')
-				return merged
+				return
 
 			print(diff_acronyms.join(full_scores))
 			print()
 
 
-		return merged
-
-
 class GGSRanking(Ranking):
 	_url_ggsrank = 'https://scie.lcc.uma.es/gii-grin-scie-rating/conferenceRating.jsf'
 	_file = 'ggs.csv'
@@ -1805,6 +3032,12 @@ class CoreRanking(Ranking):
 	_for_file = 'for_codes.json'
 
 
+	@classmethod
+	def _check_file(cls):
+		# core.csv is curated locally, so it is never too old
+		os.stat(cls._file)
+
+
 	@classmethod
 	def _load_confs(cls) -> pd.DataFrame:
 		# Allow extra columns in core.csv; keep only required ones
@@ -1815,6 +3048,17 @@ class CoreRanking(Ranking):
 		return confs[cls._col_order].fillna({'field': '(missing)'})
 
 
+	@classmethod
+	def load_metrics(cls) -> pd.DataFrame:
+		# The curated core.csv has H5 metrics matched from Google Scholar, use the first row of duplicate acronyms
+		try:
+			metrics = pd.read_csv(cls._file, sep=';', usecols=['acronym', *ConferenceRegistry.h5_columns])
+		except (FileNotFoundError, ValueError):
+			return super().load_metrics()
+		metrics['acronym'] = metrics['acronym'].str.upper()
+		return metrics.drop_duplicates('acronym').set_index('acronym')
+
+
 	@classmethod
 	def _fetch_confs(cls) -> pd.DataFrame:
 		""" Fetch unparsed conference info from the core website """
@@ -1917,13 +3161,72 @@ def json_encode_dates(obj: datetime.date):
 		raise TypeError('{} not encodable'.format(obj))
 
 
+def peak_rss() -> int | None:
+	""" Return the peak resident set size of the process in bytes, if the platform reports it """
+	try:
+		import resource
+	except ImportError:
+		return None
+
+	# ru_maxrss is in bytes on macOS, kilobytes elsewhere
+	rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return rss if sys.platform == 'darwin' else rss * 1024
+
+
+@contextlib.contextmanager
+def atomic_open(path: str, mode: str = 'w') -> Iterator[TextIO]:
+	""" Open a temporary file to write, that replaces path once successfully closed, so path is never half-written """
+	tmp_file = f'{path}.tmp'
+	try:
+		with open(tmp_file, mode) as fh:
+			yield fh
+		os.replace(tmp_file, path)
+	finally:
+		if os.path.exists(tmp_file):
+			os.remove(tmp_file)
+
+
+def publish_artifact(path: str) -> str:
+	""" Write precompressed variants of a static file for the web server, and their content hashes for cache-busting
+
+	Files are compressed with gzip at maximum level and without timestamp, so identical content gives identical
+	path.gz files. The sha256 of each file is written to path.sha256, in the format of `sha256sum`. Returns the sha256
+	of path.
+	"""
+	with open(path, 'rb') as fh:
+		data = fh.read()
+
+	variants = {path: data, f'{path}.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+
+	for name, content in variants.items():
+		if name != path:
+			with atomic_open(name, 'wb') as fh:
+				fh.write(content)
+
+	digests = {name: hashlib.sha256(content).hexdigest() for name, content in variants.items()}
+	with atomic_open(f'{path}.sha256') as fh:
+		for name, digest in digests.items():
+			print(f'{digest}  {os.path.basename(name)}', file=fh)
+
+	return digests[path]
+
+
+def print_import_profile(file: TextIO = sys.stderr):
+	""" Report the time spent loading lazy dependencies and tables, in the format of `python -X importtime` """
+	print('import time: cumulative [us] | lazily imported module or table', file=file)
+	for name, seconds in LazyModule.load_times.items():
+		print(f'import time: {round(seconds * 1e6):>16} | {name}', file=file)
+
+
 @click.group(invoke_without_command=True, chain=True)
 @click.option('--cache/--no-cache', default=True, help='Cache files in ./cache')
 @click.option('--delay', type=float, default=0, help='Delay between requests to the same domain')
 @click.option('--report-spelling/--no-report-spelling', default=True,
 			  help='Whether to print a report on miss-spelled words')
+@click.option('--profile-imports/--no-profile-imports', default=False,
+			  help='Print import times of lazily loaded dependencies and tables (like python -X importtime)')
 @click.pass_context
-def update(ctx: click.Context, cache: bool, delay: float, report_spelling: bool):
+def update(ctx: click.Context, cache: bool, delay: float, report_spelling: bool, profile_imports: bool):
 	""" Update the Core-CFP data. If no command is provided, update_confs is run.  """
 	# Ensure cache directory exists when caching is enabled
 	try:
@@ -1933,6 +3236,7 @@ def update(ctx: click.Context, cache: bool, delay: float, report_spelling: bool)
 		pass
 	RequestWrapper.set_delay(delay)
 	RequestWrapper.set_use_cache(cache)
+	RequestWrapper.start_run()
 
 	if not ctx.invoked_subcommand:
 		# Default is to_update calls for papers
@@ -1946,6 +3250,18 @@ def process_result(*args, **kwargs):
 		ninfo = pd.Series(ConfMetaData._misspelled).str.len()
 		print(ninfo.sort_values(ascending=False).map(lambda n: f'×{n}' if n > 1 else '').to_string())
 
+	lookups = CallForPapers._rating_lookups
+	if total := lookups['hits'] + lookups['misses']:
+		print(f'Rated {total} search results, {lookups["hits"]} ({lookups["hits"] / total:.1%}) from memoized ratings')
+
+	if CallForPapers._cache:
+		print(CallForPapers.cache_summary())
+		if (rss := peak_rss()) is not None:
+			print(f'Peak memory usage (RSS): {rss / 2 ** 20:.1f} MiB')
+
+	if kwargs.get('profile_imports'):
+		print_import_profile()
+
 
 @update.command()
 def core():
@@ -1965,24 +3281,103 @@ def ggs():
 @click.option('--debug-acronym', default=[], multiple=True, help='Select debug output for selected acronyms')
 def load_confs(debug: bool = False, debug_acronym: list[str] = []):
 	""" Load and merge the the conference lists. """
-	confs = Ranking.merge(CoreRanking.get_confs(), GGSRanking.get_confs(), debug=debug_acronym or debug).sort_values()
+	confs = Ranking.get_merged_confs(CoreRanking, GGSRanking, debug=debug_acronym or debug)
 
 	if debug_acronym:
-		show = confs.map(operator.attrgetter('acronym')).str.upper().str.match('|'.join(debug_acronym))
+		show = confs.match_acronyms('|'.join(debug_acronym))
 		print('\nResulting confs:')
-		print(('- ' + confs[show].map(str)).str.cat(sep='\n'))
+		print('\n'.join(f'- {conf}' for conf in confs.take(show)))
+
+
+@update.command(hidden=True)
+@click.option('--scale', 'scales', type=int, multiple=True, default=[1, 4, 16, 32],
+			  help='Number of copies of each conference list to merge (with distinct acronyms)')
+def bench_merge(scales: list[int]):
+	""" Time merging the conference lists, replicated to several sizes. """
+	raw_confs = [CoreRanking._load_confs(), GGSRanking._load_confs()]
+
+	for scale in scales:
+		start = time.perf_counter()
+		confs = [
+			pd.concat(ignore_index=True, objs=[
+				df.assign(acronym=df['acronym'] + (str(n) if n else '')) for n in range(scale)
+			]).agg(Conference.from_series, axis='columns')
+			for df in raw_confs
+		]
+		loaded = time.perf_counter()
+		merged = Ranking.merge(*confs)
+		merged_time = time.perf_counter()
+
+		print(f'scale {scale}: {" + ".join(str(len(series)) for series in confs)} -> {len(merged)} conferences, '
+			  f'{loaded - start:.3f}s to build, {merged_time - loaded:.3f}s to merge')
+
+
+@update.command(hidden=True)
+@click.option('--rounds', 'rounds_list', type=int, multiple=True, default=[10, 20, 30],
+			  help='Number of rounds of the synthetic multiple-deadline calls')
+@click.option('--duplicates/--no-duplicates', default=True,
+			  help='Also post each round a second time, with an extended deadline')
+@click.option('--ordinals/--no-ordinals', default=True,
+			  help='Number the rounds in the titles, or only give each posting a different word that confirms nothing')
+def bench_deadlines(rounds_list: list[int], duplicates: bool, ordinals: bool):
+	""" Time the detection of multiple-deadline calls on synthetic calls for papers. """
+	first_submission = datetime.date(2026, 1, 5)
+	extensions = (0, 3) if duplicates else (0,)
+
+	for rounds in rounds_list:
+		conf_start = first_submission + datetime.timedelta(days=20 * rounds + 70)
+		calls = []
+		for n, extension in itertools.product(range(rounds), extensions):
+			# Without ordinals, postings are told apart by made-up place names: aville, bville, ..., bcville
+			place = ''.join(chr(ord('a') + int(digit)) for digit in str(len(calls)))
+			name = f'{inflection.ordinalize(n + 1)} round' if ordinals else f'posted in {place}ville'
+			cfp = CallForPapers('BENCH', conf_start.year, len(calls) + 1, f'BENCH {conf_start.year} {name}')
+			submission = first_submission + datetime.timedelta(days=20 * n + extension)
+			cfp.dates.update({
+				'submission': submission, 'notification': submission + datetime.timedelta(days=18 - extension),
+				'conf_start': conf_start, 'conf_end': conf_start + datetime.timedelta(days=3),
+			})
+			calls.append(cfp)
+
+		cfps = CandidateTable(calls, [0.] * len(calls), [0] * len(calls))
+
+		start = time.perf_counter()
+		matched = CallForPapers.detect_multiple_deadlines(cfps)
+		print(f'{rounds} rounds, {len(calls)} calls: {0 if matched is None else len(matched)} deadlines detected '
+			  f'in {time.perf_counter() - start:.3f}s')
 
 
 @update.command()
 @click.option('--out', 'out_file', default='cfp.json', help='Output file for CFPs', type=click.Path(dir_okay=False))
+@click.option('--compress/--no-compress', default=False,
+			  help='Also write precompressed .gz files, and .sha256 content hashes, next to the outputs')
+@click.option('--shards/--no-shards', default=False,
+			  help='Also split the CFPs by field and by year into a directory next to the output, with a manifest')
+@click.option('--index/--no-index', 'with_index', default=True,
+			  help='Include sort orders and a search index of the conferences in the output')
+@click.option('--tables', 'table_formats', type=click.Choice(['parquet', 'arrow']), multiple=True,
+			  help='Also write the conferences and cfps as typed tables in these formats, requires pyarrow')
+@click.option('--delta/--no-delta', 'write_delta', default=True,
+			  help='Write the changes since the previous output next to it, empty if there are none')
 @click.option('--debug/--no-debug', default=False, help='Show debug output')
-def cfps(out_file: str, debug: bool = False):
+def cfps(out_file: str, compress: bool = False, shards: bool = False,
+		 with_index: bool = True, table_formats: Sequence[str] = (), write_delta: bool = True, debug: bool = False):
 	""" Update the calls for papers from the conference lists  """
 	today = datetime.datetime.now().date()
 	# use years from 6 months ago until next year
 	search_years = range((today - datetime.timedelta(days=183)).year, (today + datetime.timedelta(days=365)).year + 1)
 
-	confs = Ranking.merge(CoreRanking.get_confs(), GGSRanking.get_confs(), debug=debug).sort_values()
+	if table_formats:
+		try:
+			pa.__version__
+		except ImportError as err:
+			raise click.UsageError(f'--tables requires pyarrow: {err}')
+
+	# Pages read from the cache keep the fetch time recorded by previous runs
+	manifest_file = f'{os.path.splitext(out_file)[0]}.run.json'
+	RequestWrapper.load_manifest(manifest_file)
+
+	confs = Ranking.get_merged_confs(CoreRanking, GGSRanking, debug=debug)
 
 	def prog_show_conf(arg: tuple[int, Conference] | None, width: int = _term_columns - 50 - 36) -> str:
 		if arg is None:
@@ -1990,7 +3385,7 @@ def cfps(out_file: str, debug: bool = False):
 		info = f'{arg[1].acronym} {arg[1].title}'
 		return f'{info[:width - 3]}...' if len(info) > width else info
 
-	progressbar = click.progressbar(confs.items(), label='fetching calls for papers…', width=36,
+	progressbar = click.progressbar(enumerate(confs), label='fetching calls for papers…', width=36,
 									item_show_func=prog_show_conf, length=len(confs),
 									update_min_steps=len(confs) // 1000 if not RequestWrapper.delay else 1)
 
@@ -2032,8 +3427,10 @@ def cfps(out_file: str, debug: bool = False):
 					cfp = CallForPapers.build(conf.acronym, year)
 					conf_matching.append((conf_id, cfp.id, year, n, 999, len(cfp.__slots__)))
 
-	with open('parsing_errors.txt', 'w') as errlog:
+	with atomic_open('parsing_errors.txt') as errlog:
 		print(*CallForPapers._errors, sep='\n', file=errlog)
+	if compress:
+		publish_artifact('parsing_errors.txt')
 
 	conf_matching_df = pd.DataFrame(
 		conf_matching, columns=['conf_id', 'cfp_id', 'year', 'round', 'score', 'missing']
@@ -2047,70 +3444,697 @@ def cfps(out_file: str, debug: bool = False):
 	conf_matching_df = conf_matching_df[~conf_matching_df['missing'].ge(8).groupby(level='conf_id').transform('all')]
 
 	def extrapolate(cfps: pd.Series[CallForPapers], n: int) -> pd.Series[CallForPapers]:
-		prev_cfps = cfps.groupby(level=['conf_id', 'round']).shift(periods=n)
-		return cfps.combine(prev_cfps, CallForPapers.extrapolate_missing)
+		rows = pd.Series(np.arange(len(cfps)), index=cfps.index)
+		prev_rows = rows.groupby(level=['conf_id', 'round']).shift(periods=n, fill_value=-1).to_numpy()
+		CallForPapers.extrapolate_missing_batch(cfps.to_list(), prev_rows)
+		return cfps
 
 	# Complete missing cfp info with previous iterations
 	cfps = CallForPapers.all_built_cfps()
 	full_cfps = conf_matching_df['cfp_id'].sort_index().map(cfps).pipe(extrapolate, n=1).pipe(extrapolate, n=2)
 
-	# Convert all cfps / confs to lists of data to be written out
-	cfp_data = full_cfps.map(CallForPapers.values).unstack('year', fill_value=[None] * len(CallForPapers.columns()))
-	cfp_data = cfp_data.groupby(level='conf_id').agg(list)
-	conf_data = cfp_data.index.to_series(name='conf').map(confs.to_dict()).map(Conference.values).map(list)
-
-	# Combine all conference / cfp data and sort based on acronym
 	out_years = [year for year in search_years if year >= today.year]
 
-	# Augment Rank and Rank system with H5 metrics from core.csv
-	try:
-		core_df = pd.read_csv('core.csv', sep=';')
-		core_df['ACRONYM_UP'] = core_df['acronym'].str.upper()
-		core_h5 = core_df.set_index('ACRONYM_UP')[['h5_index', 'h5_median']]
-	except Exception:
-		core_h5 = pd.DataFrame(columns=['h5_index', 'h5_median'])
+	# Each conference’s cfps are contiguous in full_cfps, which is sorted by conf_id
+	cfp_list = full_cfps.to_list()
+	conf_ids, years, rounds = (full_cfps.index.get_level_values(level).to_numpy() for level in ('conf_id', 'year', 'round'))
+	out_conf_ids, starts = np.unique(conf_ids, return_index=True)
+	ends = np.append(starts[1:], len(conf_ids))
+	no_cfp = [None] * len(CallForPapers.columns())
+	index = CfpsIndex(today) if with_index else None
+
+	def conf_rows(order: np.ndarray) -> Iterator[list]:
+		""" Generate the output row of each conference: its data, then its cfps for each year and round """
+		for conf_id, start, end in zip(out_conf_ids[order].tolist(), starts[order].tolist(), ends[order].tolist()):
+			conf_cfps = dict(zip(zip(years[start:end].tolist(), rounds[start:end].tolist()),
+								 CallForPapers.batch_values(cfp_list[start:end])))
+			conf_rounds = sorted(set(rounds[start:end].tolist()))
+			# Rank and Rank system are augmented with the H5 metrics
+			row = [*confs.values(conf_id, metrics=True),
+				   *(conf_cfps.get((year, round_), no_cfp) for year in out_years for round_ in conf_rounds)]
+			if index is not None:
+				index.add(confs[conf_id], row)
+			yield row
+
+	# Sort based on acronym
+	order = np.argsort(confs.acronym[out_conf_ids], kind='stable')
+
+	# The data is as recent as the oldest cfp page it was read from
+	scrape_date = RequestWrapper.oldest_fetch({cfp.url_cfp for cfp in cfp_list if cfp.url_cfp is not None})
+
+	# Encode each row once for all the outputs, with its json
+	rows = ((row, CfpsJsonWriter.encode(row)) for row in conf_rows(order))
+
+	# Compare to the previous output while writing the new one
+	delta = CfpsDelta.load(out_file, out_years) if write_delta else CfpsDelta(out_years)
+	rows = delta.track(rows)
+
+	if shards:
+		shard_dir = f'{os.path.splitext(out_file)[0]}-shards'
+		rows = split_cfps_shards(rows, shard_dir, out_years, scrape_date, compress=compress)
+
+	with atomic_open(out_file) as out:
+		write_cfps_json(out, out_years, (encoded for _, encoded in rows), scrape_date, index)
+
+	if table_formats:
+		# Only the cfps of the output years, as in the json. Written after it, so the tables are not older than the json
+		out_rows = np.isin(years, out_years)
+		conf_table, cfp_table = cfps_tables(confs, conf_ids[out_rows], years[out_rows], rounds[out_rows],
+											[cfp for cfp, keep in zip(cfp_list, out_rows.tolist()) if keep])
+		write_cfps_tables(f'{os.path.splitext(out_file)[0]}-tables', table_formats,
+						  {'conferences': conf_table, 'cfps': cfp_table})
+
+	if delta.previous is not None:
+		# Also when there are no changes, so that the delta always leads to the latest output and its date
+		with atomic_open(f'{os.path.splitext(out_file)[0]}.delta.json') as out:
+			delta.write(out, scrape_date, index)
+		print(f'{delta.changes} changes since {delta.previous["date"]}')
+	if compress:
+		digest = publish_artifact(out_file)
+		print(f'Wrote {out_file} (sha256 {digest[:12]})')
+
+	with atomic_open(manifest_file) as out:
+		RequestWrapper.write_manifest(out)
 
-	def _append_h5(row: list) -> list:
-		try:
-			acr_up = str(row[0]).upper()
-			h5 = core_h5.loc[acr_up] if acr_up in core_h5.index else pd.Series({'h5_index': np.nan, 'h5_median': np.nan})
-		except Exception:
-			h5 = pd.Series({'h5_index': np.nan, 'h5_median': np.nan})
-
-		# row structure: [Acronym, Title, Rank(tuple), Rank system(tuple), Field]
-		rank_list = list(row[2])
-		ranksys_list = list(row[3])
-		# Append systems first to keep alignment obvious in downstream consumers
-		ranksys_list.extend(['H5Index2024', 'H5Median2024'])
-		# Convert NA to None (-> null in JSON)
-		def _val(x):
-			return None if pd.isna(x) else int(x)
-		rank_list.extend([_val(h5.get('h5_index')), _val(h5.get('h5_median'))])
-
-		row[2] = tuple(rank_list)
-		row[3] = tuple(ranksys_list)
-		return row
 
-	conf_data = conf_data.map(_append_h5)
+@update.command()
+@click.option('--data', 'data_file', default='cfp.json', help='CFP data, as written by cfps', type=click.Path(dir_okay=False))
+@click.option('--date-field', type=click.Choice(DateStore.fields), default='submission', help='Date to query')
+@click.option('--from', 'start', type=click.DateTime(['%Y-%m-%d']), default=None, help='First date, default today')
+@click.option('--days', type=int, default=30, help='Number of days from the first date')
+@click.option('--rank', 'ranks', multiple=True, help='Only conferences with one of these ranks, e.g. A*')
+@click.option('--field', 'fields', multiple=True, help='Only conferences in one of these fields')
+@click.option('--overlapping', type=click.DateTime(['%Y-%m-%d']), nargs=2, default=None,
+			  help='Query conferences taking place between these 2 dates instead')
+def deadlines(data_file: str, date_field: str, start: datetime.datetime | None, days: int, ranks: tuple[str, ...],
+			  fields: tuple[str, ...], overlapping: tuple[datetime.datetime, datetime.datetime] | None):
+	""" Query the deadlines or dates of conferences in the CFP data """
+	index = DeadlineIndex.load(data_file)
+	if overlapping:
+		result = index.overlapping(overlapping[0].date(), overlapping[1].date(), ranks=ranks, fields=fields)
+	else:
+		first = start.date() if start is not None else datetime.date.today()
+		result = index.deadlines(date_field, first, first + datetime.timedelta(days=days), ranks=ranks, fields=fields)
+
+	print(result.to_string(index=False) if len(result) else 'No matching calls for papers')
 
-	all_data = conf_data.add(cfp_data[out_years].sum(axis='columns')).reindex_like(conf_data.str[0].sort_values())
 
-	try:
-		min_ctime = min(os.path.getctime(f) for f in glob.glob('cache/cfp_*.html'))
-	except ValueError:
-		scrape_date = datetime.datetime.now()
-	else:
-		scrape_date = datetime.datetime.fromtimestamp(min_ctime)
+class CfpsJsonWriter:
+	""" Write the calls for papers data as json in the rows format, one conference row at a time
 
-	with open(out_file, 'w') as out:
-		print(f'{{"years": {json.dumps(out_years)}, "columns":\n{json.dumps(Conference.columns())},', file=out)
+	Attributes:
+		out: the file to write
+		rows: number of rows written so far
+	"""
+	__slots__ = ('out', 'rows')
+
+	encode = functools.partial(json.dumps, default=json_encode_dates)
+
+	def __init__(self, out: TextIO, years: list[int]):
+		self.out, self.rows = out, 0
+		print(f'{{"years": {json.dumps(years)}, "columns":\n{json.dumps(Conference.columns())},', file=out)
 		print(f'"cfp_columns":\n{json.dumps(CallForPapers.columns())},', file=out)
 		print('"data": [', file=out)
 
-		to_string = functools.partial(json.dumps, default=json_encode_dates)
-		print(all_data.map(to_string).str.cat(sep=',\n'), file=out)
 
-		print(f'], "date": "{scrape_date.strftime("%Y-%m-%d")}"}}', file=out)
+	def write_encoded(self, row: str):
+		""" Write a row already encoded with `encode` """
+		if self.rows:
+			self.out.write(',\n')
+		self.out.write(row)
+		self.rows += 1
+
+
+	def close(self, date: datetime.date, index: CfpsIndex | None = None):
+		print(file=self.out)
+		if index is not None:
+			print(f'], "index":\n{json.dumps(index.to_json(), separators=(",", ":"))},', file=self.out)
+			print(f'"date": "{date.strftime("%Y-%m-%d")}"}}', file=self.out)
+		else:
+			print(f'], "date": "{date.strftime("%Y-%m-%d")}"}}', file=self.out)
+
+
+def write_cfps_json(out: TextIO, years: list[int], rows: Iterable[str], date: datetime.date,
+					index: CfpsIndex | None = None):
+	""" Write the calls for papers data as json, from rows encoded with `CfpsJsonWriter.encode`, and the index """
+	writer = CfpsJsonWriter(out, years)
+	for row in rows:
+		writer.write_encoded(row)
+	writer.close(date, index)
+
+
+class CfpsIndex:
+	""" Sort orders and search index of the output rows, so the page does not need to compute them
+
+	Built while the rows are generated, with the position of each row in the output as its id.
+
+	Attributes:
+		as_of: the date after which deadlines are upcoming, the next deadlines sort order is only valid on that day
+		submission_info: sort key of each row by its next submission, or other date if the submission is unknown
+		tokens: the rows containing each case-folded part of the acronyms and titles, between search term separators
+	"""
+	__slots__ = ('as_of', 'submission_info', 'tokens')
+
+	# Dates used to sort a cfp, by order of preference, as the page does
+	submission_dates: ClassVar[tuple[int, ...]] = tuple(DateStore.column[field] for field in
+														 ('submission', 'abstract', 'conf_start', 'conf_end'))
+	# Characters that split search terms in the page, which can thus not be part of a match
+	_token_sep = re.compile(r'[ ;:,.]')
+
+	def __init__(self, as_of: datetime.date):
+		self.as_of = as_of
+		self.submission_info: list[str] = []
+		self.tokens: dict[str, list[int]] = {}
+
+
+	def _sort_info(self, cfps: Iterable[list], columns: tuple[int, ...]) -> str:
+		""" Sort info of a conference, exactly as sortConferences in cfp-timeline.js compares them
+
+		The page takes the first date of each cfp in columns order, as a YYYYMMDD string, and maps it to
+		[date <= as_of, date]. Arrays are compared as strings by the default javascript sort, e.g. 'true,20250101',
+		or 'false,' for a cfp without any date. The conference’s info is the smallest one, or '' if it has no cfps.
+		"""
+		as_of = self.as_of.strftime('%Y%m%d')
+		dates = [next((cfp[col].strftime('%Y%m%d') for col in columns if cfp[col] is not None), None) for cfp in cfps]
+		return min((f'{"true" if date <= as_of else "false"},{date}' if date is not None else 'false,'
+					for date in dates), default='')
+
+
+	def add(self, conf: Conference, row: list):
+		""" Index a row of the conference """
+		n = len(self.submission_info)
+		cfps = row[len(Conference.columns()):]
+		self.submission_info.append(self._sort_info(cfps, self.submission_dates))
+
+		for token in {*self._token_sep.split(conf.acronym), *self._token_sep.split(conf.title)} - {''}:
+			self.tokens.setdefault(token.casefold(), []).append(n)
+
+
+	def _page_order(self, info: list[str]) -> list[int]:
+		""" Sort rows as the page does: by the strings of [info, row] pairs, so rows with the same info by row string """
+		return sorted(range(len(info)), key=lambda n: f'{info[n]},{n}')
+
+
+	def to_json(self) -> dict:
+		""" Return the index in the json format read by cfp-timeline.js
+
+		The format holds:
+		- as_of: the date in YYYY-MM-DD format until which the next deadlines order is valid.
+		- order: submission: the rows as the page sorts them by next submission (i.e. by `_sort_info` and row).
+		- tokens: the sorted distinct tokens, and rows: the rows containing each token. Tokens are case-folded, so
+		  that a token contains an ascii search term, in lower case, if the term matches the original text ignoring
+		  case. The page still checks matches on the acronym and title of the rows.
+		- trigrams: the ids of the tokens containing each 3-letter substring, to search tokens without scanning them.
+		"""
+		tokens = sorted(self.tokens)
+		trigrams: dict[str, list[int]] = {}
+		for token_id, token in enumerate(tokens):
+			for trigram in sorted({token[n:n + 3] for n in range(len(token) - 2)}):
+				trigrams.setdefault(trigram, []).append(token_id)
+
+		return {
+			'as_of': self.as_of.strftime('%Y-%m-%d'),
+			'order': {'submission': self._page_order(self.submission_info)},
+			'tokens': tokens,
+			'rows': [self.tokens[token] for token in tokens],
+			'trigrams': dict(sorted(trigrams.items())),
+		}
+
+
+def split_cfps_shards(rows: Iterable[tuple[list, str]], directory: str, years: list[int], date: datetime.date,
+					  compress: bool = False) -> Iterator[tuple[list, str]]:
+	""" Pass rows and their json encoding through, while writing them to shards and a manifest listing them in directory
+
+	Shards are in the rows format of `write_cfps_json`: a field-*.json file per field with the rows of the conferences
+	in that field, and a year-*.json file per year with only the cfps of that year, for the conferences that have any.
+	Fields with the same file name slug are numbered in order of appearance, e.g. field-a-b.json and field-a-b-2.json.
+	The manifest.json lists for each shard its file, field or year, number of rows and sha256.
+	"""
+	nconf_columns = len(Conference.columns())
+	field_column = Conference.columns().index('Field')
+	no_cfp = [None] * len(CallForPapers.columns())
+	os.makedirs(directory, exist_ok=True)
+
+	field_files: dict[str, str] = {}
+
+	def field_file(field: str) -> str:
+		if field not in field_files:
+			slug = re.sub(r'[^a-z0-9]+', '-', field.lower()).strip('-') or 'none'
+			file, n, used = f'field-{slug}.json', 1, set(field_files.values())
+			while file in used:
+				n += 1
+				file = f'field-{slug}-{n}.json'
+			field_files[field] = file
+		return field_files[field]
+
+	shards: dict[str, dict] = {}
+	writers: dict[str, CfpsJsonWriter] = {}
+	with contextlib.ExitStack() as stack:
+		def writer(file: str, shard_years: list[int], **shard) -> CfpsJsonWriter:
+			if file not in writers:
+				out = stack.enter_context(atomic_open(os.path.join(directory, file)))
+				writers[file] = CfpsJsonWriter(out, shard_years)
+				shards[file] = {'file': file, **shard}
+			return writers[file]
+
+		for year in years:
+			writer(f'year-{year}.json', [year], year=year)
+
+		for row, encoded in rows:
+			yield row, encoded
+
+			writer(field_file(row[field_column]), years, field=row[field_column]).write_encoded(encoded)
+
+			nrounds = (len(row) - nconf_columns) // max(len(years), 1)
+			for n, year in enumerate(years):
+				year_cfps = row[nconf_columns + n * nrounds:nconf_columns + (n + 1) * nrounds]
+				if any(cfp != no_cfp for cfp in year_cfps):
+					writers[f'year-{year}.json'].write_encoded(CfpsJsonWriter.encode([*row[:nconf_columns], *year_cfps]))
+
+		for shard_writer in writers.values():
+			shard_writer.close(date)
+
+	for file, shard in shards.items():
+		path = os.path.join(directory, file)
+		if compress:
+			digest = publish_artifact(path)
+		else:
+			with open(path, 'rb') as fh:
+				digest = hashlib.sha256(fh.read()).hexdigest()
+		shard.update(rows=writers[file].rows, sha256=digest)
+
+	manifest = {'years': years, 'date': date.strftime('%Y-%m-%d'), 'shards': list(shards.values())}
+	with atomic_open(os.path.join(directory, 'manifest.json')) as fh:
+		json.dump(manifest, fh, indent=1)
+
+	# Remove shards of fields that are no longer present
+	for old_shard in glob.glob(os.path.join(directory, '*-*.json*')):
+		if os.path.basename(old_shard).split('.json')[0] + '.json' not in shards:
+			os.remove(old_shard)
+
+
+def _conf_keys(rows: Iterable[list]) -> Iterator[str]:
+	""" Identify conference rows by acronym, suffixed with #n for the n-th repetition of an acronym """
+	seen: collections.Counter[str] = collections.Counter()
+	for row in rows:
+		n = seen[row[0]]
+		seen[row[0]] += 1
+		yield f'{row[0]}#{n}' if n else row[0]
+
+
+def _cfps_by_round(row: list, years: list[int]) -> dict[str, list]:
+	""" Map year/round to the cfps of a conference row """
+	nconf_columns = len(Conference.columns())
+	nrounds = (len(row) - nconf_columns) // max(len(years), 1)
+	return {f'{year}/{round_}': row[nconf_columns + n * nrounds + round_]
+			for n, year in enumerate(years) for round_ in range(nrounds)}
+
+
+_delta_format = 'delta-1'
+
+
+class CfpsDelta:
+	""" Changes of the calls for papers data since the previous output, computed while the new rows are written
+
+	Attributes:
+		previous: the previous data in the rows format, or None if there is no compatible previous output
+		base_sha256: the sha256 of the previous output file
+		years: the years of the new data
+		added: key and row of each new conference
+		removed: keys of the conferences no longer present
+		changed: key of each changed conference, with its changed columns and changed cfps (None if removed)
+		changes: number of changed values, counting added or removed conferences and cfps as one change
+	"""
+	__slots__ = ('previous', 'base_sha256', 'years', 'added', 'removed', 'changed', 'changes')
+
+	def __init__(self, years: list[int], previous: dict | None = None, base_sha256: str | None = None):
+		self.previous, self.base_sha256 = previous, base_sha256
+		self.years = years
+		self.added: list[tuple[str, list]] = []
+		self.removed: list[str] = []
+		self.changed: list[tuple[str, dict, dict]] = []
+		self.changes = 0
+
+
+	@classmethod
+	def load(cls, path: str, years: list[int]) -> CfpsDelta:
+		""" Load the previous output, if any and with the same columns as the data we are about to write """
+		try:
+			with open(path, 'rb') as fh:
+				content = fh.read()
+			previous = json.loads(content)
+		except FileNotFoundError:
+			return cls(years)
+		except ValueError as err:
+			clean_print(f'Ignoring invalid previous output {path}: {err!r}')
+			return cls(years)
+
+		if previous.get('columns') != Conference.columns() or previous.get('cfp_columns') != CallForPapers.columns():
+			return cls(years)
+
+		return cls(years, previous, hashlib.sha256(content).hexdigest())
+
+
+	def track(self, rows: Iterable[tuple[list, str]]) -> Iterator[tuple[list, str]]:
+		""" Pass rows and their json encoding through, while comparing them to the previous data """
+		if self.previous is None:
+			yield from rows
+			return
+
+		nconf_columns = len(Conference.columns())
+		previous_rows = dict(zip(_conf_keys(self.previous['data']), self.previous['data']))
+		seen: collections.Counter[str] = collections.Counter()
+
+		for row, encoded in rows:
+			yield row, encoded
+
+			key = row[0] if not seen[row[0]] else f'{row[0]}#{seen[row[0]]}'
+			seen[row[0]] += 1
+			# Compare values as they are in json, e.g. with dates as YYYYMMDD strings
+			new = json.loads(encoded)
+			old = previous_rows.pop(key, None)
+
+			if old is None:
+				self.added.append((key, new))
+				self.changes += 1
+				continue
+
+			conf_changes = {column: value for column, value, old_value
+							in zip(Conference.columns(), new[:nconf_columns], old[:nconf_columns]) if value != old_value}
+			self.changes += len(conf_changes)
+
+			new_cfps, old_cfps = _cfps_by_round(new, self.years), _cfps_by_round(old, self.previous['years'])
+			cfp_changes: dict[str, dict | None] = {}
+			for year_round, cfp in new_cfps.items():
+				old_cfp = old_cfps.pop(year_round, None)
+				if old_cfp is None:
+					cfp_changes[year_round] = dict(zip(CallForPapers.columns(), cfp))
+					self.changes += 1
+				elif cfp != old_cfp:
+					cfp_changes[year_round] = {column: value for column, value, old_value
+											   in zip(CallForPapers.columns(), cfp, old_cfp) if value != old_value}
+					self.changes += len(cfp_changes[year_round])
+
+			cfp_changes.update(dict.fromkeys(old_cfps))
+			self.changes += len(old_cfps)
+
+			if conf_changes or cfp_changes:
+				self.changed.append((key, conf_changes, cfp_changes))
+
+		self.removed = list(previous_rows)
+		self.changes += len(self.removed)
+
+
+	def write(self, out: TextIO, date: datetime.date, index: CfpsIndex | None = None):
+		""" Write the changes as json, with the index of the new output if it changed, see `apply_cfps_delta` """
+		assert self.previous is not None
+		delta = {
+			'format': _delta_format,
+			'from': self.previous['date'],
+			'to': date.strftime('%Y-%m-%d'),
+			'base_sha256': self.base_sha256,
+			'years': self.years,
+			'changes': self.changes,
+			'added': self.added,
+			'removed': self.removed,
+			'changed': self.changed,
+		}
+		new_index = index.to_json() if index is not None else None
+		if new_index != self.previous.get('index'):
+			delta['index'] = new_index
+		json.dump(delta, out, separators=(',', ':'))
+
+
+def apply_cfps_delta(previous: dict, delta: dict) -> dict:
+	""" Apply a delta written by `CfpsDelta` to the previous calls for papers data in the rows format
+
+	The delta holds the dates of the previous and new data (from, to), the sha256 of the previous file (base_sha256),
+	the new years, the number of changes, and:
+	- added: [key, row] of each new conference, where the key is the acronym, suffixed with #n if it is the n-th
+	  repetition of that acronym in the data.
+	- removed: keys of the removed conferences.
+	- changed: [key, columns, cfps] of each changed conference, with the new value of each changed column, and for each
+	  changed year/round (e.g. 2025/0) either null if the cfp was removed, or the new value of each changed cfp column.
+	- index: only if the index changed, the new index (see `CfpsIndex.to_json`), or null if the new data has none.
+	"""
+	if delta.get('format') != _delta_format:
+		raise ValueError(f'Unknown cfp delta format: {delta.get("format")}')
+
+	nconf_columns = len(previous['columns'])
+	no_cfp = [None] * len(previous['cfp_columns'])
+	rows = dict(zip(_conf_keys(previous['data']), previous['data']))
+
+	for key in delta['removed']:
+		del rows[key]
+
+	for key, conf_changes, cfp_changes in delta['changed']:
+		conf = rows[key][:nconf_columns]
+		for column, value in conf_changes.items():
+			conf[previous['columns'].index(column)] = value
+
+		cfps = _cfps_by_round(rows[key], previous['years'])
+		for year_round, changes in cfp_changes.items():
+			if changes is None:
+				del cfps[year_round]
+			else:
+				cfp = list(cfps.get(year_round, no_cfp))
+				for column, value in changes.items():
+					cfp[previous['cfp_columns'].index(column)] = value
+				cfps[year_round] = cfp
+
+		nrounds = 1 + max((int(year_round.split('/')[1]) for year_round in cfps), default=-1)
+		rows[key] = [*conf, *(cfps.get(f'{year}/{round_}', no_cfp) for year in delta['years'] for round_ in range(nrounds))]
+
+	rows.update(delta['added'])
+
+	def sort_key(item: tuple[str, list]) -> tuple[str, int]:
+		key, row = item
+		return row[0], int(key[len(row[0]) + 1:] or 0)
+
+	index = delta.get('index', previous.get('index'))
+	return {'years': delta['years'], 'columns': previous['columns'], 'cfp_columns': previous['cfp_columns'],
+			'data': [row for key, row in sorted(rows.items(), key=sort_key)],
+			**({'index': index} if index is not None else {}), 'date': delta['to']}
+
+
+def cfps_tables(confs: ConferenceRegistry, conf_ids: np.ndarray, years: np.ndarray, rounds: np.ndarray,
+				cfps: Sequence[CallForPapers]) -> tuple[pa.Table, pa.Table]:
+	""" Return arrow tables of the conferences of the registry, and of the cfps of the given conference ids and rounds
+
+	The conferences table has a row per registry row, identified by conf_id. The cfps table has a row per cfp, with
+	typed columns read from the date store: a date32 column per date field, and a bool column per orig flag.
+	Missing values are null.
+	"""
+	def int_array(values: Iterable[int | None]) -> pa.Array:
+		return pa.array(list(values), type=pa.int32())
+
+	def str_list_array(values: Iterable[tuple[str | None, ...]]) -> pa.Array:
+		return pa.array([list(value) for value in values], type=pa.list_(pa.string()))
+
+	conferences = pa.table({
+		'conf_id': pa.array(np.arange(len(confs), dtype=np.int32)),
+		'acronym': pa.array(confs.acronym.tolist(), type=pa.string()),
+		'title': pa.array(confs.title.tolist(), type=pa.string()),
+		'rank': str_list_array(confs.rank.tolist()),
+		'ranksys': str_list_array(confs.ranksys.tolist()),
+		'field': pa.array(confs.field.tolist(), type=pa.string()),
+		'ranksort': int_array(confs.ranksort.tolist()),
+		**{column: int_array(getattr(confs, column).tolist()) for column in confs.h5_columns},
+	})
+
+	store = CallForPapers._date_store
+	rows = CallForPapers.date_rows(cfps)
+	dates, orig = store.dates[rows], store.orig[rows]
+	cfp_table = pa.table({
+		'conf_id': pa.array(conf_ids.astype(np.int32)),
+		'year': pa.array(years.astype(np.int16)),
+		'round': pa.array(rounds.astype(np.int8)),
+		'cfp_id': pa.array([cfp.id for cfp in cfps], type=pa.int64()),
+		**{field: pa.array(dates[:, col], type=pa.date32(), mask=np.isnat(dates[:, col]))
+		   for field, col in DateStore.column.items()},
+		**{f'orig_{field}': pa.array(orig[:, col] == 1, type=pa.bool_(), mask=orig[:, col] < 0)
+		   for field, col in DateStore.column.items()},
+		'link': pa.array([cfp.link for cfp in cfps], type=pa.string()),
+		'cfp_url': pa.array([cfp.url_cfp for cfp in cfps], type=pa.string()),
+	})
+
+	return conferences, cfp_table
+
+
+def write_cfps_tables(directory: str, formats: Iterable[str], tables: Mapping[str, pa.Table]):
+	""" Write each table to directory as name.parquet (zstd-compressed) and/or name.arrow (Arrow IPC file format) """
+	os.makedirs(directory, exist_ok=True)
+	for name, table in tables.items():
+		if 'parquet' in formats:
+			with atomic_open(os.path.join(directory, f'{name}.parquet'), 'wb') as fh:
+				pq.write_table(table, fh, compression='zstd')
+		if 'arrow' in formats:
+			# Uncompressed, so other readers can memory-map the file
+			with atomic_open(os.path.join(directory, f'{name}.arrow'), 'wb') as fh:
+				with pa.ipc.new_file(fh, table.schema) as writer:
+					writer.write_table(table)
+
+
+class DeadlineIndex:
+	""" Queries on the calls for papers of the output data, using the cfps sorted by each date field
+
+	Use `load` to read the Arrow tables written by `cfps --tables arrow`, or the json output if there are none or they
+	are older than it. Queries return a DataFrame with a row per matching cfp.
+
+	Attributes:
+		conferences: acronym, title, rank, field of each conference, indexed by conf_id. Ranks exclude H5 metrics.
+		cfps: conf_id, year, round, link and cfp_url of each cfp
+		dates: the date of each field of each cfp (columns as `DateStore.fields`), NaT where missing
+		orig: 1 if the date of a field was read from the cfp, 0 if it was guessed, -1 where missing
+		order: for each field, the cfps sorted by date of that field, with missing dates last
+		sorted_dates: for each field, the dates in the order of `order`
+	"""
+	__slots__ = ('conferences', 'cfps', 'dates', 'orig', 'order', 'sorted_dates')
+
+	def __init__(self, conferences: pd.DataFrame, cfps: pd.DataFrame, dates: np.ndarray, orig: np.ndarray):
+		self.conferences, self.cfps, self.dates, self.orig = conferences, cfps, dates, orig
+		self.order = np.argsort(dates, axis=0, kind='stable')
+		self.sorted_dates = np.take_along_axis(dates, self.order, axis=0)
+
+
+	@classmethod
+	def load(cls, path: str = 'cfp.json') -> DeadlineIndex:
+		""" Load the tables next to the json output at path if they are up to date and pyarrow is installed, or the json
+
+		The tables are up to date if they are not older than the json, as `cfps` writes them after it: tables of a
+		previous run are ignored when the last run did not write any.
+		"""
+		tables = f'{os.path.splitext(path)[0]}-tables'
+		try:
+			json_mtime = os.stat(path).st_mtime_ns
+			up_to_date = all(os.stat(os.path.join(tables, f'{name}.arrow')).st_mtime_ns >= json_mtime
+							 for name in ('conferences', 'cfps'))
+		except FileNotFoundError:
+			up_to_date = False
+
+		if up_to_date:
+			try:
+				return cls.from_tables(tables)
+			except ImportError:
+				pass
+		return cls.from_json(path)
+
+
+	@classmethod
+	def from_tables(cls, directory: str) -> DeadlineIndex:
+		""" Read the conferences and cfps Arrow tables in directory, see `cfps_tables`
+
+		The typed date and flag columns are converted to arrays directly, without parsing the json, but they are
+		copied: the queries need datetime64 dates with NaT for missing values and their sort orders anyway.
+		"""
+		def read(name: str) -> pa.Table:
+			with pa.OSFile(os.path.join(directory, f'{name}.arrow')) as source:
+				return pa.ipc.open_file(source).read_all()
+
+		conf_table, cfp_table = read('conferences'), read('cfps')
+		conferences = conf_table.select(['acronym', 'title', 'rank', 'field']).to_pandas()
+		conferences.index = conf_table.column('conf_id').to_numpy()
+		conferences['rank'] = conferences['rank'].map(tuple)
+
+		cfps = cfp_table.select(['conf_id', 'year', 'round', 'link', 'cfp_url']).to_pandas()
+		dates = np.stack([cfp_table.column(field).to_numpy().astype('datetime64[D]') for field in DateStore.fields],
+						 axis=1)
+		orig = np.stack([np.where(cfp_table.column(f'orig_{field}').is_null().to_numpy(), -1,
+								  cfp_table.column(f'orig_{field}').fill_null(False).to_numpy()).astype(np.int8)
+						 for field in DateStore.fields], axis=1)
+		return cls(conferences, cfps, dates, orig)
+
+
+	@classmethod
+	def from_json(cls, path: str) -> DeadlineIndex:
+		""" Read the cfps json output, skipping the cfps without any data """
+		with open(path) as fh:
+			data = json.load(fh)
+
+		columns, ndates = data['columns'], len(DateStore.fields)
+		rank_col, ranksys_col, nconf_columns = columns.index('Rank'), columns.index('Rank system'), len(columns)
+		h5_systems = set(ConferenceRegistry.h5_columns.values())
+
+		conferences = pd.DataFrame([row[:nconf_columns] for row in data['data']], columns=columns)
+		conferences['Rank'] = [tuple(rank for rank, system in zip(row[rank_col], row[ranksys_col])
+									 if system not in h5_systems) for row in data['data']]
+		conferences = conferences[['Acronym', 'Title', 'Rank', 'Field']].set_axis(['acronym', 'title', 'rank', 'field'],
+																				  axis='columns')
+
+		cfp_info, cfp_values = [], []
+		for conf_id, row in enumerate(data['data']):
+			for year_round, cfp in _cfps_by_round(row, data['years']).items():
+				if any(value is not None for value in cfp):
+					year, round_ = map(int, year_round.split('/'))
+					cfp_info.append((conf_id, year, round_, cfp[-2], cfp[-1]))
+					cfp_values.append(cfp[:2 * ndates])
+
+		cfps = pd.DataFrame(cfp_info, columns=['conf_id', 'year', 'round', 'link', 'cfp_url'])
+		values = np.array(cfp_values, dtype=object).reshape(-1, 2 * ndates)
+		dates = pd.to_datetime(values[:, :ndates].ravel(), format='%Y%m%d').to_numpy('datetime64[D]')
+		orig = np.select([values[:, ndates:] == True, values[:, ndates:] == False], [1, 0], -1).astype(np.int8)
+		return cls(conferences, cfps, dates.reshape(-1, ndates), orig)
+
+
+	def _conference_mask(self, ranks: Iterable[str] = (), fields: Iterable[str] = ()) -> pd.Series[bool]:
+		""" Return whether each conference has one of the ranks and one of the fields, if given """
+		mask = pd.Series(True, index=self.conferences.index)
+		if ranks:
+			mask &= self.conferences['rank'].explode().isin(ranks).groupby(level=0).any()
+		if fields:
+			mask &= self.conferences['field'].isin(fields)
+		return mask
+
+
+	def _result(self, rows: np.ndarray, date_fields: Iterable[str], ranks: Iterable[str],
+				fields: Iterable[str]) -> pd.DataFrame:
+		""" Return the cfps of rows that match the conference filters, with their conference and dates """
+		conf_mask = self._conference_mask(ranks, fields)
+		rows = rows[conf_mask.reindex(self.cfps['conf_id'].to_numpy()[rows]).to_numpy()]
+
+		cfps = self.cfps.iloc[rows]
+		result = self.conferences.loc[cfps['conf_id']].reset_index(drop=True)
+		result['rank'] = result['rank'].map(lambda ranks: ','.join(rank for rank in ranks if rank))
+		result[['year', 'round']] = cfps[['year', 'round']].to_numpy()
+		for field in date_fields:
+			result[field] = self.dates[rows, DateStore.column[field]]
+			result[f'orig_{field}'] = np.array([False, True, None], dtype=object)[self.orig[rows, DateStore.column[field]]]
+		result[['link', 'cfp_url']] = cfps[['link', 'cfp_url']].to_numpy()
+		return result
+
+
+	def deadlines(self, field: str = 'submission', start: datetime.date | None = None,
+				  end: datetime.date | None = None, ranks: Iterable[str] = (), fields: Iterable[str] = ()) -> pd.DataFrame:
+		""" Return the cfps with a date of field between start and end (included), sorted by that date
+
+		Args:
+			field: the date field, in `DateStore.fields`
+			start, end: bounds of the dates, unbounded if None
+			ranks: only conferences with one of these ranks, if given
+			fields: only conferences in one of these research fields, if given
+		"""
+		col = DateStore.column[field]
+		sorted_dates = self.sorted_dates[:, col]
+		first = 0 if start is None else np.searchsorted(sorted_dates, np.datetime64(start, 'D'), side='left')
+		# Missing dates are sorted last
+		last = np.count_nonzero(~np.isnat(sorted_dates)) if end is None else \
+			np.searchsorted(sorted_dates, np.datetime64(end, 'D'), side='right')
+		return self._result(self.order[first:last, col], [field], ranks, fields)
+
+
+	def overlapping(self, start: datetime.date, end: datetime.date, ranks: Iterable[str] = (),
+					fields: Iterable[str] = ()) -> pd.DataFrame:
+		""" Return the cfps of conferences taking place (at least partly) between start and end, sorted by start date
+
+		Conferences without end date are considered to last a single day.
+		"""
+		col_start, col_end = DateStore.column['conf_start'], DateStore.column['conf_end']
+		last = np.searchsorted(self.sorted_dates[:, col_start], np.datetime64(end, 'D'), side='right')
+		rows = self.order[:last, col_start]
+
+		ends = self.dates[rows, col_end]
+		ends = np.where(np.isnat(ends), self.dates[rows, col_start], ends)
+		return self._result(rows[ends >= np.datetime64(start, 'D')], ['conf_start', 'conf_end'], ranks, fields)
 
 
 if __name__ == '__main__':